@@ -0,0 +1,90 @@
+"""
+Maintenance commands.
+
+    python -m app.cli rebuild-daily-stats [--user USER_ID]
+    python -m app.cli rebuild-term-counts [--user USER_ID]
+    python -m app.cli calibrate-passwords [--target-ms 250] [--env-file .env]
+"""
+import argparse
+import os
+from uuid import UUID
+
+from app.database import SessionLocal
+from app.repository.stats_repository import JournalStatsRepository
+from app.repository.term_repository import TermCountRepository
+from app.repository.user_repository import UserRepository
+
+
+def rebuild_daily_stats(args):
+    with SessionLocal() as db:
+        JournalStatsRepository.rebuild(db, args.user)
+        db.execute(UserRepository.data_version_update([args.user] if args.user else None))
+        db.commit()
+    print("Daily journal stats rebuilt" + (f" for user {args.user}" if args.user else ""))
+
+
+def rebuild_term_counts(args):
+    with SessionLocal() as db:
+        TermCountRepository.rebuild(db, args.user)
+        db.execute(UserRepository.data_version_update([args.user] if args.user else None))
+        db.commit()
+    print("Term counts rebuilt" + (f" for user {args.user}" if args.user else ""))
+
+
+def calibrate_passwords(args):
+    # Imported here so the other commands do not load bcrypt
+    from app.utils.passwords import calibrate_bcrypt_rounds
+
+    rounds, timings = calibrate_bcrypt_rounds(args.target_ms / 1000, args.min_rounds, args.max_rounds)
+    for tried, seconds in timings:
+        print(f"rounds {tried:>2}: {seconds * 1000:7.1f} ms")
+    print(f"PASSWORD_BCRYPT_ROUNDS={rounds}")
+    if args.env_file:
+        set_env_value(args.env_file, "PASSWORD_BCRYPT_ROUNDS", str(rounds))
+        print(f"Saved to {args.env_file}, restart the app to use it")
+
+
+def set_env_value(path: str, name: str, value: str):
+    """
+    Set NAME=value in a dotenv file, replacing an existing line or appending one.
+    """
+    lines = []
+    if os.path.exists(path):
+        with open(path) as env_file:
+            lines = env_file.read().splitlines()
+    entry = f"{name}={value}"
+    for index, line in enumerate(lines):
+        if line.split("=", 1)[0].strip() == name:
+            lines[index] = entry
+            break
+    else:
+        lines.append(entry)
+    with open(path, "w") as env_file:
+        env_file.write("\n".join(lines) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Journal app maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-daily-stats", help="Recompute journal_daily_stats from journals")
+    rebuild.add_argument("--user", type=UUID, help="Only rebuild this user's rows")
+    rebuild.set_defaults(handler=rebuild_daily_stats)
+
+    terms = commands.add_parser("rebuild-term-counts", help="Recompute user_term_counts from journal content")
+    terms.add_argument("--user", type=UUID, help="Only rebuild this user's terms")
+    terms.set_defaults(handler=rebuild_term_counts)
+
+    calibrate = commands.add_parser("calibrate-passwords", help="Pick the bcrypt cost for this host")
+    calibrate.add_argument("--target-ms", type=float, default=250, help="Latency budget for one hash")
+    calibrate.add_argument("--min-rounds", type=int, default=10)
+    calibrate.add_argument("--max-rounds", type=int, default=16)
+    calibrate.add_argument("--env-file", help="Write PASSWORD_BCRYPT_ROUNDS to this dotenv file")
+    calibrate.set_defaults(handler=calibrate_passwords)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
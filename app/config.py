@@ -0,0 +1,64 @@
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env
+load_dotenv()
+
+
+def env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Database connection pool, shared by the sync and async engines
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))  # Connections kept open
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))  # Extra connections allowed under burst
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # Seconds before a connection is replaced
+DB_POOL_PRE_PING = env_bool("DB_POOL_PRE_PING", True)  # Test connections before handing them out
+DB_POOL_USE_LIFO = env_bool("DB_POOL_USE_LIFO", True)  # Reuse hot connections so idle ones can time out
+
+# Sentiment scoring
+SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "comprehend")  # "comprehend" (AWS) or "lexicon" (local, CPU only)
+SENTIMENT_ASYNC = env_bool("SENTIMENT_ASYNC", True)  # Score in background batches instead of inline
+SENTIMENT_WORKERS = int(os.getenv("SENTIMENT_WORKERS", 2))
+SENTIMENT_BATCH_SIZE = int(os.getenv("SENTIMENT_BATCH_SIZE", 25))  # BatchDetectSentiment takes at most 25
+SENTIMENT_BATCH_WAIT = float(os.getenv("SENTIMENT_BATCH_WAIT", 0.05))  # Seconds to wait for a batch to fill
+SENTIMENT_QUEUE_SIZE = int(os.getenv("SENTIMENT_QUEUE_SIZE", 10000))  # Score inline once this many are waiting
+COMPREHEND_FAKE = env_bool("COMPREHEND_FAKE", False)  # Use the offline stand-in instead of AWS
+COMPREHEND_FAKE_LATENCY = float(os.getenv("COMPREHEND_FAKE_LATENCY", 0.1))  # Seconds per fake API call
+SENTIMENT_CACHE_SIZE = int(os.getenv("SENTIMENT_CACHE_SIZE", 10000))  # In-process LRU entries, 0 disables it
+SENTIMENT_CACHE_PERSIST = env_bool("SENTIMENT_CACHE_PERSIST", True)  # Also keep results in the sentiment_cache table
+
+# Bulk import
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))  # Rows per INSERT and transaction
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", 1000))  # Row errors listed in the report, the rest are only counted
+IMPORT_MAX_RECORD_LENGTH = int(os.getenv("IMPORT_MAX_RECORD_LENGTH", 1_000_000))  # Characters in one line or CSV record, longer ones fail and are skipped
+
+# Export
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 5000))  # Rows fetched and written per batch (and Parquet row group)
+
+# Query diagnostics (development and tests)
+QUERY_DEBUG = env_bool("QUERY_DEBUG", False)  # Log slow queries and repeated statements per request
+SLOW_QUERY_SECONDS = float(os.getenv("SLOW_QUERY_SECONDS", 0.1))  # Statements slower than this are logged with their parameters
+QUERY_REPEAT_THRESHOLD = int(os.getenv("QUERY_REPEAT_THRESHOLD", 5))  # Identical statements in one request flagged as a likely N+1
+QUERY_BUDGET = int(os.getenv("QUERY_BUDGET", 10))  # Requests running more statements are logged, 0 disables it
+
+# Response compression
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1000))  # Bytes, smaller responses are sent as is
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))  # 1 (fastest) to 9 (smallest)
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 4))  # 0 (fastest) to 11 (smallest), needs brotli installed
+
+# Authentication
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", 10000))  # Authenticated users kept in memory, 0 disables it
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", 60))  # Seconds before a cached user is re-read
+USER_COUNT_CACHE_TTL = float(os.getenv("USER_COUNT_CACHE_TTL", 60))  # Seconds an admin user-list total is reused
+AUTH_TRUST_ROLE_CLAIM = env_bool("AUTH_TRUST_ROLE_CLAIM", False)  # Authorize from the token alone on a cache miss
+INTERNAL_TOKEN = os.getenv("INTERNAL_TOKEN", "")  # Bearer token for /internal/* and /metrics besides an admin login, empty for admins only
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 12))  # bcrypt cost, pick with `python -m app.cli calibrate-passwords`
+PASSWORD_WORKERS = int(os.getenv("PASSWORD_WORKERS", 2))  # Processes hashing and verifying passwords
+PASSWORD_MAX_QUEUE = int(os.getenv("PASSWORD_MAX_QUEUE", 32))  # Waiting password operations before 503
+PASSWORD_RETRY_AFTER = int(os.getenv("PASSWORD_RETRY_AFTER", 1))  # Seconds, sent in Retry-After with the 503
+PASSWORD_NICE = int(os.getenv("PASSWORD_NICE", 10))  # Lower CPU priority of the password processes
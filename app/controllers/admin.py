@@ -1,37 +1,34 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app.models.model import User
-from app.views.auth import LoginRequest, Token
-from passlib.context import CryptContext
-from app.utils.auth import create_access_token
-from datetime import timedelta
+from app.views.auth import LoginRequest
 from app.views.auth import RegisterRequest
 from app.views.user_schema import UserResponse, UserAPIResponse, UserListResponse
 from app.services.admin_service import login_admin, register_admin, get_all_users_service
-from app.utils.auth import get_current_user
+from app.utils.auth import Principal, get_current_user, get_current_user_profile
+from app.utils.pagination import decode_cursor
+from typing import Optional
 
 router = APIRouter(prefix="/auth/admin", tags=["Admin"])
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 
 
 @router.post("/register", status_code=status.HTTP_201_CREATED)
-def register(request: RegisterRequest, db: Session = Depends(get_db)):
-    return register_admin(request, db)
+async def register(request: RegisterRequest, db: AsyncSession = Depends(get_db)):
+    return await register_admin(request, db)
 
 
 
 
 @router.post("/login", status_code=status.HTTP_200_OK)
-def login(request: LoginRequest, db: Session = Depends(get_db)):
-    return login_admin(request, db)
+async def login(request: LoginRequest, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
+    return await login_admin(request, db, background_tasks)
 
 
 @router.get("/profile", response_model=UserAPIResponse)
-async def get_profile(user: User = Depends(get_current_user)):
+async def get_profile(user: Principal = Depends(get_current_user_profile)):
     return UserAPIResponse(
         status="success",
         message="Profile retrieved successfully",
@@ -48,14 +45,15 @@ async def get_profile(user: User = Depends(get_current_user)):
     
 @router.get("/all-users", response_model=UserListResponse)  # ✅ Use the new response model
 async def get_all_users(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     limit: int = Query(10, ge=1, le=100, description="Number of users per page"),
-    current_user: dict = Depends(get_current_user),
-    db=Depends(get_db)
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    search: Optional[str] = Query(None, min_length=1, description="First name, last name or email prefix"),
+    exact: bool = Query(False, description="Count users now instead of using a cached or estimated total"),
+    current_user: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
-    
-    
-    print("current role", current_user.role.value)
+
     # Ensure the user is an admin
     # if current_user.role.value != "ADMIN":
     #     raise HTTPException(
@@ -64,7 +62,8 @@ async def get_all_users(
     #     )
 
     # Call the service layer to retrieve users
-    users_data = get_all_users_service(db, page, limit)
+    after = decode_cursor(cursor) if cursor else None
+    users_data = await get_all_users_service(db, page, limit, after, search, exact)
 
     return UserListResponse(
         status="success",
@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from app.utils.auth import principal_cache, require_internal_access
+from app.utils.metrics import REGISTRY, render_prometheus
+from app.utils.passwords import password_pool
+from app.utils.pool_metrics import pool_metrics
+from app.utils.sentiment import sentiment_cache
+
+# Admins or the INTERNAL_TOKEN only, the numbers say a lot about traffic and users
+router = APIRouter(
+    prefix="/internal", tags=["Internal"], include_in_schema=False,
+    dependencies=[Depends(require_internal_access)],
+)
+# Served at the root, where Prometheus scrapes by default (give it the INTERNAL_TOKEN)
+metrics_router = APIRouter(tags=["Internal"], include_in_schema=False, dependencies=[Depends(require_internal_access)])
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """
+    Request, database, sentiment backend and password metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(render_prometheus(REGISTRY.values()), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+
+@router.get("/pool")
+async def get_pool_metrics():
+    """
+    Live connection pool gauges and checkout wait-time histograms.
+    """
+    return {
+        "status": "success",
+        "message": "Pool metrics retrieved successfully",
+        "data": pool_metrics(),
+    }
+
+
+@router.get("/sentiment-cache")
+async def get_sentiment_cache_metrics():
+    """
+    Sentiment cache hit/miss counters and in-process size.
+    """
+    return {
+        "status": "success",
+        "message": "Sentiment cache metrics retrieved successfully",
+        "data": sentiment_cache.stats(),
+    }
+
+
+@router.get("/principal-cache")
+async def get_principal_cache_metrics():
+    """
+    Authenticated-user cache hit ratio and size.
+    """
+    return {
+        "status": "success",
+        "message": "Principal cache metrics retrieved successfully",
+        "data": principal_cache.stats(),
+    }
+
+
+@router.get("/password-pool")
+async def get_password_pool_metrics():
+    """
+    Password hashing pool occupancy and how many requests it turned away.
+    """
+    return {
+        "status": "success",
+        "message": "Password pool metrics retrieved successfully",
+        "data": password_pool.stats(),
+    }
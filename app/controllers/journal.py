@@ -1,23 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 from app.database import get_db
-from app.models.model import Journal, User
-from app.views.journal_schema import JournalCreate, JournalResponse, JournalListResponse,JournalAPIResponse, JournalUpdate
+from app.models.model import Journal
+from app.repository.journal_repository import JournalRepository
+from app.repository.search_repository import JournalSearchRepository
+from app.repository.stats_repository import JournalStatsRepository, SENTIMENT_COLUMNS
+from app.repository.term_repository import TermCountRepository
+from app.views.journal_schema import JournalCreate, JournalResponse, JournalListResponse,JournalAPIResponse, JournalUpdate, JournalSearchResponse, JournalSearchResult, JournalImportResponse, JournalCalendarResponse
 from app.views.user_schema import SummaryResponse
-from typing import List
-from app.utils.auth import get_current_user  # Import authentication
-from app.utils.journal import tokenize_and_clean 
-from collections import Counter
+from typing import List, Optional
+from app.utils.auth import Principal, get_current_user  # Import authentication
+from app.utils.etag import revalidate
+from app.utils.journal import highlight
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, PageParams, encode_cursor
 
 
 from uuid import UUID  # Import UUID
-from datetime import datetime
-from sqlalchemy.types import Date  # ✅ Import Date type
-from sqlalchemy.sql.expression import cast
-from sqlalchemy import desc  # Import `desc` for descending order
-from sqlalchemy.sql import func
+from datetime import date, datetime
 
-from app.utils.sentiment import get_sentiment
+from app.services.export_service import EXPORT_FORMATS, export_journals, format_available
+from app.services.import_service import IMPORT_FORMATS, import_journals
+from app.services.sentiment_service import sentiment_queue
 
 
 
@@ -25,44 +31,118 @@ from app.utils.sentiment import get_sentiment
 router = APIRouter(prefix="/api/journals", tags=["Journals"])
 
 
+# Journal columns in JournalResponse field order, so a row maps straight onto the response shape
+LIST_COLUMNS = [getattr(Journal, field) for field in JournalResponse.model_fields]
+# Longest content preview, in characters
+MAX_PREVIEW = 10000
+
+
+class FieldParams:
+    """
+    Query parameters choosing which fields of each entry a list returns.
+
+    Only the chosen columns are selected, plus date_of_entry and id for the
+    cursor, and a preview is cut in SQL, so full content is never read
+    unless it is asked for.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[str] = Query(None, description="Comma-separated fields to return, e.g. title,date_of_entry,sentiment (default all)"),
+        preview: Optional[int] = Query(None, ge=1, le=MAX_PREVIEW, description="Return only the first N characters of content"),
+    ):
+        names = {name.strip() for name in (fields or "").split(",") if name.strip()} or set(JournalResponse.model_fields)
+        unknown = sorted(names - set(JournalResponse.model_fields))
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown)}. Choose from {', '.join(JournalResponse.model_fields)}.",
+            )
+        # Response order, whatever the order asked for
+        self.fields = [field for field in JournalResponse.model_fields if field in names]
+        selected = names | {"date_of_entry", "id"}
+        self.columns = [
+            func.substr(Journal.content, 1, preview).label("content") if field == "content" and preview else column
+            for field, column in zip(JournalResponse.model_fields, LIST_COLUMNS)
+            if field in selected
+        ]
+        if len(self.columns) == len(self.fields):
+            self.fields = None  # Rows already have exactly the response fields
+
+
+async def get_journal_page(db: AsyncSession, criteria, page: PageParams, columns=LIST_COLUMNS):
+    """
+    Fetch one keyset page of journal rows (LIST_COLUMNS, or the given columns) plus the cursor and (optional) total count.
+    """
+    journals, has_more = await JournalRepository.list_page(db, criteria, page.limit, page.after, columns)
+    next_cursor = encode_cursor(journals[-1].date_of_entry, journals[-1].id) if has_more else None
+    total = await JournalRepository.count(db, criteria) if page.include_total else None
+    return journals, next_cursor, total
+
+
+def journal_list_response(message: str, journals, total, next_cursor, headers=None, fields=None) -> ORJSONResponse:
+    """
+    A JournalListResponse encoded straight from rows with orjson.
+
+    Produces the same bytes as validating a JournalResponse per row and
+    letting FastAPI encode the model, without either step, which is most of
+    the CPU time of a large page. Returning a Response skips response_model
+    validation; the model still documents the endpoint. With fields, each
+    entry holds only those.
+    """
+    if fields is None:
+        data = [journal._asdict() for journal in journals]
+    else:
+        data = [{field: getattr(journal, field) for field in fields} for journal in journals]
+    return ORJSONResponse({
+        "status": "success",
+        "message": message,
+        "data": data,
+        "total": total,
+        "next_cursor": next_cursor,
+    }, headers=headers)
 
-@router.get("/word-frequency", response_model=dict)
-def get_word_frequency(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    journals = (
-        db.query(Journal)
-        .filter(Journal.user_id == current_user.id)
-        .all()
-    )
-
-    all_content = " ".join(journal.content for journal in journals if journal.content)
-
-    if not all_content.strip():
-        return {"word_frequency": []}
-
-    words = tokenize_and_clean(all_content)
-    word_counts = Counter(words)
 
-    # Exclude common stop words
-    stop_words = {"the", "and", "is", "in", "to", "of", "a", "for", "on", "with"}
-    filtered_word_counts = {word: count for word, count in word_counts.items() if word not in stop_words}
 
-    # Get the top 50 most common words
-    top_words = sorted(filtered_word_counts.items(), key=lambda x: x[1], reverse=True)[:50]
+@router.get("/word-frequency", response_model=dict, dependencies=[Depends(revalidate)])
+async def get_word_frequency(
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    # Top 50 terms (stop words excluded) from the per-user term counts
+    top_words = await TermCountRepository.top_terms(db, current_user.id, limit=50)
 
     word_frequency = [{"text": word, "value": count} for word, count in top_words]
     return {"word_frequency": word_frequency}
 
+@router.get("/search", response_model=JournalSearchResponse)
+async def search_journals(
+    q: str = Query(..., min_length=1, max_length=200, description="Words to find in titles and content"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Number of results per page"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    # Ranked full-text matches from the search index, best first
+    rows, has_more = await JournalSearchRepository.search(db, current_user.id, q, limit, (page - 1) * limit)
+
+    results = [JournalSearchResult(**{**row._mapping, "snippet": highlight(row.snippet)}) for row in rows]
+    return JournalSearchResponse(
+        status="success",
+        message="Journal entries retrieved successfully" if results else "No journal entries found",
+        data=results,
+        page=page,
+        has_more=has_more,
+    )
+
 @router.post("/", response_model=JournalAPIResponse)
-def create_journal(
+async def create_journal(
     journal: JournalCreate, 
-    db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)  # 🔒 Protected
+    db: AsyncSession = Depends(get_db), 
+    current_user: Principal = Depends(get_current_user)  # 🔒 Protected
 ):
-    # Analyze sentiment using AWS Comprehend
-    sentiment = get_sentiment(journal.content)
+    # Sentiment is scored in the background when the pipeline is running
+    sentiment = await sentiment_queue.score_or_defer(journal.content)
 
     # Create new journal entry with sentiment
     new_journal = Journal(
@@ -71,9 +151,8 @@ def create_journal(
         sentiment=sentiment  # Add sentiment analysis result
     )
 
-    db.add(new_journal)
-    db.commit()
-    db.refresh(new_journal)
+    await JournalRepository.create_journal(db, new_journal)
+    sentiment_queue.submit(new_journal)
 
     return {
         "status": "success",
@@ -83,67 +162,93 @@ def create_journal(
 
 
 
-@router.get("/summaries", response_model=SummaryResponse)
-def get_summaries(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+@router.post("/import", response_model=JournalImportResponse)
+async def import_journal_entries(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)  # 🔒 Protected
 ):
-    # Fetch all journal entries for the current user
-    journals = (
-        db.query(Journal)
-        .filter(Journal.user_id == current_user.id)
-        .all()
+    # NDJSON (one JournalCreate object per line) or CSV with a header row, streamed in batches
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    format = IMPORT_FORMATS.get(content_type)
+    if format is None:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported Content-Type. Use one of {', '.join(IMPORT_FORMATS)}.",
+        )
+
+    report = await import_journals(db, current_user.id, request.stream(), format)
+
+    return JournalImportResponse(
+        status="success",
+        message=f"Imported {report['imported']} journal entries, {report['failed']} rows failed",
+        **report,
     )
 
-    # Compute category distribution
-    category_distribution = {}
-    valid_categories = ["Personal", "Work", "Travel", "Health", "Social"]
-    for cat in valid_categories:
-        category_distribution[cat] = 0
-    for journal in journals:
-        category = journal.journal_category or "Uncategorized"
-        if category in category_distribution:
-            category_distribution[category] += 1
 
-    # Compute monthly counts
-    monthly_counts = {}
-    for journal in journals:
-        month_key = journal.date_of_entry.strftime("%B %Y")
-        if month_key not in monthly_counts:
-            monthly_counts[month_key] = 0
-        monthly_counts[month_key] += 1
-    monthly_counts_list = [{"month": key, "count": value} for key, value in monthly_counts.items()]
 
-    # Compute daily trend
-    daily_trend = {}
-    for journal in journals:
-        day_key = journal.date_of_entry.strftime("%Y-%m-%d")
-        if day_key not in daily_trend:
-            daily_trend[day_key] = 0
-        daily_trend[day_key] += 1
-    daily_trend_list = [{"date": key, "count": value} for key, value in daily_trend.items()]
-    daily_trend_list.sort(key=lambda x: x["date"])
+@router.get("/export")
+async def export_journal_entries(
+    format: str = Query("csv", description="csv, parquet or arrow (Arrow IPC stream)"),
+    start: Optional[date] = Query(None, description="First day to include (YYYY-MM-DD)"),
+    end: Optional[date] = Query(None, description="Last day to include (YYYY-MM-DD)"),
+    current_user: Principal = Depends(get_current_user)  # 🔒 Protected
+):
+    # Streamed batch by batch, oldest entry first
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Invalid format. Choose from {', '.join(EXPORT_FORMATS)}.")
+    if not format_available(format):
+        raise HTTPException(status_code=501, detail=f"{format} export needs pyarrow installed on the server.")
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end.")
+
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        export_journals(current_user.id, format, start, end),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="journals.{extension}"'},
+    )
+
 
-    # Compute word count trend
-    word_count_trend = {}
-    for journal in journals:
-        day_key = journal.date_of_entry.strftime("%Y-%m-%d")
-        if day_key not in word_count_trend:
-            word_count_trend[day_key] = 0
-        word_count_trend[day_key] += len(journal.content.split())
-    word_count_trend_list = [{"date": key, "word_count": value} for key, value in word_count_trend.items()]
-    word_count_trend_list.sort(key=lambda x: x["date"])
 
-    # Compute entry length averages by category
+@router.get("/summaries", response_model=SummaryResponse, dependencies=[Depends(revalidate)])
+async def get_summaries(
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)
+):
+    # Entry and word totals per (day, category), read from the daily rollup
+    rows = await JournalStatsRepository.daily_category_totals(db, current_user.id)
+
+    category_distribution = {cat: 0 for cat in ["Personal", "Work", "Travel", "Health", "Social"]}
+    monthly_counts = {}
+    daily_trend = {}
+    word_count_trend = {}
     entry_length_totals = {}
     entry_length_counts = {}
-    for journal in journals:
-        category = journal.journal_category or "Uncategorized"
-        if category not in entry_length_totals:
-            entry_length_totals[category] = 0
-            entry_length_counts[category] = 0
-        entry_length_totals[category] += len(journal.content.split())
-        entry_length_counts[category] += 1
+
+    for day, category, entries, words in rows:
+        category = category or "Uncategorized"
+        day_key = day.strftime("%Y-%m-%d")
+        month_key = day.strftime("%B %Y")
+        words = words or 0
+
+        # Compute category distribution
+        if category in category_distribution:
+            category_distribution[category] += entries
+
+        # Compute monthly counts, daily trend and word count trend
+        monthly_counts[month_key] = monthly_counts.get(month_key, 0) + entries
+        daily_trend[day_key] = daily_trend.get(day_key, 0) + entries
+        word_count_trend[day_key] = word_count_trend.get(day_key, 0) + words
+
+        # Compute entry length totals by category
+        entry_length_totals[category] = entry_length_totals.get(category, 0) + words
+        entry_length_counts[category] = entry_length_counts.get(category, 0) + entries
+
+    # Rows arrive oldest day first, so these lists are already sorted
+    monthly_counts_list = [{"month": key, "count": value} for key, value in monthly_counts.items()]
+    daily_trend_list = [{"date": key, "count": value} for key, value in daily_trend.items()]
+    word_count_trend_list = [{"date": key, "word_count": value} for key, value in word_count_trend.items()]
 
     entry_length_averages = {
         category: entry_length_totals[category] / entry_length_counts[category]
@@ -158,27 +263,56 @@ def get_summaries(
         entry_length_averages=entry_length_averages  # Include entry length averages
     )
 
+@router.get("/calendar", response_model=JournalCalendarResponse, dependencies=[Depends(revalidate)])
+async def get_journal_calendar(
+    year: int = Query(..., description="The year to draw"),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)  # 🔒 Protected
+):
+    # Entries and dominant sentiment per day of the year, one grouped query over the daily rollup
+    if year < 1900 or year > datetime.now().year:
+        raise HTTPException(status_code=400, detail="Invalid year. Please provide a valid year.")
+
+    rows = await JournalStatsRepository.daily_totals(db, current_user.id, date(year, 1, 1), date(year + 1, 1, 1))
+
+    counts = [0] * 366
+    sentiments = [None] * 366
+    labels = list(SENTIMENT_COLUMNS)
+    for day, entries, *sentiment_counts in rows:
+        slot = day.timetuple().tm_yday - 1
+        counts[slot] = entries
+        most = max(sentiment_counts)
+        if most:
+            sentiments[slot] = labels[sentiment_counts.index(most)]  # Ties go to the first label
+
+    return JournalCalendarResponse(
+        status="success",
+        message="Journal calendar retrieved successfully" if rows else "No journal entries found for the specified year",
+        year=year,
+        counts=counts,
+        sentiments=sentiments,
+    )
+
 @router.get("/", response_model=JournalListResponse)  # ✅ Use the new response model
-def get_journals(
-    db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)
+async def get_journals(
+    page: PageParams = Depends(),
+    view: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db), 
+    current_user: Principal = Depends(get_current_user),
+    cache_headers: dict = Depends(revalidate),
 ):
-    journals = db.query(Journal).filter(Journal.user_id == current_user.id).all()
+    criteria = JournalRepository.for_user(current_user.id)
+    journals, next_cursor, total = await get_journal_page(db, criteria, page, view.columns)
     
-    return {
-        "status": "success",
-        "message": "Journals retrieved successfully",
-        "data": [JournalResponse.model_validate(j) for j in journals],  # ✅ Convert to Pydantic model
-        "total": len(journals)
-    }
+    return journal_list_response("Journals retrieved successfully", journals, total, next_cursor, cache_headers, view.fields)
 
 @router.get("/{journal_id}", response_model=JournalAPIResponse)
-def get_journal(
+async def get_journal(
     journal_id: UUID, 
-    db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)  # 🔒 Protected
+    db: AsyncSession = Depends(get_db), 
+    current_user: Principal = Depends(get_current_user)  # 🔒 Protected
 ):
-    journal = db.query(Journal).filter(Journal.id == journal_id, Journal.user_id == current_user.id).first()
+    journal = await JournalRepository.get_for_user(db, journal_id, current_user.id)
     
     if not journal:
         raise HTTPException(status_code=404, detail="Journal not found")
@@ -194,33 +328,27 @@ def get_journal(
 
 
 @router.get("/by-date/{date}", response_model=JournalListResponse)
-def get_journal_by_date(
+async def get_journal_by_date(
     date: str,  # Expecting YYYY-MM-DD format
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)  # 🔒 
+    page: PageParams = Depends(),
+    view: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),  # 🔒 
+    cache_headers: dict = Depends(revalidate),
 ):
     try:
         target_date = datetime.strptime(date, "%Y-%m-%d").date()
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD.")
     
-    # Query all journal entries for the given date and user
-    journals = (
-        db.query(Journal)
-        .filter(Journal.user_id == current_user.id)
-        .filter(func.date(Journal.date_of_entry) == target_date)  # ✅ More efficient filtering
-        .order_by(desc(Journal.date_of_entry))  # Sort by `date_of_entry` in descending order (latest first)
-        .all()
-    )
+    # Query one page of journal entries for the given date and user
+    criteria = JournalRepository.on_date(current_user.id, target_date)
+    journals, next_cursor, total = await get_journal_page(db, criteria, page, view.columns)
 
     # Return an empty list instead of 404 if no entries exist
-    journal_responses = [JournalResponse.model_validate(journal) for journal in journals]
-    
-    return JournalListResponse(
-        status="success",
-        message="Journal entries retrieved successfully" if journals else "No journal entries found",
-        data=journal_responses,
-        total=len(journal_responses)
+    return journal_list_response(
+        "Journal entries retrieved successfully" if journals else "No journal entries found",
+        journals, total, next_cursor, cache_headers, view.fields,
     )
     
     
@@ -231,74 +359,74 @@ def get_journal_by_date(
 # router = APIRouter()
 
 @router.get("/journals", response_model=JournalListResponse)
-def get_journals_by_year(
+async def get_journals_by_year(
     year: int = Query(..., description="The year to filter journal entries"),  # Required query parameter
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)  # 🔒 Ensure user authentication
+    page: PageParams = Depends(),
+    view: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),  # 🔒 Ensure user authentication
+    cache_headers: dict = Depends(revalidate),
 ):
     # Validate that the year is within a reasonable range (optional but recommended)
     if year < 1900 or year > datetime.now().year:
         raise HTTPException(status_code=400, detail="Invalid year. Please provide a valid year.")
 
-    # Query all journal entries for the user and specified year
-    journals = (
-        db.query(Journal)
-        .filter(Journal.user_id == current_user.id)  # Filter by authenticated user
-        .filter(func.extract('year', Journal.date_of_entry) == year)  # Filter by year
-        .order_by(desc(Journal.date_of_entry))  # Sort by `date_of_entry` in descending order
-        .all()
-    )
+    # Query one page of journal entries for the user and specified year
+    criteria = JournalRepository.in_year(current_user.id, year)
+    journals, next_cursor, total = await get_journal_page(db, criteria, page, view.columns)
 
-    # Convert the query results into response objects
-    journal_responses = [JournalResponse.model_validate(journal) for journal in journals]
-
-    return JournalListResponse(
-        status="success",
-        message="Journal entries retrieved successfully" if journals else "No journal entries found for the specified year",
-        data=journal_responses,
-        total=len(journal_responses)
+    return journal_list_response(
+        "Journal entries retrieved successfully" if journals else "No journal entries found for the specified year",
+        journals, total, next_cursor, cache_headers, view.fields,
     )
     
     
 
 
 @router.put("/{journal_id}", response_model=JournalResponse)
-def update_journal(
+async def update_journal(
     journal_id: UUID, 
     journal_data: JournalUpdate, 
-    db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)  # 🔒 Protected
+    db: AsyncSession = Depends(get_db), 
+    current_user: Principal = Depends(get_current_user)  # 🔒 Protected
 ):
-    journal = db.query(Journal).filter(Journal.id == journal_id, Journal.user_id == current_user.id).first()
+    journal = await JournalRepository.get_for_user(db, journal_id, current_user.id, for_update=True)
     
     if not journal:
         raise HTTPException(status_code=404, detail="Journal not found")
 
+    before = JournalRepository.snapshot(journal)
+
     # Update only the fields that have changed
     for key, value in journal_data.dict(exclude_unset=True).items():
         setattr(journal, key, value)
 
     # Recalculate sentiment if the content has changed
-    if journal_data.content:
-        journal.sentiment = get_sentiment(journal_data.content)
-
-    db.commit()
-    db.refresh(journal)
+    rescored = bool(journal_data.content) and journal_data.content != before["content"]
+    if rescored:
+        journal.sentiment = await sentiment_queue.score_or_defer(journal_data.content)
+        # Written even when it was already PENDING, a result for the old content
+        # may have been committed since the journal was loaded
+        flag_modified(journal, "sentiment")
+
+    await JournalRepository.save_journal(db, journal, before)
+    if rescored:
+        # Only a sentiment deferred by this write, an older PENDING one is already queued
+        sentiment_queue.submit(journal)
     
     return journal
 
 @router.delete("/{journal_id}")
-def delete_journal(
+async def delete_journal(
     journal_id: UUID, 
-    db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)  # 🔒 Protected
+    db: AsyncSession = Depends(get_db), 
+    current_user: Principal = Depends(get_current_user)  # 🔒 Protected
 ):
-    journal = db.query(Journal).filter(Journal.id == journal_id, Journal.user_id == current_user.id).first()
+    journal = await JournalRepository.get_for_user(db, journal_id, current_user.id, for_update=True)
     if not journal:
         raise HTTPException(status_code=404, detail="Journal not found")
 
-    db.delete(journal)
-    db.commit()
+    await JournalRepository.delete_journal(db, journal)
     return {"message": "Journal deleted successfully"}
 
 
@@ -306,33 +434,27 @@ def delete_journal(
 
 
 @router.get("/by-category/{category}", response_model=JournalListResponse)
-def get_journal_by_category(
+async def get_journal_by_category(
     category: str,  # Expecting a valid category name (e.g., "Personal", "Work")
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)  # 🔒 Ensure the user is authenticated
+    page: PageParams = Depends(),
+    view: FieldParams = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),  # 🔒 Ensure the user is authenticated
+    cache_headers: dict = Depends(revalidate),
 ):
     # Validate the category (optional: you can define a list of valid categories)
     valid_categories = ["Personal", "Work", "Travel", "Health", "Social"]
     if category not in valid_categories:
         raise HTTPException(status_code=400, detail=f"Invalid category. Choose from {', '.join(valid_categories)}.")
 
-    # Query all journal entries for the given category and user
-    journals = (
-        db.query(Journal)
-        .filter(Journal.user_id == current_user.id)
-        .filter(Journal.journal_category == category)  # Filter by category
-        .order_by(Journal.date_of_entry.desc())  # Sort by `date_of_entry` in descending order (latest first)
-        .all()
-    )
+    # Query one page of journal entries for the given category and user
+    criteria = JournalRepository.in_category(current_user.id, category)
+    journals, next_cursor, total = await get_journal_page(db, criteria, page, view.columns)
 
     # Return an empty list instead of 404 if no entries exist
-    journal_responses = [JournalResponse.model_validate(journal) for journal in journals]
-
-    return JournalListResponse(
-        status="success",
-        message="Journal entries retrieved successfully" if journals else "No journal entries found",
-        data=journal_responses,
-        total=len(journal_responses)
+    return journal_list_response(
+        "Journal entries retrieved successfully" if journals else "No journal entries found",
+        journals, total, next_cursor, cache_headers, view.fields,
     )
     
     
@@ -1,12 +1,34 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 # from controllers.journal_controller import router as user_router
 from app.routes import journal
 from fastapi.middleware.cors import CORSMiddleware
 
+from app import config
 from app.routes import auth
 from app.routes import admin
+from app.routes import internal
+from app.database import async_engine
+from app.services.sentiment_service import sentiment_queue
+from app.utils.compression import CompressionMiddleware
+from app.utils.passwords import password_pool
+from app.utils.request_metrics import MetricsMiddleware
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background sentiment workers live as long as the server
+    try:
+        await sentiment_queue.start()
+        yield
+    finally:
+        await sentiment_queue.stop()
+        # Pooled connections belong to this event loop, don't hand them to the next one
+        await async_engine.dispose()
+        password_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 
 # oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -23,12 +45,24 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Compress large responses (brotli or gzip, whichever the client prefers)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=config.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=config.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=config.COMPRESSION_BROTLI_QUALITY,
+)
+
+# Latency and database work per route, served on /metrics (outermost, so it times everything)
+app.add_middleware(MetricsMiddleware)
+
 # Include controllers
 # app.include_router(user_router)
 
 app.include_router(auth.router)
 app.include_router(journal.router)
 app.include_router(admin.router)
+app.include_router(internal.router)
 
 
 
@@ -7,13 +7,14 @@
 
 
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Text, Enum, func
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text, Enum, Index, DDL, event, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, declarative_base
 import uuid
 from sqlalchemy.orm import validates
 from datetime import datetime
 import enum
+from app.utils.journal import count_words
 
 
 
@@ -38,15 +39,63 @@ class Journal(Base):
     journal_category = Column(String, nullable=False)
     date_of_entry = Column(DateTime, default=func.now())
     sentiment = Column(String, index=True)
+    word_count = Column(Integer, nullable=False, default=0, server_default="0")  # Kept in sync with content
     created_at = Column(DateTime, default=func.now())
     user = relationship("User", back_populates="journals")
 
+    __table_args__ = (
+        # Serves every per-user listing, newest first, including keyset pages on (date_of_entry, id)
+        Index("ix_journals_user_id_date_of_entry", "user_id", date_of_entry.desc(), id.desc()),
+        Index(
+            "ix_journals_user_id_category_date_of_entry",
+            "user_id", "journal_category", date_of_entry.desc(), id.desc(),
+        ),
+    )
+
     @validates("date_of_entry")
     def validate_date(self, key, date):
         if date > datetime.now():
             raise ValueError("date_of_entry cannot be in the future.")
         return date
 
+    @validates("content")
+    def validate_content(self, key, content):
+        self.word_count = count_words(content)
+        return content
+
+
+# Full-text search over title and content, maintained by the database itself
+# and read by JournalSearchRepository (so neither is mapped on Journal).
+# PostgreSQL: a generated tsvector column (title weighted above content) with a GIN index.
+# SQLite: an FTS5 table over the journals rows, kept in sync by triggers. It is
+# keyed on journals' implicit rowid, which VACUUM may renumber, so run
+# INSERT INTO journals_fts(journals_fts) VALUES ('rebuild') after one.
+JOURNAL_SEARCH_DDL = {
+    "postgresql": [
+        "ALTER TABLE journals ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED",
+        "CREATE INDEX ix_journals_search_vector ON journals USING gin (search_vector)",
+    ],
+    "sqlite": [
+        "CREATE VIRTUAL TABLE journals_fts USING fts5("
+        "title, content, content='journals', content_rowid='rowid', tokenize='porter unicode61')",
+        "CREATE TRIGGER journals_fts_insert AFTER INSERT ON journals BEGIN "
+        "INSERT INTO journals_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content); END",
+        "CREATE TRIGGER journals_fts_delete AFTER DELETE ON journals BEGIN "
+        "INSERT INTO journals_fts(journals_fts, rowid, title, content) "
+        "VALUES ('delete', old.rowid, old.title, old.content); END",
+        "CREATE TRIGGER journals_fts_update AFTER UPDATE OF title, content ON journals BEGIN "
+        "INSERT INTO journals_fts(journals_fts, rowid, title, content) "
+        "VALUES ('delete', old.rowid, old.title, old.content); "
+        "INSERT INTO journals_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content); END",
+    ],
+}
+for dialect, statements in JOURNAL_SEARCH_DDL.items():
+    for statement in statements:
+        event.listen(Journal.__table__, "after_create", DDL(statement).execute_if(dialect=dialect))
+event.listen(Journal.__table__, "after_drop", DDL("DROP TABLE IF EXISTS journals_fts").execute_if(dialect="sqlite"))
+
 
 # Define role types
 class UserRole(str, enum.Enum):
@@ -63,7 +112,56 @@ class User(Base):
     password = Column(String)
     created_at = Column(DateTime, default=func.now())
     role = Column(Enum(UserRole, name="userrole"), nullable=False, default=UserRole.USER)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")  # Bumped on every change to the user's journals
     journals = relationship("Journal", back_populates="user", cascade="all, delete-orphan")
 
-
-
+    __table_args__ = (
+        # Keyset pagination of the admin user list
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
+
+
+
+
+
+class JournalDailyStats(Base):
+    """
+    Per-user rollup of journals by day and category, maintained on every write.
+    """
+    __tablename__ = "journal_daily_stats"
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    category = Column(String, primary_key=True)
+    entry_count = Column(Integer, nullable=False, default=0, server_default="0")
+    word_count = Column(Integer, nullable=False, default=0, server_default="0")
+    positive_count = Column(Integer, nullable=False, default=0, server_default="0")
+    negative_count = Column(Integer, nullable=False, default=0, server_default="0")
+    neutral_count = Column(Integer, nullable=False, default=0, server_default="0")
+    mixed_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+
+class UserTermCount(Base):
+    """
+    How often each term appears across a user's journals, maintained on every write.
+    """
+    __tablename__ = "user_term_counts"
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    term = Column(String, primary_key=True)
+    frequency = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # Top-k read for /word-frequency
+        Index("ix_user_term_counts_user_id_frequency", "user_id", frequency.desc()),
+    )
+
+
+class SentimentCacheEntry(Base):
+    """
+    A backend's sentiment for a piece of content, keyed by the backend's name
+    and version ("comprehend:1", "lexicon:1") and a hash of the normalized text.
+    """
+    __tablename__ = "sentiment_cache"
+    backend = Column(String(32), primary_key=True)
+    content_hash = Column(String(64), primary_key=True)
+    sentiment = Column(String, nullable=False)
+    created_at = Column(DateTime, default=func.now(), nullable=False)
@@ -0,0 +1,220 @@
+from collections import Counter, defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+from sqlalchemy import desc, insert, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import func
+from app.models.model import Journal
+from app.repository.stats_repository import JournalStatsRepository, SENTIMENT_COLUMNS
+from app.repository.term_repository import TermCountRepository
+from app.repository.user_repository import UserRepository
+from app.utils.journal import count_terms
+
+# Stored on a journal whose sentiment is still being scored in the background
+PENDING_SENTIMENT = "PENDING"
+
+class JournalRepository:
+    @staticmethod
+    async def get_for_user(db: AsyncSession, journal_id, user_id, for_update: bool = False):
+        query = select(Journal).filter(Journal.id == journal_id, Journal.user_id == user_id)
+        if for_update:
+            # Holds off apply_sentiments until the change commits
+            query = query.with_for_update()
+        result = await db.execute(query)
+        return result.scalars().first()
+
+    @staticmethod
+    def for_user(user_id):
+        return [Journal.user_id == user_id]
+
+    @staticmethod
+    def between(user_id, start: datetime, end: datetime):
+        # Half-open range on the bare column so the (user_id, date_of_entry) index applies
+        return [Journal.user_id == user_id, Journal.date_of_entry >= start, Journal.date_of_entry < end]
+
+    @staticmethod
+    def on_date(user_id, target_date: date):
+        start = datetime.combine(target_date, time.min)
+        return JournalRepository.between(user_id, start, start + timedelta(days=1))
+
+    @staticmethod
+    def in_year(user_id, year: int):
+        return JournalRepository.between(user_id, datetime(year, 1, 1), datetime(year + 1, 1, 1))
+
+    @staticmethod
+    def in_range(user_id, start: Optional[date] = None, end: Optional[date] = None):
+        # Entries from start through end (both optional and inclusive)
+        criteria = JournalRepository.for_user(user_id)
+        if start is not None:
+            criteria.append(Journal.date_of_entry >= datetime.combine(start, time.min))
+        if end is not None:
+            criteria.append(Journal.date_of_entry < datetime.combine(end + timedelta(days=1), time.min))
+        return criteria
+
+    @staticmethod
+    def in_category(user_id, category: str):
+        return [Journal.user_id == user_id, Journal.journal_category == category]
+
+    @staticmethod
+    async def list_page(db: AsyncSession, criteria, limit: int, after=None, columns=None):
+        """
+        Fetch one page of journals matching criteria, latest first.
+
+        Pages are keyed on (date_of_entry, id) rather than OFFSET, so a deep
+        page costs the same as the first one. Returns the page and whether
+        more rows follow it. With columns, the page holds plain rows of those
+        columns instead of Journal objects.
+        """
+        result = await db.execute(JournalRepository.page_query(criteria, limit + 1, after, columns))
+        journals = result.all() if columns else result.scalars().all()
+        return journals[:limit], len(journals) > limit
+
+    @staticmethod
+    def page_query(criteria, limit: int, after=None, columns=None):
+        query = (select(*columns) if columns else select(Journal)).filter(*criteria)
+        if after is not None:
+            query = query.filter(tuple_(Journal.date_of_entry, Journal.id) < after)
+        return query.order_by(desc(Journal.date_of_entry), desc(Journal.id)).limit(limit)
+
+    # What an export writes, never the user id
+    EXPORT_COLUMNS = (
+        Journal.id, Journal.title, Journal.content, Journal.journal_category,
+        Journal.date_of_entry, Journal.sentiment, Journal.word_count, Journal.created_at,
+    )
+
+    @staticmethod
+    def export_query(criteria):
+        # Oldest first, the (user_id, date_of_entry, id) index read backwards
+        return select(*JournalRepository.EXPORT_COLUMNS).filter(*criteria).order_by(Journal.date_of_entry, Journal.id)
+
+    @staticmethod
+    async def count(db: AsyncSession, criteria) -> int:
+        result = await db.execute(select(func.count()).select_from(Journal).filter(*criteria))
+        return result.scalar_one()
+
+    @staticmethod
+    def snapshot(journal: Journal) -> dict:
+        """
+        What the derived tables need to know about a journal before it changes.
+        """
+        return {"stats": JournalStatsRepository.snapshot(journal), "content": journal.content}
+
+    @staticmethod
+    async def create_journal(db: AsyncSession, journal: Journal):
+        db.add(journal)
+        await JournalStatsRepository.apply(db, JournalStatsRepository.snapshot(journal), 1)
+        await TermCountRepository.apply(db, journal.user_id, TermCountRepository.deltas(None, journal.content))
+        await UserRepository.bump_data_version(db, journal.user_id)
+        await db.commit()
+        await db.refresh(journal)
+        return journal
+
+    @staticmethod
+    async def save_journal(db: AsyncSession, journal: Journal, before: dict):
+        """
+        Commit changes to a journal, moving its rollup and term counts from
+        the `before` snapshot (taken prior to the changes) to its new values.
+        """
+        await JournalStatsRepository.replace(db, before["stats"], JournalStatsRepository.snapshot(journal))
+        await TermCountRepository.apply(
+            db, journal.user_id, TermCountRepository.deltas(before["content"], journal.content)
+        )
+        await UserRepository.bump_data_version(db, journal.user_id)
+        await db.commit()
+        await db.refresh(journal)
+        return journal
+
+    @staticmethod
+    async def delete_journal(db: AsyncSession, journal: Journal):
+        await JournalStatsRepository.apply(db, JournalStatsRepository.snapshot(journal), -1)
+        await TermCountRepository.apply(db, journal.user_id, TermCountRepository.deltas(journal.content, None))
+        await UserRepository.bump_data_version(db, journal.user_id)
+        await db.delete(journal)
+        await db.commit()
+
+    @staticmethod
+    async def import_batch(db: AsyncSession, user_id, rows: list):
+        """
+        Insert a batch of a user's new journals (column dicts) in one
+        executemany, add them to the rollup and term counts, and commit.
+
+        Core inserts skip the model's validators, so every row must already
+        carry its word_count and a date_of_entry that is not in the future.
+        """
+        if not rows:
+            return
+        await db.execute(insert(Journal), rows)
+        rollup = defaultdict(Counter)
+        terms = Counter()
+        for row in rows:
+            deltas = rollup[user_id, row["date_of_entry"].date(), row["journal_category"]]
+            deltas["entry_count"] += 1
+            deltas["word_count"] += row["word_count"]
+            column = SENTIMENT_COLUMNS.get(row["sentiment"])
+            if column:
+                deltas[column] += 1
+            terms.update(count_terms(row["content"]))
+        await JournalStatsRepository.add_many(db, rollup)
+        await TermCountRepository.apply(db, user_id, terms)
+        await UserRepository.bump_data_version(db, user_id)
+        await db.commit()
+
+    @staticmethod
+    async def pending_sentiment(db: AsyncSession, limit: int, user_id=None, after=None):
+        """
+        Up to limit (id, content) pairs still waiting for a sentiment, by id,
+        optionally only a user's and only those after a given id.
+        """
+        query = select(Journal.id, Journal.content).filter(Journal.sentiment == PENDING_SENTIMENT)
+        if user_id is not None:
+            query = query.filter(Journal.user_id == user_id)
+        if after is not None:
+            query = query.filter(Journal.id > after)
+        result = await db.execute(query.order_by(Journal.id).limit(limit))
+        return result.all()
+
+    @staticmethod
+    async def apply_sentiments(db: AsyncSession, results: dict):
+        """
+        Write back a batch of background sentiment results in one transaction.
+
+        `results` maps journal id to (scored content, sentiment). Each journal
+        gets one conditional UPDATE, so one deleted, already scored, or edited
+        since it was queued (its newer content has its own entry on the way)
+        is left alone even if that happened a moment ago. Only the rows the
+        updates changed move the rollup. A None sentiment (the backend could
+        not score the text) is skipped, so the journal stays PENDING and is
+        tried again on the next start.
+        """
+        if not results:
+            return
+        # Only the sentiment counts move, so net them per rollup row
+        rollup = defaultdict(Counter)
+        changed_users = set()
+        for journal_id, (content, sentiment) in results.items():
+            if sentiment is None:
+                continue
+            changed = (
+                await db.execute(
+                    update(Journal)
+                    .where(
+                        Journal.id == journal_id,
+                        Journal.sentiment == PENDING_SENTIMENT,
+                        Journal.content == content,
+                    )
+                    .values(sentiment=sentiment)
+                    .returning(Journal.user_id, Journal.date_of_entry, Journal.journal_category)
+                    .execution_options(synchronize_session=False)
+                )
+            ).first()
+            if changed is None:
+                continue
+            user_id, date_of_entry, category = changed
+            changed_users.add(user_id)
+            column = SENTIMENT_COLUMNS.get(sentiment)
+            if column:
+                rollup[user_id, date_of_entry.date(), category][column] += 1
+        await JournalStatsRepository.add_many(db, rollup)
+        await UserRepository.bump_data_version(db, *changed_users)
+        await db.commit()
@@ -0,0 +1,91 @@
+import re
+from sqlalchemy import column, desc, false, literal_column, table
+from sqlalchemy.dialects.postgresql import ts_headline, websearch_to_tsquery
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.sql import func
+from app.models.model import Journal
+from app.utils.journal import HIGHLIGHT_END, HIGHLIGHT_START
+
+# Columns of a search hit besides its rank and snippet
+RESULT_COLUMNS = (Journal.id, Journal.title, Journal.journal_category, Journal.date_of_entry, Journal.sentiment)
+
+# Words shown around the matches in a snippet
+SNIPPET_WORDS = 24
+# How much more a match in the title counts than one in the content (SQLite)
+TITLE_WEIGHT = 4.0
+
+# Maintained by the database, see JOURNAL_SEARCH_DDL
+SEARCH_VECTOR = literal_column("journals.search_vector")
+journals_fts = table("journals_fts", column("rowid"))
+FTS_TABLE = literal_column("journals_fts")
+JOURNAL_ROWID = literal_column("journals.rowid")
+
+SEARCH_TERM = re.compile(r"\w+")
+
+
+def fts5_query(text: str) -> str:
+    # Every word of the text must match, anything FTS5 would parse as syntax is dropped
+    return " ".join(f'"{term}"' for term in SEARCH_TERM.findall(text))
+
+
+class JournalSearchRepository:
+    @staticmethod
+    async def search(db: AsyncSession, user_id, text: str, limit: int, offset: int = 0):
+        """
+        One page of a user's journals matching text, best match first, each
+        with its rank and a snippet of the matches.
+
+        Results are ranked, so pages are taken by offset. Returns the rows and
+        whether more follow.
+        """
+        search = SEARCHES[db.get_bind().dialect.name]
+        rows = (await db.execute(search(user_id, text, limit + 1, offset))).all()
+        return rows[:limit], len(rows) > limit
+
+    @staticmethod
+    def postgresql_query(user_id, text: str, limit: int, offset: int):
+        query = websearch_to_tsquery("english", text)
+        rank = func.ts_rank_cd(SEARCH_VECTOR, query)
+        # Rank and cut the page on the GIN index first, so snippets are only built for the page
+        page = (
+            select(Journal.id, rank.label("rank"))
+            .filter(Journal.user_id == user_id, SEARCH_VECTOR.op("@@")(query))
+            .order_by(desc("rank"), Journal.id)
+            .offset(offset)
+            .limit(limit)
+            .subquery()
+        )
+        snippet = ts_headline(
+            "english",
+            Journal.content,
+            query,
+            f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_END}, "
+            f"MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}",
+        )
+        return (
+            select(*RESULT_COLUMNS, page.c.rank, snippet.label("snippet"))
+            .join(page, page.c.id == Journal.id)
+            .order_by(desc(page.c.rank), Journal.id)
+        )
+
+    @staticmethod
+    def sqlite_query(user_id, text: str, limit: int, offset: int):
+        # bm25 is lower for better matches, negated so rank reads like PostgreSQL's
+        rank = -func.bm25(FTS_TABLE, TITLE_WEIGHT, 1.0)
+        snippet = func.snippet(FTS_TABLE, -1, HIGHLIGHT_START, HIGHLIGHT_END, "…", SNIPPET_WORDS)
+        match = fts5_query(text)
+        return (
+            select(*RESULT_COLUMNS, rank.label("rank"), snippet.label("snippet"))
+            .select_from(journals_fts.join(Journal, JOURNAL_ROWID == journals_fts.c.rowid))
+            .filter(FTS_TABLE.op("MATCH")(match) if match else false(), Journal.user_id == user_id)
+            .order_by(desc("rank"), Journal.id)
+            .offset(offset)
+            .limit(limit)
+        )
+
+
+SEARCHES = {
+    "postgresql": JournalSearchRepository.postgresql_query,
+    "sqlite": JournalSearchRepository.sqlite_query,
+}
@@ -0,0 +1,36 @@
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+from app.models.model import SentimentCacheEntry
+from app.repository.stats_repository import UPSERTS
+
+
+class SentimentCacheRepository:
+    # Sync sessions: the cache is consulted from the threadpool alongside the Comprehend call
+
+    @staticmethod
+    def get_many(db: Session, backend: str, content_hashes) -> dict:
+        if not content_hashes:
+            return {}
+        result = db.execute(
+            select(SentimentCacheEntry.content_hash, SentimentCacheEntry.sentiment)
+            .filter(
+                SentimentCacheEntry.backend == backend,
+                SentimentCacheEntry.content_hash.in_(list(content_hashes)),
+            )
+        )
+        return dict(result.all())
+
+    @staticmethod
+    def save_many(db: Session, backend: str, sentiments: dict):
+        """
+        Store a backend's content hash -> sentiment pairs, keeping any existing entry.
+        """
+        if not sentiments:
+            return
+        upsert = UPSERTS[db.get_bind().dialect.name]
+        statement = upsert(SentimentCacheEntry).values([
+            {"backend": backend, "content_hash": content_hash, "sentiment": sentiment}
+            for content_hash, sentiment in sentiments.items()
+        ])
+        db.execute(statement.on_conflict_do_nothing(index_elements=["backend", "content_hash"]))
+        db.commit()
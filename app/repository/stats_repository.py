@@ -0,0 +1,171 @@
+from datetime import datetime
+from sqlalchemy import case, delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+from app.models.model import Journal, JournalDailyStats
+
+# Rollup column counting each sentiment label, anything else (e.g. not scored yet) is not counted
+SENTIMENT_COLUMNS = {
+    "POSITIVE": "positive_count",
+    "NEGATIVE": "negative_count",
+    "NEUTRAL": "neutral_count",
+    "MIXED": "mixed_count",
+}
+
+UPSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+# Every count a delta can move
+COUNT_COLUMNS = ("entry_count", "word_count", *SENTIMENT_COLUMNS.values())
+
+
+class JournalStatsRepository:
+    @staticmethod
+    def snapshot(journal: Journal) -> dict:
+        """
+        The part of a journal the rollup depends on, taken before it changes.
+        """
+        date_of_entry = journal.date_of_entry or datetime.now()
+        return {
+            "user_id": journal.user_id,
+            "day": date_of_entry.date(),
+            "category": journal.journal_category,
+            "word_count": journal.word_count or 0,
+            "sentiment": journal.sentiment,
+        }
+
+    @staticmethod
+    async def apply(db: AsyncSession, snapshot: dict, sign: int):
+        """
+        Add (sign=1) or remove (sign=-1) one journal's contribution in the
+        current transaction, without committing.
+        """
+        deltas = {"entry_count": sign, "word_count": sign * snapshot["word_count"]}
+        sentiment_column = SENTIMENT_COLUMNS.get(snapshot["sentiment"])
+        if sentiment_column:
+            deltas[sentiment_column] = sign
+        await JournalStatsRepository.add(db, snapshot["user_id"], snapshot["day"], snapshot["category"], deltas)
+
+    @staticmethod
+    async def add(db: AsyncSession, user_id, day, category, deltas: dict):
+        """
+        Add `deltas` (column -> amount) to one rollup row, creating it if needed.
+        """
+        upsert = UPSERTS[db.get_bind().dialect.name]
+        statement = upsert(JournalDailyStats).values(
+            user_id=user_id,
+            day=day,
+            category=category,
+            **deltas,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "day", "category"],
+            set_={
+                column: getattr(JournalDailyStats, column) + getattr(statement.excluded, column)
+                for column in deltas
+            },
+        )
+        await db.execute(statement)
+
+    @staticmethod
+    async def add_many(db: AsyncSession, deltas_by_row: dict):
+        """
+        Add deltas to many rollup rows at once, keyed by (user_id, day,
+        category), as one executemany of the same upsert. Rows are upserted
+        in key order, so concurrent writers lock shared rows in the same order.
+        """
+        if not deltas_by_row:
+            return
+        upsert = UPSERTS[db.get_bind().dialect.name]
+        statement = upsert(JournalDailyStats)
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "day", "category"],
+            set_={
+                column: getattr(JournalDailyStats, column) + getattr(statement.excluded, column)
+                for column in COUNT_COLUMNS
+            },
+        )
+        await db.execute(statement, [
+            {"user_id": user_id, "day": day, "category": category,
+             **{column: deltas.get(column, 0) for column in COUNT_COLUMNS}}
+            for (user_id, day, category), deltas in sorted(deltas_by_row.items())
+        ])
+
+    @staticmethod
+    async def replace(db: AsyncSession, before: dict, after: dict):
+        if before != after:
+            await JournalStatsRepository.apply(db, before, -1)
+            await JournalStatsRepository.apply(db, after, 1)
+
+    @staticmethod
+    async def daily_category_totals(db: AsyncSession, user_id):
+        """
+        Entry and word counts per (day, category) for a user, oldest day first.
+        """
+        result = await db.execute(
+            select(
+                JournalDailyStats.day,
+                JournalDailyStats.category,
+                JournalDailyStats.entry_count,
+                JournalDailyStats.word_count,
+            )
+            .filter(JournalDailyStats.user_id == user_id, JournalDailyStats.entry_count > 0)
+            .order_by(JournalDailyStats.day)
+        )
+        return result.all()
+
+    @staticmethod
+    async def daily_totals(db: AsyncSession, user_id, start, end):
+        """
+        Entry count and per-sentiment counts (SENTIMENT_COLUMNS order) per day
+        for a user, across categories, from start up to but excluding end.
+        """
+        result = await db.execute(
+            select(
+                JournalDailyStats.day,
+                func.sum(JournalDailyStats.entry_count),
+                *(func.sum(getattr(JournalDailyStats, column)) for column in SENTIMENT_COLUMNS.values()),
+            )
+            .filter(
+                JournalDailyStats.user_id == user_id,
+                JournalDailyStats.day >= start,
+                JournalDailyStats.day < end,
+                JournalDailyStats.entry_count > 0,
+            )
+            .group_by(JournalDailyStats.day)
+        )
+        return result.all()
+
+    @staticmethod
+    def rebuild(db: Session, user_id=None):
+        """
+        Recompute the rollup from the journals table (all users, or one user).
+        """
+        day = func.date(Journal.date_of_entry)
+        totals = select(
+            Journal.user_id,
+            day,
+            Journal.journal_category,
+            func.count(),
+            func.coalesce(func.sum(Journal.word_count), 0),
+            *(
+                func.sum(case((Journal.sentiment == label, 1), else_=0))
+                for label in SENTIMENT_COLUMNS
+            ),
+        ).filter(Journal.date_of_entry.is_not(None))
+
+        clear = delete(JournalDailyStats)
+        if user_id is not None:
+            totals = totals.filter(Journal.user_id == user_id)
+            clear = clear.filter(JournalDailyStats.user_id == user_id)
+        totals = totals.group_by(Journal.user_id, day, Journal.journal_category)
+
+        db.execute(clear)
+        db.execute(
+            insert(JournalDailyStats).from_select(
+                ["user_id", "day", "category", "entry_count", "word_count", *SENTIMENT_COLUMNS.values()],
+                totals,
+            )
+        )
@@ -0,0 +1,92 @@
+from collections import Counter
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+from app.models.model import Journal, UserTermCount
+from app.repository.stats_repository import UPSERTS
+from app.utils.journal import count_terms
+
+# Rows per INSERT, well under the bind parameter limits
+REBUILD_BATCH_SIZE = 5000
+
+
+class TermCountRepository:
+    @staticmethod
+    def deltas(old_content, new_content) -> dict:
+        """
+        Per-term change in counts when an entry's content goes from old to new.
+        """
+        deltas = Counter(count_terms(new_content))
+        deltas.subtract(count_terms(old_content))
+        return {term: delta for term, delta in deltas.items() if delta}
+
+    @staticmethod
+    async def apply(db: AsyncSession, user_id, deltas: dict):
+        """
+        Add the term deltas to a user's counts in the current transaction.
+
+        Rows are written in term order, so two concurrent writes for the same
+        user lock the rows they share in the same order and cannot deadlock.
+        """
+        if not deltas:
+            return
+
+        deltas = dict(sorted(deltas.items()))
+        upsert = UPSERTS[db.get_bind().dialect.name]
+        rows = [{"user_id": user_id, "term": term, "frequency": delta} for term, delta in deltas.items()]
+        for start in range(0, len(rows), REBUILD_BATCH_SIZE):
+            statement = upsert(UserTermCount).values(rows[start:start + REBUILD_BATCH_SIZE])
+            await db.execute(statement.on_conflict_do_update(
+                index_elements=["user_id", "term"],
+                set_={"frequency": UserTermCount.frequency + statement.excluded.frequency},
+            ))
+
+        removed = [term for term, delta in deltas.items() if delta < 0]
+        if removed:
+            await db.execute(
+                delete(UserTermCount).filter(
+                    UserTermCount.user_id == user_id,
+                    UserTermCount.term.in_(removed),
+                    UserTermCount.frequency <= 0,
+                )
+            )
+
+    @staticmethod
+    async def top_terms(db: AsyncSession, user_id, limit: int = 50):
+        result = await db.execute(
+            select(UserTermCount.term, UserTermCount.frequency)
+            .filter(UserTermCount.user_id == user_id)
+            .order_by(UserTermCount.frequency.desc(), UserTermCount.term)
+            .limit(limit)
+        )
+        return result.all()
+
+    @staticmethod
+    def rebuild(db: Session, user_id=None):
+        """
+        Recompute term counts from journal content (all users, or one user).
+
+        Content is streamed one user at a time, so memory stays bounded by a
+        single user's vocabulary.
+        """
+        clear = delete(UserTermCount)
+        contents = select(Journal.user_id, Journal.content).order_by(Journal.user_id)
+        if user_id is not None:
+            clear = clear.filter(UserTermCount.user_id == user_id)
+            contents = contents.filter(Journal.user_id == user_id)
+        db.execute(clear)
+
+        current_user, counts = None, Counter()
+        for row_user_id, content in db.execute(contents.execution_options(yield_per=1000)):
+            if row_user_id != current_user:
+                TermCountRepository.insert_counts(db, current_user, counts)
+                current_user, counts = row_user_id, Counter()
+            counts.update(count_terms(content))
+        TermCountRepository.insert_counts(db, current_user, counts)
+
+    @staticmethod
+    def insert_counts(db: Session, user_id, counts: Counter):
+        rows = [{"user_id": user_id, "term": term, "frequency": count} for term, count in counts.items()]
+        for start in range(0, len(rows), REBUILD_BATCH_SIZE):
+            db.execute(insert(UserTermCount), rows[start:start + REBUILD_BATCH_SIZE])
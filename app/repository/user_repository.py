@@ -1,6 +1,9 @@
+from typing import Optional
+from sqlalchemy import func, or_, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from models.model import User
+from app.models.model import User
+from app.utils.cache import principal_cache
 
 class UserRepository:
     @staticmethod
@@ -8,10 +11,132 @@ class UserRepository:
         result = await db.execute(select(User))
         return result.scalars().all()
 
+    # Columns the admin user list shows, never the password hash
+    LIST_COLUMNS = (User.id, User.first_name, User.last_name, User.email, User.role, User.created_at)
+
+    @staticmethod
+    def search(prefix: str):
+        """
+        Users whose first name, last name or email starts with prefix.
+
+        Each prefix is written as a range (col >= 'ann' AND col < 'ano') rather
+        than LIKE, so the plain btree index on every column can serve it.
+        Names also match the capitalized prefix and emails the lowercase one.
+        """
+        clauses = []
+        for column, prefixes in (
+            (User.first_name, {prefix, prefix.capitalize()}),
+            (User.last_name, {prefix, prefix.capitalize()}),
+            (User.email, {prefix.lower()}),
+        ):
+            for value in prefixes:
+                upper = prefix_upper_bound(value)
+                clauses.append((column >= value) & (column < upper) if upper is not None else column >= value)
+        return [or_(*clauses)]
+
+    @staticmethod
+    async def list_page(db: AsyncSession, criteria, limit: int, after=None, offset: int = 0):
+        """
+        One page of users (LIST_COLUMNS only), oldest first, keyed on
+        (created_at, id). Returns the rows and whether more follow.
+        """
+        query = select(*UserRepository.LIST_COLUMNS).filter(*criteria)
+        if after is not None:
+            query = query.filter(tuple_(User.created_at, User.id) > after)
+        query = query.order_by(User.created_at, User.id).offset(offset).limit(limit + 1)
+        rows = (await db.execute(query)).all()
+        return rows[:limit], len(rows) > limit
+
+    @staticmethod
+    async def count_users(db: AsyncSession, criteria=()) -> int:
+        result = await db.execute(select(func.count()).select_from(User).filter(*criteria))
+        return result.scalar_one()
+
+    @staticmethod
+    async def estimate_users(db: AsyncSession):
+        """
+        The planner's row estimate for users on PostgreSQL, which costs nothing
+        to read. None elsewhere, or before the table has been analyzed.
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return None
+        result = await db.execute(text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'users'::regclass"))
+        estimate = result.scalar()
+        return estimate if estimate is not None and estimate >= 0 else None
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, user_id):
+        return await db.get(User, user_id)
+
+    @staticmethod
+    async def get_principal(db: AsyncSession, user_id):
+        # The fields an authenticated request needs, without the password hash
+        result = await db.execute(
+            select(User.id, User.role, User.first_name, User.last_name, User.email).filter(User.id == user_id)
+        )
+        return result.first()
+
+    @staticmethod
+    async def get_data_version(db: AsyncSession, user_id):
+        result = await db.execute(select(User.data_version).filter(User.id == user_id))
+        return result.scalar()
+
     @staticmethod
-    async def create_user(db: AsyncSession, user_data):
-        user = User(name=user_data.name, email=user_data.email)
+    def data_version_update(user_ids=None):
+        """
+        Statement bumping the data version of the given users (all users
+        without ids). Run it in the transaction that changes their journals.
+        """
+        statement = update(User).values(data_version=User.data_version + 1)
+        if user_ids is not None:
+            statement = statement.filter(User.id.in_(list(user_ids)))
+        return statement.execution_options(synchronize_session=False)
+
+    @staticmethod
+    async def bump_data_version(db: AsyncSession, *user_ids):
+        if user_ids:
+            await db.execute(UserRepository.data_version_update(user_ids))
+
+    @staticmethod
+    async def get_by_email(db: AsyncSession, email: str):
+        result = await db.execute(select(User).filter(User.email == email))
+        return result.scalars().first()
+
+    @staticmethod
+    async def get_credentials_by_email(db: AsyncSession, email: str):
+        # Only the columns needed to verify a login
+        result = await db.execute(
+            select(User.id, User.password, User.role).filter(User.email == email)
+        )
+        return result.first()
+
+    @staticmethod
+    async def create_user(db: AsyncSession, user: User):
         db.add(user)
         await db.commit()
         await db.refresh(user)
         return user
+
+    @staticmethod
+    async def update_password(db: AsyncSession, user_id, hashed_password: str):
+        await db.execute(update(User).filter(User.id == user_id).values(password=hashed_password))
+        await db.commit()
+        UserRepository.forget_principal(user_id)
+
+    @staticmethod
+    def forget_principal(user_id):
+        """
+        Drop a changed or deleted user from the principal cache, after the
+        change is committed. Only covers this process, other workers catch
+        up within PRINCIPAL_CACHE_TTL.
+        """
+        principal_cache.invalidate(user_id)
+
+
+def prefix_upper_bound(prefix: str) -> Optional[str]:
+    # Smallest string greater than every string starting with prefix, None when
+    # there is none (the prefix is empty or all U+10FFFF, the last code point)
+    stem = prefix.rstrip("\U0010FFFF")
+    if not stem:
+        return None
+    return stem[:-1] + chr(ord(stem[-1]) + 1)
@@ -0,0 +1,6 @@
+from fastapi import APIRouter
+from app.controllers.internal import metrics_router, router as internal_controller
+
+router = APIRouter()
+router.include_router(internal_controller)
+router.include_router(metrics_router)
@@ -1,76 +1,38 @@
-from app.database import get_db
-from sqlalchemy.orm import Session
-from app.models.model import User
-import jwt  # Using PyJWT
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from app.views.auth import RegisterRequest
 
 from app.views.user_schema import UserResponse
 
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from app.models.model import User, UserRole
-from passlib.context import CryptContext
+from app.models.model import UserRole
+from app.repository.user_repository import UserRepository
+from app.services.user_service import UserService
 from app.utils.auth import create_access_token
+from app.utils.pagination import encode_cursor
+from app.utils.passwords import password_needs_update, password_pool
 from app.views.auth import Token, LoginRequest, LoginResponse
-from typing import Dict, List
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env
-load_dotenv()
-
-
+from typing import Dict, List, Optional
 
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def authenticate_user(email: str, password: str) -> str | None:
-    db = next(get_db())  # Get DB session
-    user = db.query(User).filter(User.email == email).first()
-
-    if not user or not pwd_context.verify(password, user.password):
-        return None  # Invalid credentials
-
-    # Generate JWT token
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {
-        "sub": str(user.id),  # Ensure user ID is a string for JWT compatibility
-        "exp": datetime.utcnow() + access_token_expires
-    }
-    access_token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-    return access_token
 
+async def register_admin(request: RegisterRequest, db: AsyncSession) -> dict:
+    # Refuse straight away if the password pool is saturated
+    password_pool.ensure_capacity()
 
-
-def register_admin(request: RegisterRequest, db: Session) -> dict:
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
-    print("existing user", existing_user)
-    if existing_user:
+    if await UserService.email_exists(db, request.email):
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    # Hash the password
-    hashed_password = pwd_context.hash(request.password)
+    # Give the connection back to the pool while the password is hashed
+    await db.close()
 
-    # Create a new admin user
-    new_admin = User(
-        first_name=request.first_name,
-        last_name=request.last_name,
-        email=request.email,
-        password=hashed_password,
-        role=UserRole.ADMIN  # Set role explicitly
-    )
+    # Hash the password in the password pool, bcrypt is CPU bound
+    hashed_password = await password_pool.hash(request.password)
 
-    db.add(new_admin)
-    db.commit()
-    db.refresh(new_admin)
+    # Create a new admin user
+    await UserService.create_user(request, hashed_password, db, role=UserRole.ADMIN)
 
     return {"message": "Admin registered successfully"}
 
@@ -80,17 +42,26 @@ def register_admin(request: RegisterRequest, db: Session) -> dict:
 
 
 
+async def login_admin(request: LoginRequest, db: AsyncSession, background_tasks: BackgroundTasks) -> Token:
+    # Refuse straight away if the password pool is saturated
+    password_pool.ensure_capacity()
 
-def login_admin(request: LoginRequest, db: Session) -> Token:
     # Check if user exists
-    user = db.query(User.id, User.password, User.role).filter(User.email == request.email).first()
+    user = await UserRepository.get_credentials_by_email(db, request.email)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    # Give the connection back to the pool while the password is checked
+    await db.close()
+
     # Verify password
-    if not pwd_context.verify(request.password, user.password):
+    if not await password_pool.verify(request.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    # Upgrade hashes made at an older bcrypt cost, without delaying the login
+    if password_needs_update(user.password):
+        background_tasks.add_task(UserService.rehash_password, user.id, request.password)
+
     # Validate role
     # if user.role.value != UserRole.ADMIN.value:  # Use constants for roles
     #     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
@@ -112,14 +83,18 @@ def login_admin(request: LoginRequest, db: Session) -> Token:
     return data
 
 
-def get_all_users_service(db: Session, page: int, limit: int) -> Dict:
-    # Calculate pagination indices
-    offset = (page - 1) * limit
-
-    # Query the database for users
-    users_query = db.query(User).offset(offset).limit(limit)
-    total_users = db.query(User).count()  # Total number of users for pagination metadata
-    users = users_query.all()
+async def get_all_users_service(
+    db: AsyncSession,
+    page: int,
+    limit: int,
+    after=None,
+    search: Optional[str] = None,
+    exact: bool = False,
+) -> Dict:
+    # One page of users, by cursor when given, otherwise by page number
+    offset = 0 if after is not None else (page - 1) * limit
+    users, has_more = await UserService.get_users(db, limit, after, offset, search)
+    total_users, total_is_exact = await UserService.count_users(db, search, exact)
 
     # Format the response data
     user_list = [
@@ -138,6 +113,8 @@ def get_all_users_service(db: Session, page: int, limit: int) -> Dict:
         "metadata": {
             "page": page,
             "limit": limit,
-            "total_users": total_users
+            "total_users": total_users,
+            "total_is_exact": total_is_exact,
+            "next_cursor": encode_cursor(users[-1].created_at, users[-1].id) if has_more else None,
         }
-    }
\ No newline at end of file
+    }
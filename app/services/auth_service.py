@@ -1,72 +1,35 @@
-from app.database import get_db
-from sqlalchemy.orm import Session
-from app.models.model import User
-import jwt  # Using PyJWT
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
-from passlib.context import CryptContext
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from app.views.auth import RegisterRequest
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
-from app.models.model import User
-from passlib.context import CryptContext
+from app.repository.user_repository import UserRepository
+from app.services.user_service import UserService
 from app.utils.auth import create_access_token
+from app.utils.passwords import password_needs_update, password_pool
 from app.views.auth import Token, LoginRequest, LoginResponse
 
 
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env
-load_dotenv()
-
-
-
-SECRET_KEY = os.getenv("SECRET_KEY")
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
-
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def authenticate_user(email: str, password: str) -> str | None:
-    db = next(get_db())  # Get DB session
-    user = db.query(User).filter(User.email == email).first()
 
-    if not user or not pwd_context.verify(password, user.password):
-        return None  # Invalid credentials
 
-    # Generate JWT token
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {
-        "sub": str(user.id),  # Ensure user ID is a string for JWT compatibility
-        "exp": datetime.utcnow() + access_token_expires
-    }
-    access_token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-    return access_token
 
+async def register_user(request: RegisterRequest, db: AsyncSession) -> Token:
+    # Refuse straight away if the password pool is saturated
+    password_pool.ensure_capacity()
 
-
-def register_user(request: RegisterRequest, db: Session) -> Token:
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == request.email).first()
-    if existing_user:
+    if await UserService.email_exists(db, request.email):
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    # Hash the password
-    hashed_password = pwd_context.hash(request.password)
+    # Give the connection back to the pool while the password is hashed
+    await db.close()
+
+    # Hash the password in the password pool, bcrypt is CPU bound
+    hashed_password = await password_pool.hash(request.password)
 
 
     # Create a new user
-    new_user = User(
-        first_name=request.first_name,
-        last_name=request.last_name,
-        email=request.email,
-        password=hashed_password
-    )
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await UserService.create_user(request, hashed_password, db)
 
 
     # return {"access_token": access_token, "token_type": "bearer"}
@@ -75,16 +38,26 @@ def register_user(request: RegisterRequest, db: Session) -> Token:
 
 
 
-def login_user(request: LoginRequest, db: Session) -> Token:
+async def login_user(request: LoginRequest, db: AsyncSession, background_tasks: BackgroundTasks) -> Token:
+    # Refuse straight away if the password pool is saturated
+    password_pool.ensure_capacity()
+
     # Check if user exists
-    user = db.query(User.id, User.password, User.role).filter(User.email == request.email).first()
+    user = await UserRepository.get_credentials_by_email(db, request.email)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    # Give the connection back to the pool while the password is checked
+    await db.close()
+
     # Verify password
-    if not pwd_context.verify(request.password, user.password):
+    if not await password_pool.verify(request.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    # Upgrade hashes made at an older bcrypt cost, without delaying the login
+    if password_needs_update(user.password):
+        background_tasks.add_task(UserService.rehash_password, user.id, request.password)
+
     # Generate access token
     access_token = create_access_token(
         data={"sub": str(user.id)},  # User ID is included in the token payload
@@ -101,4 +74,4 @@ def login_user(request: LoginRequest, db: Session) -> Token:
 
     return data
 
-    
\ No newline at end of file
+    
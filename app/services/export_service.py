@@ -0,0 +1,143 @@
+import csv
+import io
+from importlib.util import find_spec
+from app import config
+from app.database import AsyncSessionLocal
+from app.repository.journal_repository import JournalRepository
+
+# Header of an export, in column order
+EXPORT_COLUMNS = [column.key for column in JournalRepository.EXPORT_COLUMNS]
+
+# Media type and file extension of each format
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+# Formats written with pyarrow, an optional dependency
+ARROW_FORMATS = {"parquet", "arrow"}
+
+
+def format_available(format: str) -> bool:
+    return format not in ARROW_FORMATS or find_spec("pyarrow") is not None
+
+
+class ChunkSink:
+    """
+    Write-only file for pyarrow writers that keeps what was written until
+    the next drain(), so it can be sent and dropped batch by batch.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+async def csv_chunks(batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for rows in batches:
+        writer.writerows(
+            (row.id, row.title, row.content, row.journal_category, isoformat(row.date_of_entry),
+             row.sentiment, row.word_count, isoformat(row.created_at))
+            for row in rows
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def arrow_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("id", pa.string()),
+        ("title", pa.string()),
+        ("content", pa.large_string()),
+        ("journal_category", pa.string()),
+        ("date_of_entry", pa.timestamp("us")),
+        ("sentiment", pa.string()),
+        ("word_count", pa.int32()),
+        ("created_at", pa.timestamp("us")),
+    ])
+
+
+def record_batch(schema, rows):
+    import pyarrow as pa
+
+    columns = list(zip(*rows))
+    columns[0] = [str(journal_id) for journal_id in columns[0]]
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+        schema=schema,
+    )
+
+
+async def arrow_chunks(batches, open_writer):
+    schema = arrow_schema()
+    sink = ChunkSink()
+    writer = open_writer(sink, schema)
+    async for rows in batches:
+        writer.write_batch(record_batch(schema, rows))
+        yield sink.drain()
+    writer.close()
+    yield sink.drain()
+
+
+def parquet_writer(sink, schema):
+    import pyarrow.parquet as pq
+
+    return pq.ParquetWriter(sink, schema, compression="zstd")
+
+
+def arrow_stream_writer(sink, schema):
+    import pyarrow as pa
+
+    return pa.ipc.new_stream(sink, schema)
+
+
+async def export_journals(user_id, format: str, start=None, end=None):
+    """
+    Stream a user's journals (oldest first, optionally between two dates)
+    as the bytes of a CSV, Parquet or Arrow IPC stream file.
+
+    Rows come off a server-side cursor EXPORT_BATCH_SIZE at a time and each
+    batch is written and handed on before the next is read, so memory holds
+    one batch however many entries there are. Runs after the response has
+    started, so it opens its own session.
+    """
+    async with AsyncSessionLocal() as db:
+        query = JournalRepository.export_query(JournalRepository.in_range(user_id, start, end))
+        result = await db.stream(query.execution_options(yield_per=config.EXPORT_BATCH_SIZE))
+        batches = result.partitions()
+        if format == "csv":
+            chunks = csv_chunks(batches)
+        elif format == "parquet":
+            chunks = arrow_chunks(batches, parquet_writer)
+        else:
+            chunks = arrow_chunks(batches, arrow_stream_writer)
+        async for chunk in chunks:
+            if chunk:
+                yield chunk
@@ -0,0 +1,223 @@
+import codecs
+import csv
+import json
+import uuid
+from datetime import datetime
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app import config
+from app.repository.journal_repository import JournalRepository, PENDING_SENTIMENT
+from app.services.sentiment_service import sentiment_queue
+from app.utils.journal import count_words
+from app.utils.sentiment import get_cached_sentiment, get_sentiments
+from app.views.journal_schema import JournalCreate
+
+# Import formats by request Content-Type
+IMPORT_FORMATS = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+}
+
+
+# Yielded by iter_lines in place of a line longer than IMPORT_MAX_RECORD_LENGTH
+LINE_TOO_LONG = object()
+
+
+def too_long_message(what: str = "Line") -> str:
+    return f"{what} longer than {config.IMPORT_MAX_RECORD_LENGTH} characters"
+
+
+async def iter_lines(chunks):
+    """
+    Split a stream of UTF-8 byte chunks into lines, holding at most one
+    partial line of up to IMPORT_MAX_RECORD_LENGTH characters in memory.
+
+    A longer line is yielded as LINE_TOO_LONG as soon as it passes the limit,
+    and the rest of it is dropped up to the next newline.
+    """
+    max_length = config.IMPORT_MAX_RECORD_LENGTH
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    # Pieces of the current partial line, and whether it is being dropped
+    pending, pending_length, skipping = [], 0, False
+
+    async for chunk in chunks:
+        *lines, tail = decoder.decode(chunk).split("\n")
+        for line in lines:
+            if not skipping:
+                pending_length += len(line)
+                yield "".join(pending + [line]).rstrip("\r") if pending_length <= max_length else LINE_TOO_LONG
+            pending, pending_length, skipping = [], 0, False
+        if skipping:
+            continue
+        pending.append(tail)
+        pending_length += len(tail)
+        if pending_length > max_length:
+            yield LINE_TOO_LONG
+            pending, pending_length, skipping = [], 0, True
+
+    tail = decoder.decode(b"", final=True)
+    if not skipping:
+        pending_length += len(tail)
+        if pending_length > max_length:
+            yield LINE_TOO_LONG
+        elif pending_length:
+            yield "".join(pending + [tail]).rstrip("\r")
+
+
+async def ndjson_records(lines):
+    # One JSON object per non-blank line
+    async for line in lines:
+        if line is LINE_TOO_LONG:
+            yield None, too_long_message()
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line), None
+        except ValueError as exc:
+            yield None, f"Invalid JSON: {exc}"
+
+
+async def csv_records(lines):
+    # A header row, then one record per row. A quoted field may span lines,
+    # so lines are joined until the quotes balance, up to
+    # IMPORT_MAX_RECORD_LENGTH characters: past that (a stray quote, most
+    # likely) the record fails and parsing starts over on the next line.
+    header = None
+    record, record_length, quotes = [], 0, 0
+    async for line in lines:
+        if line is LINE_TOO_LONG:
+            record, record_length, quotes = [], 0, 0
+            yield None, too_long_message()
+            continue
+        record.append(line)
+        record_length += len(line) + 1
+        quotes += line.count('"')
+        if quotes % 2:
+            if record_length > config.IMPORT_MAX_RECORD_LENGTH:
+                record, record_length, quotes = [], 0, 0
+                yield None, f"{too_long_message('Record')}, check for an unbalanced quote"
+            continue
+        text = "\n".join(record)
+        record, record_length, quotes = [], 0, 0
+        if not text.strip():
+            continue
+        values = next(csv.reader([text]))
+        if header is None:
+            header = [name.strip() for name in values]
+        elif len(values) != len(header):
+            yield None, f"Expected {len(header)} fields, got {len(values)}"
+        else:
+            yield dict(zip(header, values)), None
+    if record:
+        yield None, "Unterminated quoted field"
+
+
+RECORD_PARSERS = {"ndjson": ndjson_records, "csv": csv_records}
+
+
+def validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors()
+    )
+
+
+class ImportReport:
+    """
+    Running totals of an import, keeping at most IMPORT_MAX_ERRORS row errors.
+    """
+
+    def __init__(self):
+        self.imported = 0
+        self.failed = 0
+        self.errors = []
+
+    def add_error(self, row: int, error: str):
+        self.failed += 1
+        if len(self.errors) < config.IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "error": error})
+
+    def as_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+def to_row(user_id, journal: JournalCreate) -> dict:
+    date_of_entry = journal.date_of_entry
+    if date_of_entry.tzinfo is not None:
+        date_of_entry = date_of_entry.astimezone().replace(tzinfo=None)
+    if date_of_entry > datetime.now():
+        raise ValueError("date_of_entry cannot be in the future.")
+    if not journal.content.strip():
+        raise ValueError("content must not be empty.")
+    return {
+        "id": uuid.uuid4(),
+        "user_id": user_id,
+        "title": journal.title,
+        "content": journal.content,
+        "journal_category": journal.journal_category,
+        "date_of_entry": date_of_entry,
+        "created_at": datetime.now(),
+        "word_count": count_words(journal.content),
+    }
+
+
+async def score_batch(rows: list):
+    """
+    Fill in each row's sentiment: with the background pipeline running,
+    anything not in the cache is left PENDING for it, otherwise the batch is
+    scored with as few backend calls as it allows.
+    """
+    if sentiment_queue.running:
+        for row in rows:
+            row["sentiment"] = get_cached_sentiment(row["content"]) or PENDING_SENTIMENT
+        return
+    sentiments = await run_in_threadpool(get_sentiments, [row["content"] for row in rows])
+    for row, sentiment in zip(rows, sentiments):
+        row["sentiment"] = sentiment
+
+
+async def import_journals(db: AsyncSession, user_id, chunks, format: str) -> dict:
+    """
+    Import a user's journals from a streamed NDJSON or CSV body.
+
+    Rows are validated as they arrive and inserted IMPORT_BATCH_SIZE at a
+    time, each batch in its own transaction, so memory stays bounded
+    whatever the size of the upload. Invalid rows are skipped and reported
+    by their 1-based position among the records.
+    """
+    report = ImportReport()
+    batch = []
+
+    async def flush():
+        await score_batch(batch)
+        await JournalRepository.import_batch(db, user_id, batch)
+        report.imported += len(batch)
+        batch.clear()
+
+    row_number = 0
+    async for record, error in RECORD_PARSERS[format](iter_lines(chunks)):
+        row_number += 1
+        if error is None:
+            try:
+                batch.append(to_row(user_id, JournalCreate.model_validate(record)))
+            except ValidationError as exc:
+                error = validation_message(exc)
+            except ValueError as exc:
+                error = str(exc)
+        if error is not None:
+            report.add_error(row_number, error)
+        elif len(batch) >= config.IMPORT_BATCH_SIZE:
+            await flush()
+    if batch:
+        await flush()
+
+    sentiment_queue.feed_pending(user_id)
+    return report.as_dict()
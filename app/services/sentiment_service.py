@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from starlette.concurrency import run_in_threadpool
+from app import config
+from app.database import AsyncSessionLocal
+from app.models.model import Journal
+from app.repository.journal_repository import JournalRepository, PENDING_SENTIMENT
+from app.utils.sentiment import get_cached_sentiment, get_sentiment, get_sentiments
+
+logger = logging.getLogger(__name__)
+
+
+class SentimentQueue:
+    """
+    Scores journal sentiment off the request path.
+
+    Writes commit with the PENDING placeholder and queue the journal here.
+    Workers pull whatever is waiting (up to SENTIMENT_BATCH_SIZE texts),
+    score it with one backend call and write the results back in one
+    transaction, moving the daily rollup's sentiment counts as they go.
+    """
+
+    def __init__(self):
+        self.queue = None
+        self.workers = []
+        self.feeders = set()
+
+    @property
+    def running(self) -> bool:
+        return bool(self.workers)
+
+    async def start(self):
+        if not config.SENTIMENT_ASYNC or self.running:
+            return
+        self.queue = asyncio.Queue(maxsize=config.SENTIMENT_QUEUE_SIZE)
+        # Before any worker exists, so a failure here leaves nothing running
+        await self.requeue_pending()
+        self.workers = [asyncio.create_task(self.worker()) for _ in range(config.SENTIMENT_WORKERS)]
+
+    async def stop(self, timeout: float = 5.0):
+        """
+        Give queued journals a moment to finish, then stop the workers.
+        Anything left stays PENDING and is picked up on the next start.
+        """
+        if not self.running:
+            return
+        for feeder in self.feeders:
+            feeder.cancel()
+        await asyncio.gather(*self.feeders, return_exceptions=True)
+        try:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Stopping with %d journals still pending sentiment", self.queue.qsize())
+            for worker in self.workers:
+                worker.cancel()
+            await asyncio.gather(*self.workers, return_exceptions=True)
+        finally:
+            # Even if this loop is going away, the next start gets a clean slate
+            self.workers = []
+            self.queue = None
+
+    async def requeue_pending(self):
+        # Journals left PENDING by a restart would otherwise never be scored
+        async with AsyncSessionLocal() as db:
+            pending = await JournalRepository.pending_sentiment(db, self.queue.maxsize)
+        for journal_id, content in pending:
+            self.queue.put_nowait((journal_id, content))
+
+    def feed_pending(self, user_id):
+        """
+        Queue all of a user's PENDING journals in the background, e.g. after
+        a bulk import, waiting for room rather than overflowing the queue.
+        """
+        if not self.running:
+            return
+        feeder = asyncio.create_task(self.enqueue_pending(user_id))
+        self.feeders.add(feeder)
+        feeder.add_done_callback(self.feeders.discard)
+
+    async def enqueue_pending(self, user_id):
+        limit = config.SENTIMENT_BATCH_SIZE * config.SENTIMENT_WORKERS * 4
+        after = None
+        while True:
+            async with AsyncSessionLocal() as db:
+                pending = await JournalRepository.pending_sentiment(db, limit, user_id, after)
+            for journal_id, content in pending:
+                await self.queue.put((journal_id, content))
+            if len(pending) < limit:
+                return
+            after = pending[-1][0]
+
+    async def score_or_defer(self, text: str) -> str:
+        """
+        The sentiment to store with a write: a cached score if there is one,
+        the PENDING placeholder when the pipeline can take it, otherwise a
+        score computed inline.
+        """
+        cached = get_cached_sentiment(text)
+        if cached is not None:
+            return cached
+        if self.running and not self.queue.full():
+            return PENDING_SENTIMENT
+        return await run_in_threadpool(get_sentiment, text)
+
+    def submit(self, journal: Journal):
+        # Call after the write is committed so workers can see the row
+        if not self.running or journal.sentiment != PENDING_SENTIMENT:
+            return
+        try:
+            self.queue.put_nowait((journal.id, journal.content))
+        except asyncio.QueueFull:
+            logger.warning("Sentiment queue full, journal %s stays pending until restart", journal.id)
+
+    async def next_batch(self):
+        batch = [await self.queue.get()]
+        deadline = asyncio.get_running_loop().time() + config.SENTIMENT_BATCH_WAIT
+        while len(batch) < config.SENTIMENT_BATCH_SIZE:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def worker(self):
+        while True:
+            batch = await self.next_batch()
+            try:
+                await self.process(batch)
+            except Exception:
+                logger.exception("Failed to score a batch of %d journals", len(batch))
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def process(self, batch):
+        texts = [content for _, content in batch]
+        sentiments = await run_in_threadpool(get_sentiments, texts)
+        results = {
+            journal_id: (content, sentiment)
+            for (journal_id, content), sentiment in zip(batch, sentiments)
+        }
+        async with AsyncSessionLocal() as db:
+            await JournalRepository.apply_sentiments(db, results)
+
+
+sentiment_queue = SentimentQueue()
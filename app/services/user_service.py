@@ -1,12 +1,75 @@
+from typing import Optional
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from repository.user_repository import UserRepository
-from views.user_schema import UserCreate
+from app import config
+from app.database import AsyncSessionLocal
+from app.repository.user_repository import UserRepository
+from app.models.model import User, UserRole
+from app.utils.cache import TTLCache
+from app.utils.passwords import password_pool
+from app.views.auth import RegisterRequest
+
+# Recent exact user counts by search prefix ("" for all users)
+user_counts = TTLCache(maxsize=256, ttl=config.USER_COUNT_CACHE_TTL)
+
 
 class UserService:
     @staticmethod
-    async def get_users(db: AsyncSession):
-        return await UserRepository.get_all_users(db)
+    async def get_users(db: AsyncSession, limit: int, after=None, offset: int = 0, search: Optional[str] = None):
+        criteria = UserRepository.search(search) if search else []
+        return await UserRepository.list_page(db, criteria, limit, after, offset)
+
+    @staticmethod
+    async def count_users(db: AsyncSession, search: Optional[str] = None, exact: bool = False):
+        """
+        Total for the admin user list and whether it was counted just now.
+
+        Unless exact is asked for, a count from the last USER_COUNT_CACHE_TTL
+        seconds or PostgreSQL's row estimate is used instead of a COUNT(*).
+        """
+        key = search or ""
+        if not exact:
+            cached = user_counts.get(key)
+            if cached is not None:
+                return cached, False
+            if not search:
+                estimate = await UserRepository.estimate_users(db)
+                if estimate is not None:
+                    return estimate, False
+        criteria = UserRepository.search(search) if search else []
+        total = await UserRepository.count_users(db, criteria)
+        user_counts.set(key, total)
+        return total, True
+
+    @staticmethod
+    async def email_exists(db: AsyncSession, email: str) -> bool:
+        return await UserRepository.get_by_email(db, email) is not None
+
+    @staticmethod
+    async def create_user(
+        user_data: RegisterRequest,
+        hashed_password: str,
+        db: AsyncSession,
+        role: UserRole = UserRole.USER,
+    ):
+        user = User(
+            first_name=user_data.first_name,
+            last_name=user_data.last_name,
+            email=user_data.email,
+            password=hashed_password,
+            role=role,
+        )
+        return await UserRepository.create_user(db, user)
 
     @staticmethod
-    async def create_user(user_data: UserCreate, db: AsyncSession):
-        return await UserRepository.create_user(db, user_data)
+    async def rehash_password(user_id, password: str):
+        """
+        Re-hash a password at the current bcrypt cost after a login, as a
+        background task once the response has been sent.
+        """
+        try:
+            hashed_password = await password_pool.hash(password)
+        except HTTPException:
+            return  # Pool is busy, the next login tries again
+        async with AsyncSessionLocal() as db:
+            await UserRepository.update_password(db, user_id, hashed_password)
@@ -1,11 +1,18 @@
+import hmac
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import config
 from app.database import get_db
-from app.models.model import User
+from app.models.model import UserRole
+from app.repository.user_repository import UserRepository
+from app.utils.cache import principal_cache
+from uuid import UUID
 import os
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from typing import Optional
 
 # Validate SECRET_KEY
 SECRET_KEY = os.getenv("SECRET_KEY", "huhdsuhdksheiu")
@@ -31,34 +38,92 @@ def create_access_token(data: dict, role: str, expires_delta: timedelta):
     })
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def get_current_user(
+
+@dataclass(frozen=True)
+class Principal:
+    """
+    The authenticated user as request handlers see it: immutable and without
+    the password hash. Name and email are None when the principal was built
+    from a trusted token alone (see AUTH_TRUST_ROLE_CLAIM).
+    """
+    id: UUID
+    role: UserRole
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+
+
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Invalid authentication credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+
+async def load_principal(db: AsyncSession, user_id: UUID) -> Principal:
+    row = await UserRepository.get_principal(db, user_id)
+    if row is None:
+        raise credentials_exception
+    principal = Principal(*row)
+    principal_cache.set(user_id, principal)
+    return principal
+
+
+async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: Session = Depends(get_db)
-):
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
     """
     Validate the JWT token and retrieve the current user.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid authentication credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     try:
         # Extract the token from the Authorization header
         token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: int = payload.get("sub")
+        user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
+        user_id = UUID(user_id)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token has expired. Please log in again.")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token. Please log in again.")
-
-    # Query the database for the user
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    except ValueError:  # "sub" is not a valid UUID
         raise credentials_exception
 
-    return user
\ No newline at end of file
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    # The token is signed, so its role claim can stand in for the users row
+    if config.AUTH_TRUST_ROLE_CLAIM and payload.get("role") in UserRole.__members__:
+        return Principal(id=user_id, role=UserRole(payload["role"]))
+
+    return await load_principal(db, user_id)
+
+
+async def get_current_user_profile(
+    principal: Principal = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """
+    The current user including name and email, for handlers that show them.
+    """
+    if principal.email is not None:
+        return principal
+    return await load_principal(db, principal.id)
+
+
+async def require_internal_access(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Allow the INTERNAL_TOKEN (for scrapers) or an admin's access token.
+    """
+    token = credentials.credentials
+    if config.INTERNAL_TOKEN and hmac.compare_digest(token.encode(), config.INTERNAL_TOKEN.encode()):
+        return
+    principal = await get_current_user(credentials, db)
+    if principal.role != UserRole.ADMIN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access this resource")
@@ -0,0 +1,66 @@
+import threading
+import time
+from collections import OrderedDict
+from app import config
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries also expire `ttl` seconds after they are
+    stored. Counts hits and misses so the hit ratio can be monitored.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()  # key -> (expires_at, value)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > self.clock():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self.entries[key] = (self.clock() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self.entries),
+                "max_size": self.maxsize,
+                "ttl_seconds": self.ttl,
+            }
+
+
+# Authenticated users by id (see app.utils.auth). Here rather than there so
+# UserRepository can drop a user it changes without a circular import.
+principal_cache = TTLCache(config.PRINCIPAL_CACHE_SIZE, config.PRINCIPAL_CACHE_TTL)
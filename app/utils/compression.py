@@ -0,0 +1,165 @@
+import zlib
+from importlib.util import find_spec
+from typing import Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Sent as is: already compressed, or must reach the client unbuffered
+EXCLUDED_CONTENT_TYPES = ("text/event-stream", "application/vnd.apache.parquet")
+
+
+class GzipEncoder:
+    def __init__(self, level: int):
+        # wbits 31: a gzip header and trailer around the deflate stream
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self.compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self.compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self, quality: int):
+        # Optional dependency, only imported once a client asks for br
+        import brotli
+
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self.compressor.flush()
+
+    def finish(self) -> bytes:
+        return self.compressor.finish()
+
+
+def accepted_encodings(accept_encoding: str) -> dict:
+    """
+    Content codings of an Accept-Encoding header and their q-values.
+    """
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, *params = [part.strip() for part in item.split(";")]
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.lower()] = quality
+    return accepted
+
+
+def negotiate(accept_encoding: str, available) -> Optional[str]:
+    """
+    The available coding (in order of preference) the client accepts with
+    the highest q-value, or None to send the body as is.
+    """
+    accepted = accepted_encodings(accept_encoding)
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with brotli (when installed) or gzip, as
+    negotiated with Accept-Encoding.
+
+    Bodies under minimum_size are sent as is. A streamed body is compressed
+    message by message, each flushed so the client can decode it on
+    arrival, and is never buffered whole.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = {"gzip": lambda: GzipEncoder(gzip_level)}
+        if find_spec("brotli") is not None:
+            self.encoders = {"br": lambda: BrotliEncoder(brotli_quality), **self.encoders}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        coding = negotiate(Headers(scope=scope).get("accept-encoding", ""), self.encoders)
+        responder = CompressionResponder(send, self.minimum_size, coding, self.encoders.get(coding))
+        await self.app(scope, receive, responder.send)
+
+
+class CompressionResponder:
+    """
+    Send side of one response: holds back the start message until the first
+    body shows whether (and how) the response is compressed.
+    """
+
+    def __init__(self, send: Send, minimum_size: int, coding: Optional[str], make_encoder):
+        self.downstream = send
+        self.minimum_size = minimum_size
+        self.coding = coding
+        self.make_encoder = make_encoder
+        self.start_message = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send_start()
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start_message is not None:
+            # First body: decide for the whole response
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+            else:
+                headers = MutableHeaders(raw=self.start_message["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if self.make_encoder is None:
+                    self.passthrough = True
+                else:
+                    self.encoder = self.make_encoder()
+                    headers["Content-Encoding"] = self.coding
+                    if more_body:
+                        del headers["Content-Length"]
+            if self.passthrough:
+                await self.send_start()
+                await self.downstream(message)
+                return
+
+        data = self.encoder.compress(body)
+        data += self.encoder.flush() if more_body else self.encoder.finish()
+        if self.start_message is not None:
+            if not more_body:
+                MutableHeaders(raw=self.start_message["headers"])["Content-Length"] = str(len(data))
+            await self.send_start()
+        await self.downstream({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    async def send_start(self):
+        if self.start_message is not None:
+            message, self.start_message = self.start_message, None
+            await self.downstream(message)
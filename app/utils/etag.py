@@ -0,0 +1,49 @@
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
+from app.repository.user_repository import UserRepository
+from app.utils.auth import Principal, credentials_exception, get_current_user
+
+
+def data_etag(user_id, version: int) -> str:
+    # Weak: the same data may be encoded differently. The user id keeps one
+    # user's tag from matching another's cached copy in a shared browser.
+    return f'W/"{user_id.hex}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header names etag, compared weakly (RFC 9110).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+async def revalidate(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+) -> dict:
+    """
+    Conditional GET on the user's data version, for read endpoints whose
+    response depends only on the current user's journals (and the URL).
+
+    Costs one primary key lookup. If the client's copy is current this
+    answers 304 Not Modified before the endpoint runs, otherwise it returns
+    the caching headers, which are also set on `response` for endpoints
+    that do not build their own.
+    """
+    version = await UserRepository.get_data_version(db, current_user.id)
+    if version is None:
+        raise credentials_exception
+    headers = {"ETag": data_etag(current_user.id, version), "Cache-Control": "private, no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        raise HTTPException(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return headers
@@ -0,0 +1,44 @@
+import hashlib
+import threading
+import time
+
+SENTIMENTS = ["POSITIVE", "NEGATIVE", "NEUTRAL", "MIXED"]
+
+
+class FakeComprehend:
+    """
+    Offline stand-in for the boto3 Comprehend client.
+
+    Implements detect_sentiment and batch_detect_sentiment with a fixed
+    per-call latency, and returns a label derived from a hash of the text so
+    results are stable. Records the size of every call for tests.
+    """
+
+    def __init__(self, latency: float = 0.1):
+        self.latency = latency
+        self.calls = []  # Number of documents in each call
+        self._lock = threading.Lock()
+
+    def label(self, text: str) -> str:
+        return SENTIMENTS[hashlib.sha1(text.encode()).digest()[0] % len(SENTIMENTS)]
+
+    def _call(self, documents: int):
+        with self._lock:
+            self.calls.append(documents)
+        time.sleep(self.latency)
+
+    def detect_sentiment(self, Text, LanguageCode):
+        self._call(1)
+        return {"Sentiment": self.label(Text)}
+
+    def batch_detect_sentiment(self, TextList, LanguageCode):
+        if len(TextList) > 25:
+            raise ValueError("BatchDetectSentiment accepts at most 25 documents")
+        self._call(len(TextList))
+        return {
+            "ResultList": [
+                {"Index": index, "Sentiment": self.label(text)}
+                for index, text in enumerate(TextList)
+            ],
+            "ErrorList": [],
+        }
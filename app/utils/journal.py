@@ -1,4 +1,14 @@
+import html
 import re
+from collections import Counter
+
+# Common words left out of the word frequency counts
+STOP_WORDS = {"the", "and", "is", "in", "to", "of", "a", "for", "on", "with"}
+
+# Wrapped around matched terms in search snippets by the database, then swapped
+# for <mark> tags once the rest of the snippet has been HTML-escaped
+HIGHLIGHT_START = "\x02"
+HIGHLIGHT_END = "\x03"
 
 # Helper function to clean and tokenize text
 def tokenize_and_clean(text: str) -> list:
@@ -6,3 +16,23 @@ def tokenize_and_clean(text: str) -> list:
     text = re.sub(r"[^\w\s]", "", text.lower())
     # Split into words
     return text.split()
+
+
+# Helper function to count words the same way the summaries always have
+def count_words(text: str) -> int:
+    return len(text.split()) if text else 0
+
+
+# Helper function to count the terms of an entry that feed the word frequency
+def count_terms(text: str) -> Counter:
+    if not text:
+        return Counter()
+    return Counter(word for word in tokenize_and_clean(text) if word not in STOP_WORDS)
+
+
+# Helper function to turn a database search snippet into safe HTML with <mark>ed matches
+def highlight(snippet: str) -> str:
+    if not snippet:
+        return ""
+    escaped = html.escape(snippet, quote=False)
+    return escaped.replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_END, "</mark>")
@@ -0,0 +1,117 @@
+import re
+from itertools import repeat
+import numpy as np
+from app.utils.sentiment_backends import SentimentBackend
+
+# Bump when LEXICON or the scoring rules below change, so labels cached by the old version are not reused
+LEXICON_VERSION = 1
+
+# Word valence from -3 (very negative) to 3 (very positive), everything else is 0
+LEXICON = {
+    # Positive
+    "amazing": 2.8, "awesome": 2.6, "beautiful": 2.4, "best": 2.5, "better": 1.6, "blessed": 2.3,
+    "bright": 1.2, "calm": 1.3, "celebrate": 2.3, "celebrated": 2.2, "cheerful": 2.2, "comfortable": 1.5,
+    "confident": 1.8, "content": 1.2, "delighted": 2.7, "delightful": 2.6, "enjoy": 2.0, "enjoyed": 2.0,
+    "excellent": 2.8, "excited": 2.2, "exciting": 2.2, "fantastic": 2.8, "fine": 0.8, "fun": 2.0,
+    "glad": 2.0, "good": 1.9, "grateful": 2.3, "great": 2.6, "happy": 2.7, "helpful": 1.7,
+    "hope": 1.5, "hopeful": 1.8, "joy": 2.8, "kind": 1.8, "laugh": 2.0, "laughed": 2.0,
+    "love": 3.0, "loved": 2.9, "lovely": 2.6, "lucky": 2.0, "nice": 1.8, "peaceful": 2.0,
+    "perfect": 2.7, "pleasant": 2.0, "pleased": 2.1, "productive": 1.6, "proud": 2.1, "relaxed": 1.8,
+    "relieved": 1.7, "rested": 1.4, "safe": 1.3, "satisfied": 1.8, "smile": 1.9, "smiled": 1.9,
+    "success": 2.2, "successful": 2.3, "support": 1.4, "supportive": 1.8, "thankful": 2.2, "thanks": 1.8,
+    "win": 2.2, "won": 2.2, "wonderful": 2.8, "yay": 2.4,
+    # Negative
+    "afraid": -2.0, "angry": -2.5, "annoyed": -1.8, "annoying": -1.9, "anxious": -2.0, "ashamed": -2.2,
+    "awful": -2.7, "bad": -2.3, "bored": -1.4, "boring": -1.6, "broke": -1.6, "broken": -1.8,
+    "cry": -2.0, "cried": -2.1, "depressed": -2.7, "disappointed": -2.2, "disappointing": -2.2,
+    "exhausted": -1.8, "fail": -2.2, "failed": -2.3, "failure": -2.5, "fear": -2.2, "frustrated": -2.1,
+    "frustrating": -2.1, "guilty": -1.9, "hate": -2.9, "hated": -2.8, "horrible": -2.8, "hurt": -2.2,
+    "ill": -1.8, "jealous": -1.8, "lonely": -2.1, "lost": -1.5, "mad": -2.1, "miserable": -2.8,
+    "nervous": -1.6, "pain": -2.2, "painful": -2.3, "poor": -1.8, "problem": -1.5, "regret": -2.0,
+    "sad": -2.2, "scared": -2.1, "sick": -1.9, "sorry": -1.0, "stress": -1.9, "stressed": -2.0,
+    "stressful": -2.0, "struggle": -1.8, "struggled": -1.8, "terrible": -2.8, "tired": -1.4, "ugly": -2.1,
+    "unhappy": -2.4, "upset": -2.1, "worried": -1.9, "worry": -1.8, "worse": -2.1, "worst": -2.9,
+    "wrong": -1.8,
+}
+
+# Words that flip the valence of the next few words ("not happy")
+NEGATIONS = {
+    "not", "no", "never", "nothing", "nobody", "neither", "nor", "without", "hardly", "cannot",
+    "ain't", "aren't", "can't", "couldn't", "didn't", "doesn't", "don't", "hadn't", "hasn't", "haven't",
+    "isn't", "shouldn't", "wasn't", "weren't", "won't", "wouldn't",
+    "aint", "arent", "cant", "couldnt", "didnt", "doesnt", "dont", "isnt", "wasnt", "wont", "wouldnt",
+}
+NEGATION_SCOPE = 3
+NEGATION_SCALAR = -0.74
+
+# A document is MIXED when both sides carry at least this much valence and
+# the weaker side is at least MIXED_RATIO of the stronger one
+MIXED_MIN = 1.5
+MIXED_RATIO = 0.5
+# Normalizes the valence sum into a -1..1 compound score
+NORMALIZATION_ALPHA = 15.0
+# |compound| below this is NEUTRAL
+NEUTRAL_THRESHOLD = 0.05
+
+TOKEN_PATTERN = re.compile(r"[a-z']+")
+
+
+class LexiconBackend(SentimentBackend):
+    """
+    Local, CPU-only scorer in the style of VADER: sums word valences from
+    LEXICON (flipping them after a negation) and thresholds the result into
+    Comprehend's labels.
+
+    A batch is scored in one pass: the tokens of every document are mapped to
+    ids, looked up and aggregated per document with NumPy, so large batches
+    are cheap.
+    """
+    max_batch_size = 1000
+    name = "lexicon"
+    version = LEXICON_VERSION
+
+    def __init__(self, lexicon: dict = LEXICON):
+        # Every word that matters gets an id, id 0 is any other word
+        words = sorted(set(lexicon) | NEGATIONS)
+        self.word_ids = {word: word_id for word_id, word in enumerate(words, start=1)}
+        self.valences = np.zeros(len(words) + 1)
+        self.negations = np.zeros(len(words) + 1, dtype=bool)
+        for word, word_id in self.word_ids.items():
+            self.valences[word_id] = lexicon.get(word, 0.0)
+            self.negations[word_id] = word in NEGATIONS
+
+    def detect_batch(self, texts: list) -> list:
+        if not texts:
+            return []
+
+        tokens, lengths = [], []
+        for text in texts:
+            words = TOKEN_PATTERN.findall(text.lower())
+            tokens.extend(words)
+            lengths.append(len(words))
+        doc_ids = np.repeat(np.arange(len(texts)), lengths)
+        ids = np.fromiter(map(self.word_ids.get, tokens, repeat(0)), dtype=np.intp, count=len(tokens))
+        valence = self.valences[ids]
+        is_negation = self.negations[ids]
+
+        # Flip words within NEGATION_SCOPE tokens after a negation in the same document
+        negated = np.zeros(len(tokens), dtype=bool)
+        for distance in range(1, NEGATION_SCOPE + 1):
+            negated[distance:] |= is_negation[:-distance] & (doc_ids[distance:] == doc_ids[:-distance])
+        valence = np.where(negated, valence * NEGATION_SCALAR, valence)
+
+        positive = np.bincount(doc_ids, weights=valence.clip(min=0), minlength=len(texts))
+        negative = np.bincount(doc_ids, weights=(-valence).clip(min=0), minlength=len(texts))
+        total = positive - negative
+        compound = total / np.sqrt(total * total + NORMALIZATION_ALPHA)
+        mixed = (
+            (positive >= MIXED_MIN)
+            & (negative >= MIXED_MIN)
+            & (np.minimum(positive, negative) >= MIXED_RATIO * np.maximum(positive, negative))
+        )
+        labels = np.select(
+            [mixed, compound >= NEUTRAL_THRESHOLD, compound <= -NEUTRAL_THRESHOLD],
+            ["MIXED", "POSITIVE", "NEGATIVE"],
+            "NEUTRAL",
+        )
+        return labels.tolist()
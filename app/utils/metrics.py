@@ -0,0 +1,130 @@
+import threading
+from bisect import bisect_left
+
+# Default latency buckets in seconds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """
+    Thread-safe fixed-bucket histogram of observed values.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # Last slot is +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        """
+        Return cumulative bucket counts, the total count and the sum.
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        cumulative = []
+        running = 0
+        for bound, count in zip(self.buckets + ("+Inf",), counts):
+            running += count
+            cumulative.append({"le": bound, "count": running})
+
+        return {"buckets": cumulative, "count": running, "sum": total}
+
+
+class Counter:
+    """
+    Thread-safe monotonically increasing count.
+    """
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self._value += amount
+
+    def snapshot(self) -> float:
+        with self._lock:
+            return self._value
+
+
+class MetricFamily:
+    """
+    A named metric with fixed label names and one Histogram or Counter per
+    combination of label values. Label values must come from small fixed
+    sets (route templates, methods, status codes), never from user input.
+    """
+
+    def __init__(self, name: str, help: str, kind: str, label_names=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.kind = kind
+        self.label_names = tuple(label_names)
+        self.buckets = buckets
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = Histogram(self.buckets) if self.kind == "histogram" else Counter()
+                    self._children[values] = child
+        return child
+
+    def render(self) -> list:
+        # Counter samples carry the _total suffix, as does their metadata in the 0.0.4 format
+        family = f"{self.name}_total" if self.kind == "counter" else self.name
+        lines = [f"# HELP {family} {self.help}", f"# TYPE {family} {self.kind}"]
+        with self._lock:
+            children = sorted(self._children.items())
+        for values, child in children:
+            labels = [f'{name}="{escape_label(value)}"' for name, value in zip(self.label_names, values)]
+            if self.kind == "counter":
+                lines.append(f"{family}{format_labels(labels)} {child.snapshot()}")
+                continue
+            snapshot = child.snapshot()
+            for bucket in snapshot["buckets"]:
+                le = f'le="{bucket["le"]}"'
+                lines.append(f"{self.name}_bucket{format_labels(labels + [le])} {bucket['count']}")
+            lines.append(f"{self.name}_sum{format_labels(labels)} {snapshot['sum']}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {snapshot['count']}")
+        return lines
+
+
+# Every metric served on /metrics, by name
+REGISTRY = {}
+
+
+def histogram(name: str, help: str, label_names=(), buckets=LATENCY_BUCKETS) -> MetricFamily:
+    return REGISTRY.setdefault(name, MetricFamily(name, help, "histogram", label_names, buckets))
+
+
+def counter(name: str, help: str, label_names=()) -> MetricFamily:
+    return REGISTRY.setdefault(name, MetricFamily(name, help, "counter", label_names))
+
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(labels: list) -> str:
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+def render_prometheus(families) -> str:
+    """
+    Families (anything with render()) in the Prometheus text exposition format.
+    """
+    return "\n".join(line for family in families for line in family.render()) + "\n"
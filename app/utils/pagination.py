@@ -0,0 +1,56 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from fastapi import HTTPException, Query
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """
+    Encode the (timestamp, id) sort key of the last row on a page as an opaque cursor.
+    """
+    raw = json.dumps([sort_value.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """
+    Decode a cursor produced by encode_cursor back into (timestamp, id).
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(decoded, list) or len(decoded) != 2:
+            raise ValueError("cursor is not a [timestamp, id] pair")
+        sort_value, row_id = decoded
+        if not isinstance(sort_value, str) or not isinstance(row_id, str):
+            raise ValueError("cursor fields must be strings")
+        sort_value = datetime.fromisoformat(sort_value)
+        row_id = UUID(row_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+    if sort_value.tzinfo is not None:
+        # Timestamps are stored naive, so compare in the same terms as the import does
+        sort_value = sort_value.astimezone().replace(tzinfo=None)
+    return sort_value, row_id
+
+
+class PageParams:
+    """
+    Query parameters shared by the paginated list endpoints.
+    """
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Number of entries per page"),
+        cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+        include_total: bool = Query(True, description="Count all matching entries (skip for faster pages)"),
+    ):
+        self.limit = limit
+        self.after = decode_cursor(cursor) if cursor else None
+        self.include_total = include_total
@@ -0,0 +1,169 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from fastapi import HTTPException, status
+from app import config
+from app.utils.metrics import histogram
+
+PASSWORD_SECONDS = histogram(
+    "password_bcrypt_seconds", "CPU time of one bcrypt operation in a password worker.", ("operation",),
+)
+PASSWORD_WAIT_SECONDS = histogram(
+    "password_queue_wait_seconds", "Time a password operation waited for a free worker.", ("operation",),
+)
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    """
+    The password hashing context, shared by every caller and built on first
+    use so importing the app does not load passlib and bcrypt.
+
+    New hashes use PASSWORD_BCRYPT_ROUNDS. Hashes with fewer rounds are
+    reported by needs_update so they can be upgraded on the next login.
+    """
+    from passlib.context import CryptContext
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=config.PASSWORD_BCRYPT_ROUNDS,
+        bcrypt__min_rounds=config.PASSWORD_BCRYPT_ROUNDS,
+    )
+
+
+def hash_password(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(password, hashed_password)
+
+
+def password_needs_update(hashed_password: str) -> bool:
+    # Only parses the hash, cheap enough to call on the event loop
+    return get_pwd_context().needs_update(hashed_password)
+
+
+def calibrate_bcrypt_rounds(target_seconds: float, min_rounds: int = 10, max_rounds: int = 16):
+    """
+    Time bcrypt on this host at increasing cost and return the largest rounds
+    whose hash takes at most target_seconds (never below min_rounds), along
+    with the (rounds, seconds) measured for each cost tried.
+    """
+    from passlib.hash import bcrypt
+    chosen, timings = min_rounds, []
+    for rounds in range(min_rounds, max_rounds + 1):
+        hasher = bcrypt.using(rounds=rounds)
+        # Best of two, so a scheduler hiccup does not understate the budget
+        seconds = min(timed(hasher.hash, "calibration-password") for _ in range(2))
+        timings.append((rounds, seconds))
+        if seconds > target_seconds:
+            break
+        chosen = rounds
+    return chosen, timings
+
+
+def timed(function, *args) -> float:
+    started = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - started
+
+
+def run_timed(function, *args):
+    # Runs in a worker: the result and how long producing it took
+    started = time.perf_counter()
+    return function(*args), time.perf_counter() - started
+
+
+def lower_priority(increment: int):
+    # Runs in each worker so the server process wins when they compete for CPU
+    if increment and hasattr(os, "nice"):
+        os.nice(increment)
+
+
+class PasswordPool:
+    """
+    Runs bcrypt in a small pool of worker processes, so a burst of logins
+    cannot take over the request threadpool or the server's CPU.
+
+    At most `workers` operations run at once and `max_queue` more may wait.
+    Anything beyond that is refused with 503 and Retry-After instead of
+    queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_queue: int, retry_after: int, nice: int = 0):
+        self.workers = workers
+        self.nice = nice
+        self.max_queue = max_queue
+        self.retry_after = retry_after
+        self.in_flight = 0
+        self.rejected = 0
+        self.executor = None
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            # spawn, not fork: the server process already runs threads and an event loop
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=lower_priority,
+                initargs=(self.nice,),
+            )
+        return self.executor
+
+    def ensure_capacity(self):
+        """
+        Refuse with 503 if no more password operations can be queued. Call it
+        before any other work so a refused request costs next to nothing.
+        """
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many sign-in requests, please retry shortly.",
+                headers={"Retry-After": str(self.retry_after)},
+            )
+
+    async def run(self, operation: str, function, *args):
+        self.ensure_capacity()
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            result, seconds = await asyncio.get_running_loop().run_in_executor(
+                self.get_executor(), run_timed, function, *args
+            )
+        finally:
+            self.in_flight -= 1
+        PASSWORD_SECONDS.labels(operation).observe(seconds)
+        PASSWORD_WAIT_SECONDS.labels(operation).observe(max(time.perf_counter() - started - seconds, 0.0))
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self.run("hash", hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self.run("verify", verify_password, password, hashed_password)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+            self.executor = None
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+        }
+
+
+password_pool = PasswordPool(
+    config.PASSWORD_WORKERS,
+    config.PASSWORD_MAX_QUEUE,
+    config.PASSWORD_RETRY_AFTER,
+    config.PASSWORD_NICE,
+)
@@ -0,0 +1,115 @@
+import threading
+import time
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from app.utils.metrics import REGISTRY, histogram
+
+# Pool stats keyed by the pool's logging name ("sync", "async")
+_pool_stats = {}
+_pools = {}
+_lock = threading.Lock()
+
+CHECKOUT_WAIT = histogram(
+    "db_pool_checkout_wait_seconds", "Time to check out a connection, including pre-ping and connecting.", ("pool",),
+)
+
+
+class PoolStats:
+    def __init__(self, name: str):
+        self.checkout_wait = CHECKOUT_WAIT.labels(name)
+        self.checkouts = 0
+        self.timeouts = 0
+
+
+def get_pool_stats(name: str) -> PoolStats:
+    with _lock:
+        if name not in _pool_stats:
+            _pool_stats[name] = PoolStats(name)
+        return _pool_stats[name]
+
+
+class InstrumentedPoolMixin:
+    """
+    Records how long each checkout waited for a connection, including
+    pre-ping and opening a new connection when the pool has to grow.
+
+    Stats are keyed by logging name rather than stored on the pool, because
+    Pool.recreate() builds a fresh instance after a disconnect.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats = get_pool_stats(self._orig_logging_name or "default")
+        with _lock:
+            _pools[self._orig_logging_name or "default"] = self
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._stats.timeouts += 1
+            raise
+        finally:
+            self._stats.checkout_wait.observe(time.perf_counter() - start)
+        self._stats.checkouts += 1
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_metrics() -> dict:
+    """
+    Snapshot of every instrumented pool: live gauges plus checkout wait times.
+    """
+    with _lock:
+        pools = dict(_pools)
+
+    metrics = {}
+    for name, pool in pools.items():
+        stats = get_pool_stats(name)
+        metrics[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),  # Negative while the base pool is not full yet
+            "checkouts": stats.checkouts,
+            "timeouts": stats.timeouts,
+            "checkout_wait_seconds": stats.checkout_wait.snapshot(),
+        }
+    return metrics
+
+
+# Served on /metrics next to the checkout wait histogram: (pool_metrics key, type, help)
+POOL_SERIES = (
+    ("size", "gauge", "Connections the pool keeps open."),
+    ("checked_out", "gauge", "Connections in use."),
+    ("idle", "gauge", "Open connections waiting in the pool."),
+    ("overflow", "gauge", "Connections open beyond the pool size."),
+    ("checkouts", "counter", "Connections checked out."),
+    ("timeouts", "counter", "Checkouts that gave up waiting for a connection."),
+)
+
+
+class PoolCollector:
+    """
+    Renders the live pool gauges and counters of pool_metrics() for /metrics.
+    """
+
+    def render(self) -> list:
+        metrics = pool_metrics()
+        lines = []
+        for key, kind, help in POOL_SERIES:
+            name = f"db_pool_{key}" + ("_total" if kind == "counter" else "")
+            lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}"]
+            lines += [f'{name}{{pool="{pool}"}} {values[key]}' for pool, values in metrics.items()]
+        return lines
+
+
+REGISTRY["db_pool"] = PoolCollector()
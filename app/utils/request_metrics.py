@@ -0,0 +1,147 @@
+import logging
+import reprlib
+import time
+from collections import Counter
+from contextvars import ContextVar
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app import config
+from app.utils.metrics import histogram
+
+logger = logging.getLogger(__name__)
+
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+
+REQUEST_SECONDS = histogram(
+    "http_request_duration_seconds", "Time to send the whole response, by route template.",
+    ("method", "route", "status"),
+)
+REQUEST_QUERIES = histogram(
+    "http_request_db_queries", "Database statements run while handling a request.",
+    ("route",), QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_SECONDS = histogram(
+    "http_request_db_seconds", "Time a request spent in database statements.",
+    ("route",),
+)
+QUERY_SECONDS = histogram(
+    "db_query_duration_seconds", "Time of each database statement, requests and background work alike.",
+)
+
+
+class RequestStats:
+    """
+    Database work done on behalf of the current request. With record, also
+    the text of every statement run, in order.
+    """
+    __slots__ = ("queries", "db_seconds", "statements")
+
+    def __init__(self, record: bool = False):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.statements = [] if record else None
+
+    def repeated(self, threshold: int) -> dict:
+        """
+        Statements run at least threshold times, with their counts. The same
+        SQL with different parameters, over and over, is the mark of an N+1.
+        """
+        counts = Counter(self.statements or ())
+        return {statement: count for statement, count in counts.most_common() if count >= threshold}
+
+
+# Called with (scope, stats) after every request while not empty, see tests/conftest.py
+request_observers = []
+
+
+# Stats of the request being handled, None outside of one (e.g. background workers)
+current_request_stats: ContextVar = ContextVar("current_request_stats", default=None)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._metrics_started
+    QUERY_SECONDS.labels().observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if stats.statements is not None:
+            stats.statements.append(statement)
+    if config.QUERY_DEBUG and elapsed >= config.SLOW_QUERY_SECONDS:
+        logger.warning("Slow query (%.1f ms): %s parameters=%s", elapsed * 1000, statement, reprlib.repr(parameters))
+
+
+def instrument_queries(engine):
+    """
+    Time every statement the (sync) engine runs. For an async engine pass
+    its sync_engine; the request context reaches the hooks either way.
+    """
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+
+
+def route_label(scope: Scope) -> str:
+    # The matched path template (/api/journals/{journal_id}), never the raw path
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    Records each request's latency and database work by method, route
+    template and status.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(record=config.QUERY_DEBUG or bool(request_observers))
+        token = current_request_stats.set(stats)
+        status = "500"
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_request_stats.reset(token)
+            route = route_label(scope)
+            method = scope["method"] if scope["method"] in METHODS else "OTHER"
+            REQUEST_SECONDS.labels(method, route, status).observe(elapsed)
+            REQUEST_QUERIES.labels(route).observe(stats.queries)
+            REQUEST_DB_SECONDS.labels(route).observe(stats.db_seconds)
+            if config.QUERY_DEBUG:
+                check_queries(scope, stats)
+            for observer in request_observers:
+                observer(scope, stats)
+
+
+def check_queries(scope: Scope, stats: RequestStats):
+    """
+    Log a request that went over QUERY_BUDGET or repeated a statement
+    QUERY_REPEAT_THRESHOLD times or more.
+    """
+    request = f"{scope['method']} {scope['path']}"
+    if config.QUERY_BUDGET and stats.queries > config.QUERY_BUDGET:
+        logger.warning(
+            "%s ran %d statements (budget %d, %.1f ms in the database)",
+            request, stats.queries, config.QUERY_BUDGET, stats.db_seconds * 1000,
+        )
+    for statement, count in stats.repeated(config.QUERY_REPEAT_THRESHOLD).items():
+        logger.warning("%s ran the same statement %d times, likely an N+1: %s", request, count, statement)
@@ -1,22 +1,151 @@
 
-import os
-import boto3
-from dotenv import load_dotenv
-
-# Load environment variables from .env
-load_dotenv()
-# Initialize AWS Comprehend client
-comprehend = boto3.client(
-    "comprehend",
-    aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-    aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-    region_name=os.getenv("AWS_S3_REGION_NAME")
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from functools import lru_cache
+from app import config
+from app.database import SessionLocal
+from app.repository.sentiment_repository import SentimentCacheRepository
+from app.utils.metrics import counter, histogram
+from app.utils.sentiment_backends import create_backend
+
+BACKEND_SECONDS = histogram(
+    "sentiment_backend_call_seconds", "Latency of one call to the sentiment backend (AWS Comprehend by default).",
+    ("backend", "call"),
+)
+BACKEND_ERRORS = counter(
+    "sentiment_backend_errors", "Sentiment backend calls that raised.", ("backend", "call"),
 )
 
 
+@lru_cache(maxsize=None)
+def get_backend():
+    """
+    The backend that scores anything the cache cannot answer (AWS Comprehend
+    by default), created on first use so importing the app stays cheap.
+    """
+    return create_backend(config.SENTIMENT_BACKEND)
+
+
+def call_backend(call: str, *args):
+    """
+    Call a method of the backend, timing it and counting it if it raises.
+    """
+    started = time.perf_counter()
+    try:
+        return getattr(get_backend(), call)(*args)
+    except Exception:
+        BACKEND_ERRORS.labels(config.SENTIMENT_BACKEND, call).inc()
+        raise
+    finally:
+        BACKEND_SECONDS.labels(config.SENTIMENT_BACKEND, call).observe(time.perf_counter() - started)
+
+
+def content_hash(text: str) -> str:
+    """
+    Cache key for a text: SHA-256 of its NFC form with whitespace runs collapsed.
+    """
+    normalized = " ".join(unicodedata.normalize("NFC", text).split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def backend_key() -> str:
+    """
+    Which backend's results to cache and look up, e.g. "comprehend:1", so
+    switching SENTIMENT_BACKEND never serves labels the other one computed.
+    """
+    return get_backend().cache_key
+
+
+class SentimentCache:
+    """
+    Two-tier sentiment cache: a bounded in-process LRU in front of the
+    persistent sentiment_cache table, with hit/miss counters per tier.
+    Entries are kept per backend (see backend_key).
+    """
+
+    def __init__(self, maxsize: int, persist: bool = True):
+        self.maxsize = maxsize
+        self.persist = persist
+        self.entries = OrderedDict()
+        self.counters = {"memory_hits": 0, "table_hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def get_local(self, backend: str, key: str):
+        # In-process tier only, cheap enough to call on the event loop
+        with self._lock:
+            sentiment = self.entries.get((backend, key))
+            if sentiment is not None:
+                self.entries.move_to_end((backend, key))
+                self.counters["memory_hits"] += 1
+            return sentiment
+
+    def _put_local(self, backend: str, key: str, sentiment: str):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self.entries[backend, key] = sentiment
+            self.entries.move_to_end((backend, key))
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def get_many(self, backend: str, keys) -> dict:
+        """
+        Look a backend's keys up in memory, then the table for the rest. Blocking.
+        """
+        found = {}
+        for key in set(keys):
+            sentiment = self.get_local(backend, key)
+            if sentiment is not None:
+                found[key] = sentiment
+        missing = set(keys) - found.keys()
+        if missing and self.persist:
+            with SessionLocal() as db:
+                stored = SentimentCacheRepository.get_many(db, backend, missing)
+            for key, sentiment in stored.items():
+                self._put_local(backend, key, sentiment)
+            found.update(stored)
+            with self._lock:
+                self.counters["table_hits"] += len(stored)
+        with self._lock:
+            self.counters["misses"] += len(missing - found.keys())
+        return found
+
+    def put_many(self, backend: str, sentiments: dict):
+        for key, sentiment in sentiments.items():
+            self._put_local(backend, key, sentiment)
+        if sentiments and self.persist:
+            with SessionLocal() as db:
+                SentimentCacheRepository.save_many(db, backend, sentiments)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = sum(self.counters.values())
+            hits = self.counters["memory_hits"] + self.counters["table_hits"]
+            return {
+                **self.counters,
+                "size": len(self.entries),
+                "max_size": self.maxsize,
+                "hit_ratio": hits / lookups if lookups else 0.0,
+            }
+
+
+sentiment_cache = SentimentCache(config.SENTIMENT_CACHE_SIZE, config.SENTIMENT_CACHE_PERSIST)
+
+
+def get_cached_sentiment(text):
+    """
+    The sentiment of text if it is in the in-process cache, otherwise None.
+    Never calls the database or the backend.
+    """
+    return sentiment_cache.get_local(backend_key(), content_hash(text))
+
+
 def get_sentiment(text):
     """
-    Analyze sentiment using AWS Comprehend.
+    Analyze sentiment with the configured backend, unless the content was scored before.
 
     Args:
         text (str): The input text.
@@ -27,5 +156,45 @@ def get_sentiment(text):
     if not text:
         raise ValueError("Text input is required")
 
-    response = comprehend.detect_sentiment(Text=text, LanguageCode="en")
-    return response["Sentiment"]
\ No newline at end of file
+    backend, key = backend_key(), content_hash(text)
+    cached = sentiment_cache.get_many(backend, [key])
+    if key in cached:
+        return cached[key]
+
+    sentiment = call_backend("detect", text)
+    sentiment_cache.put_many(backend, {key: sentiment})
+    return sentiment
+
+
+def get_sentiments(texts):
+    """
+    Analyze several texts, sending the backend as few batches as it allows.
+    Cached and repeated texts are not sent.
+
+    Args:
+        texts (list[str]): The input texts.
+
+    Returns:
+        list: The predicted sentiment for each text, in input order, or None
+        for a text the backend could not score.
+    """
+    if not texts:
+        return []
+
+    backend = backend_key()
+    keys = [content_hash(text) for text in texts]
+    sentiments = sentiment_cache.get_many(backend, keys)
+    # One copy of each text that still needs scoring
+    uncached = {key: text for key, text in zip(keys, texts) if key not in sentiments}
+
+    if uncached:
+        max_batch_size = get_backend().max_batch_size
+        uncached_keys = list(uncached)
+        for start in range(0, len(uncached_keys), max_batch_size):
+            chunk = uncached_keys[start:start + max_batch_size]
+            results = call_backend("detect_batch", [uncached[key] for key in chunk])
+            scored = {key: sentiment for key, sentiment in zip(chunk, results) if sentiment is not None}
+            sentiment_cache.put_many(backend, scored)
+            sentiments.update(scored)
+
+    return [sentiments.get(key) for key in keys]
@@ -0,0 +1,86 @@
+import os
+from abc import ABC, abstractmethod
+from app import config
+
+# Labels every backend returns, matching AWS Comprehend
+SENTIMENTS = ("POSITIVE", "NEGATIVE", "NEUTRAL", "MIXED")
+
+
+class SentimentBackend(ABC):
+    """
+    Labels text POSITIVE, NEGATIVE, NEUTRAL or MIXED.
+    """
+    # Most texts one detect_batch call accepts
+    max_batch_size = 25
+    # Cached labels are kept per name and version, bump the version whenever the labels could change
+    name = None
+    version = 1
+
+    @property
+    def cache_key(self) -> str:
+        return f"{self.name}:{self.version}"
+
+    def detect(self, text: str) -> str:
+        return self.detect_batch([text])[0]
+
+    @abstractmethod
+    def detect_batch(self, texts: list) -> list:
+        """
+        Label each text, in input order, with None for a text that could not be scored.
+        """
+
+
+class ComprehendBackend(SentimentBackend):
+    """
+    AWS Comprehend, or anything with the same detect_sentiment and
+    batch_detect_sentiment calls (such as FakeComprehend).
+    """
+    max_batch_size = 25  # BatchDetectSentiment limit
+    name = "comprehend"
+
+    def __init__(self, client=None):
+        # Created on first use when not given, so picking the backend (and its cache key) never loads boto3
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = comprehend_client()
+        return self._client
+
+    def detect(self, text: str) -> str:
+        return self.client.detect_sentiment(Text=text, LanguageCode="en")["Sentiment"]
+
+    def detect_batch(self, texts: list) -> list:
+        response = self.client.batch_detect_sentiment(TextList=texts, LanguageCode="en")
+        sentiments = [None] * len(texts)
+        for result in response["ResultList"]:
+            sentiments[result["Index"]] = result["Sentiment"]
+        return sentiments
+
+
+def comprehend_client():
+    if config.COMPREHEND_FAKE:
+        from app.utils.fake_comprehend import FakeComprehend
+        return FakeComprehend(latency=config.COMPREHEND_FAKE_LATENCY)
+
+    import boto3
+    return boto3.client(
+        "comprehend",
+        aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+        aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+        region_name=os.getenv("AWS_S3_REGION_NAME")
+    )
+
+
+def create_backend(name: str) -> SentimentBackend:
+    """
+    Build the backend named by SENTIMENT_BACKEND. Each backend's
+    dependencies are only imported when it is selected.
+    """
+    if name == "comprehend":
+        return ComprehendBackend()
+    if name == "lexicon":
+        from app.utils.lexicon_sentiment import LexiconBackend
+        return LexiconBackend()
+    raise ValueError(f"Unknown SENTIMENT_BACKEND {name!r}, expected 'comprehend' or 'lexicon'")
@@ -36,7 +36,51 @@ class JournalListResponse(BaseModel):
     status: str
     message: str
     data: List[JournalResponse]  # List of journals
-    total: int
+    total: Optional[int] = None  # Matching entries across all pages, None when the count was skipped
+    next_cursor: Optional[str] = None  # Pass as `cursor` to fetch the next page, None on the last page
+
+
+
+class JournalSearchResult(BaseModel):
+    id: UUID
+    title: str
+    journal_category: str
+    date_of_entry: datetime
+    sentiment: Optional[str] = None
+    rank: float  # Higher is a better match
+    snippet: str  # HTML-escaped excerpt with the matches wrapped in <mark>
+
+
+class JournalSearchResponse(BaseModel):
+    status: str
+    message: str
+    data: List[JournalSearchResult]  # Best match first
+    page: int
+    has_more: bool  # Whether page + 1 has results
+
+
+
+class JournalCalendarResponse(BaseModel):
+    status: str
+    message: str
+    year: int
+    counts: List[int]  # Entries per day, index 0 is January 1 (366 slots, the last one unused outside leap years)
+    sentiments: List[Optional[str]]  # Most common sentiment per day, None when none of its entries is scored
+
+
+
+class ImportRowError(BaseModel):
+    row: int  # 1-based position among the records (CSV header not counted)
+    error: str
+
+
+class JournalImportResponse(BaseModel):
+    status: str
+    message: str
+    imported: int
+    failed: int
+    errors: List[ImportRowError]
+    errors_truncated: bool  # More rows failed than are listed in errors
 
 
 
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, EmailStr
 from uuid import UUID  # Import UUID
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class UserCreate(BaseModel):
@@ -14,7 +14,7 @@ class UserResponse(BaseModel):
     id: UUID
     first_name: str
     last_name: str
-    email: EmailStr
+    email: str  # Registration does not validate addresses, so neither can the response
     role : str
 
     class Config:
@@ -39,21 +39,12 @@ class SummaryResponse(BaseModel):
 
 
 
-from pydantic import BaseModel
-from typing import List, Optional
-from uuid import UUID
-
-class UserResponse(BaseModel):
-    id:UUID
-    first_name: str
-    last_name: str
-    email: str
-    role: str
-
 class Metadata(BaseModel):
     page: int
     limit: int
     total_users: int
+    total_is_exact: bool = True  # False when the total is cached or estimated
+    next_cursor: Optional[str] = None
 
 class UserListResponse(BaseModel):
     status: str
@@ -0,0 +1,111 @@
+"""
+POST /api/journals/import benchmark for a running API server.
+
+Streams --rows generated journal entries as NDJSON (or CSV) in one request,
+without building the body in memory, and reports rows/sec. Compare with
+--requests single POST /api/journals/ calls for the per-entry rate. Use the
+offline Comprehend stand-in so sentiment does not depend on AWS:
+
+    COMPREHEND_FAKE=true uvicorn app.main:app
+    python -m benchmarks.bulk_import --rows 100000
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+
+from benchmarks.seed import CATEGORIES, random_content
+from benchmarks.throughput import get_token
+
+
+def generate_rows(count: int, seed: int = 42):
+    rng = random.Random(seed)
+    now = datetime.now()
+    for i in range(count):
+        yield {
+            "title": f"Imported entry {i}",
+            "content": random_content(rng),
+            "date_of_entry": (now - timedelta(seconds=rng.randint(60, 5 * 365 * 24 * 3600))).isoformat(),
+            "journal_category": rng.choice(CATEGORIES),
+        }
+
+
+async def ndjson_body(count: int, lines_per_chunk: int = 500):
+    lines = []
+    for row in generate_rows(count):
+        lines.append(json.dumps(row))
+        if len(lines) == lines_per_chunk:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def csv_body(count: int, rows_per_chunk: int = 500):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=["title", "content", "date_of_entry", "journal_category"])
+    writer.writeheader()
+    for i, row in enumerate(generate_rows(count), start=1):
+        writer.writerow(row)
+        if i % rows_per_chunk == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+BODIES = {"ndjson": (ndjson_body, "application/x-ndjson"), "csv": (csv_body, "text/csv")}
+
+
+async def time_single_posts(client, headers, requests: int) -> float:
+    rows = list(generate_rows(requests, seed=7))
+    start = time.perf_counter()
+    for row in rows:
+        (await client.post("/api/journals/", headers=headers, json=row)).raise_for_status()
+    return requests / (time.perf_counter() - start)
+
+
+async def run(args):
+    async with httpx.AsyncClient(base_url=args.url, timeout=None) as client:
+        token = await get_token(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        body, content_type = BODIES[args.format]
+        start = time.perf_counter()
+        response = await client.post(
+            "/api/journals/import",
+            content=body(args.rows),
+            headers={**headers, "Content-Type": content_type},
+        )
+        elapsed = time.perf_counter() - start
+        response.raise_for_status()
+        report = response.json()
+        print(f"format:      {args.format}")
+        print(f"imported:    {report['imported']} ({report['failed']} failed)")
+        print(f"elapsed:     {elapsed:.1f} s")
+        print(f"import rate: {report['imported'] / elapsed:.0f} rows/s")
+
+        if args.requests:
+            print(f"single POST: {await time_single_posts(client, headers, args.requests):.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", default=f"bench{uuid.uuid4().hex[:6]}@example.com")
+    parser.add_argument("--password", default="benchpassword")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--format", choices=sorted(BODIES), default="ndjson")
+    parser.add_argument("--requests", type=int, default=200, help="Single POSTs to compare with, 0 to skip")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
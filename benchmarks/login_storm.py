@@ -0,0 +1,80 @@
+"""
+Journal read latency before and during a login storm, against a running server.
+
+Readers fetch --path for --duration seconds on their own, then again while
+--logins clients log in back to back. With password hashing isolated in its
+pool, read latency should stay flat and surplus logins get 503s.
+
+    uvicorn app.main:app --port 8000
+    python -m benchmarks.login_storm --readers 8 --logins 64 --duration 10
+"""
+import argparse
+import asyncio
+import collections
+import statistics
+import time
+import uuid
+
+import httpx
+
+from benchmarks.throughput import get_token
+
+
+def percentile(latencies, fraction):
+    latencies = sorted(latencies)
+    return latencies[max(int(len(latencies) * fraction) - 1, 0)] if latencies else 0.0
+
+
+async def reader(client, path, headers, deadline, latencies):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - start)
+
+
+async def login(client, email, password, deadline, statuses):
+    while time.perf_counter() < deadline:
+        response = await client.post("/auth/user/login", json={"email": email, "password": password})
+        statuses[response.status_code] += 1
+        if response.status_code == 503:
+            await asyncio.sleep(float(response.headers.get("Retry-After", 1)))
+
+
+async def phase(client, args, headers, storm: bool):
+    latencies, statuses = [], collections.Counter()
+    deadline = time.perf_counter() + args.duration
+    tasks = [reader(client, args.path, headers, deadline, latencies) for _ in range(args.readers)]
+    if storm:
+        tasks += [login(client, args.email, args.password, deadline, statuses) for _ in range(args.logins)]
+    await asyncio.gather(*tasks)
+    return latencies, statuses
+
+
+async def run(args):
+    connections = args.readers + args.logins
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=120) as client:
+        token = await get_token(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+        for name, storm in (("quiet", False), ("login storm", True)):
+            latencies, statuses = await phase(client, args, headers, storm)
+            print(f"{name:<12} reads {len(latencies):>6}  "
+                  f"p50 {statistics.median(latencies) * 1000:>7.1f} ms  "
+                  f"p99 {percentile(latencies, 0.99) * 1000:>7.1f} ms"
+                  + (f"  logins {dict(statuses)}" if storm else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/api/journals/")
+    parser.add_argument("--email", default=f"bench{uuid.uuid4().hex[:6]}@example.com")
+    parser.add_argument("--password", default="benchpassword")
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Keyset pagination benchmark.
+
+Seeds one user with many entries, then walks every page of
+GET /api/journals/ through JournalRepository and reports how long the first,
+middle and last pages take. With keyset pagination the deep pages should
+cost the same as the first one; the OFFSET numbers are shown for contrast.
+
+    REMOTE_DATABASE_URL=postgresql://... python -m benchmarks.pagination --entries 100000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import desc
+from sqlalchemy.future import select
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models.model import Journal
+from app.repository.journal_repository import JournalRepository
+from benchmarks.seed import seed_user
+
+
+async def time_keyset_pages(user_id, limit):
+    timings = []
+    after = None
+    criteria = JournalRepository.for_user(user_id)
+    async with AsyncSessionLocal() as db:
+        while True:
+            start = time.perf_counter()
+            journals, has_more = await JournalRepository.list_page(db, criteria, limit, after)
+            timings.append(time.perf_counter() - start)
+            db.expunge_all()  # Keep the identity map from growing across pages
+            if not has_more:
+                return timings
+            after = (journals[-1].date_of_entry, journals[-1].id)
+
+
+async def time_offset_page(user_id, limit, offset):
+    async with AsyncSessionLocal() as db:
+        start = time.perf_counter()
+        await db.execute(
+            select(Journal)
+            .filter(Journal.user_id == user_id)
+            .order_by(desc(Journal.date_of_entry), desc(Journal.id))
+            .offset(offset)
+            .limit(limit)
+        )
+        return time.perf_counter() - start
+
+
+def ms(seconds):
+    return f"{seconds * 1000:7.2f} ms"
+
+
+async def run(args):
+    print(f"seeding {args.entries} entries...")
+    user_id = seed_user(args.entries)
+
+    timings = await time_keyset_pages(user_id, args.limit)
+    pages = len(timings)
+    window = max(1, pages // 20)
+    print(f"pages:            {pages} x {args.limit}")
+    print(f"keyset first:     {ms(statistics.median(timings[:window]))}")
+    print(f"keyset middle:    {ms(statistics.median(timings[pages // 2:pages // 2 + window]))}")
+    print(f"keyset last:      {ms(statistics.median(timings[-window:]))}")
+
+    for fraction in (0.0, 0.5, 0.99):
+        offset = int(args.entries * fraction)
+        print(f"offset {offset:>9}: {ms(await time_offset_page(user_id, args.limit, offset))}")
+
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
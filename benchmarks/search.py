@@ -0,0 +1,74 @@
+"""
+GET /api/journals/search benchmark.
+
+Seeds one user whose entries each carry one of --topics rare words next to the
+usual random WORDS, then times JournalSearchRepository.search for a page of
+results: a rare word (about entries / topics matches, the typical search) and
+a word almost every entry contains (the worst case, every match is ranked).
+
+    REMOTE_DATABASE_URL=postgresql://... python -m benchmarks.search --entries 1000000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from app.database import AsyncSessionLocal, async_engine
+from app.repository.search_repository import JournalSearchRepository
+from benchmarks.seed import random_content, seed_user
+
+
+def topic(number: int) -> str:
+    return f"topic{number:05d}"
+
+
+def ms(seconds):
+    return f"{seconds * 1000:7.2f} ms"
+
+
+async def time_searches(user_id, words, limit):
+    timings = []
+    async with AsyncSessionLocal() as db:
+        for word in words:
+            start = time.perf_counter()
+            await JournalSearchRepository.search(db, user_id, word, limit)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(label, timings):
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{label:<22} median {ms(statistics.median(timings))}   p95 {ms(p95)}")
+
+
+async def run(args):
+    print(f"seeding {args.entries} entries...")
+    user_id = seed_user(
+        args.entries,
+        content=lambda rng: f"{random_content(rng)} {topic(rng.randrange(args.topics))}",
+    )
+
+    rng = random.Random(7)
+    await time_searches(user_id, [topic(0)], args.limit)  # Warm up the pool and caches
+    report(
+        f"rare word (~{args.entries // args.topics} hits)",
+        await time_searches(user_id, [topic(rng.randrange(args.topics)) for _ in range(args.queries)], args.limit),
+    )
+    report("common word", await time_searches(user_id, ["coffee"] * max(1, args.queries // 10), args.limit))
+
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    parser.add_argument("--topics", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=20)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
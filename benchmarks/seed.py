@@ -0,0 +1,70 @@
+"""
+Helpers for seeding a benchmark user with many journal entries.
+
+Uses the sync engine from app.database, so REMOTE_DATABASE_URL must point at
+a scratch database.
+"""
+import random
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+
+from app.database import SessionLocal
+from app.models.model import Journal, User
+from app.repository.stats_repository import JournalStatsRepository
+from app.repository.term_repository import TermCountRepository
+from app.utils.journal import count_words
+
+CATEGORIES = ["Personal", "Work", "Travel", "Health", "Social"]
+WORDS = (
+    "today felt calm and bright until the afternoon meeting ran long "
+    "walked home through the park thinking about the trip next month "
+    "tired but grateful for friends family coffee rain work sleep"
+).split()
+
+
+def random_content(rng: random.Random, min_words: int = 40, max_words: int = 200) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words)))
+
+
+def seed_user(entries: int, batch_size: int = 5000, seed: int = 42, content=random_content) -> uuid.UUID:
+    """
+    Create a user with `entries` journals spread over the past ten years.
+
+    `content(rng)` writes each entry's text, random WORDS by default.
+    """
+    rng = random.Random(seed)
+    user_id = uuid.uuid4()
+    now = datetime.now()
+
+    with SessionLocal() as db:
+        db.execute(insert(User), [{
+            "id": user_id,
+            "first_name": "Bench",
+            "last_name": "User",
+            "email": f"bench-{user_id.hex[:8]}@example.com",
+            "password": "not-a-real-hash",
+        }])
+        for start in range(0, entries, batch_size):
+            rows = []
+            for _ in range(min(batch_size, entries - start)):
+                date_of_entry = now - timedelta(seconds=rng.randint(60, 10 * 365 * 24 * 3600))
+                text = content(rng)
+                rows.append({
+                    "id": uuid.uuid4(),
+                    "user_id": user_id,
+                    "title": "Benchmark entry",
+                    "content": text,
+                    "word_count": count_words(text),
+                    "journal_category": rng.choice(CATEGORIES),
+                    "date_of_entry": date_of_entry,
+                    "created_at": date_of_entry,
+                    "sentiment": rng.choice(["POSITIVE", "NEGATIVE", "NEUTRAL", "MIXED"]),
+                })
+            db.execute(insert(Journal), rows)
+        JournalStatsRepository.rebuild(db, user_id)
+        TermCountRepository.rebuild(db, user_id)
+        db.commit()
+
+    return user_id
@@ -0,0 +1,58 @@
+"""
+Documents/sec for each sentiment backend, scored in batches.
+
+Comprehend is replaced by FakeComprehend so the run is offline; its
+throughput is bounded by the simulated per-call latency:
+
+    python -m benchmarks.sentiment_backends --documents 20000 --comprehend-latency 0.1
+"""
+import argparse
+import random
+import time
+
+from app.utils.fake_comprehend import FakeComprehend
+from app.utils.lexicon_sentiment import LEXICON, LexiconBackend
+from app.utils.sentiment_backends import ComprehendBackend
+
+FILLER = (
+    "today work meeting family dinner walk morning evening friend call project "
+    "weather coffee read book city train home week plan"
+).split()
+
+
+def make_documents(count: int, words: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    vocabulary = FILLER * 4 + list(LEXICON) + ["not", "never"]
+    return [" ".join(rng.choice(vocabulary) for _ in range(words)) for _ in range(count)]
+
+
+def measure(backend, documents: list, batch_size: int):
+    started = time.perf_counter()
+    for start in range(0, len(documents), batch_size):
+        backend.detect_batch(documents[start:start + batch_size])
+    return len(documents) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=20000)
+    parser.add_argument("--words", type=int, default=150, help="Words per document")
+    parser.add_argument("--comprehend-latency", type=float, default=0.1, help="Seconds per fake API call")
+    parser.add_argument("--comprehend-documents", type=int, default=500)
+    args = parser.parse_args()
+
+    documents = make_documents(args.documents, args.words)
+    lexicon = LexiconBackend()
+    comprehend = ComprehendBackend(FakeComprehend(latency=args.comprehend_latency))
+
+    print(f"documents: {args.documents} x {args.words} words")
+    for batch_size in (1, 25, LexiconBackend.max_batch_size):
+        rate = measure(lexicon, documents, batch_size)
+        print(f"lexicon    batch {batch_size:>5}: {rate:>10.0f} docs/s")
+    rate = measure(comprehend, documents[:args.comprehend_documents], ComprehendBackend.max_batch_size)
+    print(f"comprehend batch {ComprehendBackend.max_batch_size:>5}: {rate:>10.0f} docs/s "
+          f"(fake, {args.comprehend_latency * 1000:.0f} ms per call)")
+
+
+if __name__ == "__main__":
+    main()
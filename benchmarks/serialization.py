@@ -0,0 +1,110 @@
+"""
+List response serialization microbenchmark.
+
+Times turning one page of journals into response bytes, per 10k rows, with
+no database or network in the measurement:
+
+- models: the previous path. JournalResponse.model_validate per ORM object,
+  FastAPI's response_model validation and encoding, stdlib json in JSONResponse.
+- rows:   the current path. Row tuples in JournalResponse field order,
+  encoded directly by journal_list_response (orjson).
+
+Rows are loaded once from an in-memory SQLite database and both outputs are
+checked to be byte-identical.
+
+    REMOTE_DATABASE_URL=sqlite:// python -m benchmarks.serialization --rows 10000
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.controllers.journal import LIST_COLUMNS, journal_list_response
+from app.models.model import Base, Journal
+from app.views.journal_schema import JournalListResponse, JournalResponse
+from benchmarks.seed import CATEGORIES, random_content
+
+MESSAGE = "Journals retrieved successfully"
+
+
+def load(count: int):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    rng = random.Random(42)
+    user_id = uuid.uuid4()
+    now = datetime.now()
+    with Session(engine) as db:
+        db.execute(insert(Journal), [{
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "title": f"Entry {i}",
+            "content": random_content(rng),
+            "journal_category": rng.choice(CATEGORIES),
+            "date_of_entry": now - timedelta(minutes=i),
+            "created_at": now - timedelta(minutes=i),
+            "sentiment": "NEUTRAL",
+            "word_count": 0,
+        } for i in range(count)])
+        journals = db.execute(select(Journal)).scalars().all()
+        db.expunge_all()
+        rows = db.execute(select(*LIST_COLUMNS)).all()
+    return journals, rows
+
+
+async def models_path(field, journals) -> bytes:
+    content = JournalListResponse(
+        status="success",
+        message=MESSAGE,
+        data=[JournalResponse.model_validate(journal) for journal in journals],
+        total=len(journals),
+        next_cursor=None,
+    )
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+async def rows_path(rows) -> bytes:
+    return journal_list_response(MESSAGE, rows, len(rows), None).body
+
+
+async def best_of(repeat, make):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await make()
+        timings.append(time.perf_counter() - start)
+    return min(timings), statistics.median(timings)
+
+
+async def run(args):
+    journals, rows = load(args.rows)
+    field = create_model_field(name="Response", type_=JournalListResponse, mode="serialization")
+    assert await models_path(field, journals) == await rows_path(rows), "outputs differ"
+
+    per = 10_000 / args.rows
+    results = {
+        "models": await best_of(args.repeat, lambda: models_path(field, journals)),
+        "rows": await best_of(args.repeat, lambda: rows_path(rows)),
+    }
+    for name, (best, median) in results.items():
+        print(f"{name:<7} best {best * per * 1000:7.1f} ms   median {median * per * 1000:7.1f} ms   per 10k rows")
+    print(f"speedup {results['models'][1] / results['rows'][1]:.1f}x (median)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
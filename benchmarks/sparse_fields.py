@@ -0,0 +1,74 @@
+"""
+Sparse fieldset benchmark.
+
+Seeds one user with many entries, then reads the first pages of
+GET /api/journals/ through the endpoint's query and encoder three ways:
+every field, a 120 character content preview, and only the fields a
+calendar or list view shows. Reports time, payload and content characters
+pulled into Python per page.
+
+    REMOTE_DATABASE_URL=postgresql://... python -m benchmarks.sparse_fields --entries 100000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.controllers.journal import FieldParams, get_journal_page, journal_list_response
+from app.database import AsyncSessionLocal, async_engine
+from app.repository.journal_repository import JournalRepository
+from app.utils.pagination import PageParams
+from benchmarks.seed import seed_user
+
+MODES = {
+    "all fields": {},
+    "preview=120": {"preview": 120},
+    "list fields": {"fields": "title,date_of_entry,journal_category,sentiment"},
+}
+
+
+async def time_pages(user_id, view: FieldParams, limit: int, pages: int):
+    timings, sizes, content_chars = [], [], []
+    criteria = JournalRepository.for_user(user_id)
+    async with AsyncSessionLocal() as db:
+        page = PageParams(limit=limit, cursor=None, include_total=False)
+        for _ in range(pages):
+            start = time.perf_counter()
+            journals, next_cursor, total = await get_journal_page(db, criteria, page, view.columns)
+            body = journal_list_response("Journals retrieved successfully", journals, total, next_cursor, None, view.fields).body
+            timings.append(time.perf_counter() - start)
+            sizes.append(len(body))
+            content_chars.append(sum(len(getattr(journal, "content", "")) for journal in journals))
+            if next_cursor is None:
+                break
+            page = PageParams(limit=limit, cursor=next_cursor, include_total=False)
+    return timings, sizes, content_chars
+
+
+async def run(args):
+    user_id = seed_user(args.entries)
+    print(f"Seeded {args.entries} entries for user {user_id}")
+    try:
+        for name, options in MODES.items():
+            view = FieldParams(fields=options.get("fields"), preview=options.get("preview"))
+            await time_pages(user_id, view, args.limit, 2)  # Warm up
+            timings, sizes, content_chars = await time_pages(user_id, view, args.limit, args.pages)
+            print(
+                f"{name:<12} median {statistics.median(timings) * 1000:7.2f} ms"
+                f"   payload {statistics.mean(sizes) / 1024:7.1f} KiB"
+                f"   content read {statistics.mean(content_chars) / 1024:7.1f} Ki chars   per page"
+            )
+    finally:
+        await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
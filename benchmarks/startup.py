@@ -0,0 +1,92 @@
+"""
+Cold start benchmark: how long `import app.main` takes in a fresh
+interpreter, and how long a fresh server takes to answer its first request.
+
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --importtime 25     # slowest imports from -X importtime
+    python -m benchmarks.startup --max-import 2.0    # exit 1 if the best import is slower
+
+The server is started with uvicorn on --port and must be able to reach its
+database (REMOTE_DATABASE_URL).
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+IMPORT_SNIPPET = "import time; t = time.perf_counter(); import app.main; print(time.perf_counter() - t)"
+
+
+def import_seconds() -> float:
+    result = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def first_response_seconds(port: int, path: str, timeout: float = 60.0) -> float:
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                httpx.get(f"http://127.0.0.1:{port}{path}", timeout=1.0)
+                return time.perf_counter() - started
+            except httpx.TransportError:
+                time.sleep(0.01)
+        raise RuntimeError(f"Server did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def importtime_breakdown(top: int):
+    """
+    Modules with the largest cumulative import time, from -X importtime.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    rows.sort(reverse=True)
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for cumulative_us, self_us, module in rows[:top]:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8031)
+    parser.add_argument("--path", default="/docs", help="Path requested as the first response")
+    parser.add_argument("--importtime", type=int, metavar="N", help="Print the N slowest imports and exit")
+    parser.add_argument("--max-import", type=float, metavar="SECONDS", help="Fail if the best import is slower")
+    args = parser.parse_args()
+
+    if args.importtime:
+        importtime_breakdown(args.importtime)
+        return
+
+    imports = [import_seconds() for _ in range(args.runs)]
+    print(f"import app.main: best {min(imports) * 1000:.0f} ms, median {statistics.median(imports) * 1000:.0f} ms")
+    responses = [first_response_seconds(args.port, args.path) for _ in range(args.runs)]
+    print(f"first response:  best {min(responses) * 1000:.0f} ms, median {statistics.median(responses) * 1000:.0f} ms")
+
+    if args.max_import is not None and min(imports) > args.max_import:
+        print(f"FAIL: import took {min(imports):.2f}s, budget is {args.max_import:.2f}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+GET /api/journals/summaries benchmark: SQL aggregation vs. the old Python passes.
+
+For each size a user is seeded, then each implementation runs in a fresh
+subprocess so its peak RSS can be measured on its own.
+
+    REMOTE_DATABASE_URL=postgresql://... python -m benchmarks.summaries --sizes 1000 10000 100000
+"""
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.future import select
+
+from app.controllers.journal import get_summaries
+from app.database import AsyncSessionLocal, async_engine
+from app.models.model import Journal
+from benchmarks.seed import seed_user
+
+
+async def legacy_summaries(db, user_id):
+    """
+    The previous implementation: load every journal, then loop in Python.
+    """
+    journals = (await db.execute(select(Journal).filter(Journal.user_id == user_id))).scalars().all()
+
+    category_distribution = {cat: 0 for cat in ["Personal", "Work", "Travel", "Health", "Social"]}
+    for journal in journals:
+        if journal.journal_category in category_distribution:
+            category_distribution[journal.journal_category] += 1
+
+    monthly_counts, daily_trend, word_count_trend = {}, {}, {}
+    entry_length_totals, entry_length_counts = {}, {}
+    for journal in journals:
+        month_key = journal.date_of_entry.strftime("%B %Y")
+        monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
+    for journal in journals:
+        day_key = journal.date_of_entry.strftime("%Y-%m-%d")
+        daily_trend[day_key] = daily_trend.get(day_key, 0) + 1
+    for journal in journals:
+        day_key = journal.date_of_entry.strftime("%Y-%m-%d")
+        word_count_trend[day_key] = word_count_trend.get(day_key, 0) + len(journal.content.split())
+    for journal in journals:
+        category = journal.journal_category
+        entry_length_totals[category] = entry_length_totals.get(category, 0) + len(journal.content.split())
+        entry_length_counts[category] = entry_length_counts.get(category, 0) + 1
+    return category_distribution, monthly_counts, daily_trend, word_count_trend
+
+
+async def sql_summaries(db, user_id):
+    return await get_summaries(db=db, current_user=SimpleNamespace(id=user_id))
+
+
+async def measure(implementation, user_id):
+    run = legacy_summaries if implementation == "legacy" else sql_summaries
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("SELECT 1"))  # Open the connection outside the timed section
+        start = time.perf_counter()
+        await run(db, user_id)
+        latency = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    await async_engine.dispose()
+    print(json.dumps({"latency": latency, "peak_rss_kb": rss_after - rss_before}))
+
+
+def run_in_subprocess(implementation, user_id):
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.summaries", "--measure", implementation, "--user", str(user_id)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--measure", choices=["legacy", "sql"])
+    parser.add_argument("--user", type=UUID)
+    args = parser.parse_args()
+
+    if args.measure:
+        asyncio.run(measure(args.measure, args.user))
+        return
+
+    print(f"{'entries':>8} {'impl':>7} {'latency':>12} {'peak RSS':>12}")
+    for size in args.sizes:
+        user_id = seed_user(size)
+        for implementation in ("legacy", "sql"):
+            result = run_in_subprocess(implementation, user_id)
+            print(f"{size:>8} {implementation:>7} {result['latency'] * 1000:>9.1f} ms "
+                  f"{result['peak_rss_kb'] / 1024:>9.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
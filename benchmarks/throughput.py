@@ -0,0 +1,84 @@
+"""
+Requests/sec benchmark for a running API server.
+
+Start the server with a fixed worker count, then point this script at it:
+
+    uvicorn app.main:app --workers 4 --port 8000
+    python -m benchmarks.throughput --email bench@example.com --password bench \
+        --path /api/journals/ --concurrency 64 --duration 20
+
+Run it once on the old commit and once on the new one with the same worker
+count and database to compare the two.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def get_token(client: httpx.AsyncClient, email: str, password: str) -> str:
+    # Register on first use, an existing account just returns 400
+    await client.post("/auth/user/register", json={
+        "first_name": "Bench",
+        "last_name": "User",
+        "email": email,
+        "password": password,
+    })
+    response = await client.post("/auth/user/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["token"]
+
+
+async def worker(client, path, headers, deadline, latencies, errors):
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(path, headers=headers)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as exc:
+            errors.append(type(exc).__name__)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=30) as client:
+        token = await get_token(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        latencies, errors = [], []
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, args.path, headers, deadline, latencies, errors)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0
+    print(f"path:        {args.path}")
+    print(f"concurrency: {args.concurrency}")
+    print(f"requests:    {len(latencies)} ({len(errors)} errors)")
+    print(f"throughput:  {len(latencies) / elapsed:.1f} req/s")
+    print(f"latency p50: {statistics.median(latencies) * 1000:.1f} ms" if latencies else "latency p50: n/a")
+    print(f"latency p99: {p99 * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/api/journals/")
+    parser.add_argument("--email", default=f"bench{uuid.uuid4().hex[:6]}@example.com")
+    parser.add_argument("--password", default="benchpassword")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+GET /api/journals/word-frequency benchmark: term-count table vs. the old
+tokenize-everything implementation.
+
+    REMOTE_DATABASE_URL=postgresql://... python -m benchmarks.word_frequency --sizes 1000 10000 100000
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import Counter
+
+from sqlalchemy.future import select
+
+from app.database import AsyncSessionLocal, async_engine
+from app.models.model import Journal
+from app.repository.term_repository import TermCountRepository
+from app.utils.journal import STOP_WORDS, tokenize_and_clean
+from benchmarks.seed import seed_user
+
+
+async def legacy_word_frequency(db, user_id):
+    """
+    The previous implementation: join all content, tokenize it and count.
+    """
+    contents = (await db.execute(select(Journal.content).filter(Journal.user_id == user_id))).scalars().all()
+    word_counts = Counter(tokenize_and_clean(" ".join(contents)))
+    filtered = {word: count for word, count in word_counts.items() if word not in STOP_WORDS}
+    return sorted(filtered.items(), key=lambda x: x[1], reverse=True)[:50]
+
+
+async def table_word_frequency(db, user_id):
+    return await TermCountRepository.top_terms(db, user_id, limit=50)
+
+
+async def time_call(run, user_id, repeat):
+    timings = []
+    async with AsyncSessionLocal() as db:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            await run(db, user_id)
+            timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+async def run(args):
+    print(f"{'entries':>8} {'legacy':>12} {'term table':>12}")
+    for size in args.sizes:
+        user_id = seed_user(size)
+        legacy = await time_call(legacy_word_frequency, user_id, args.repeat)
+        table = await time_call(table_word_frequency, user_id, args.repeat)
+        print(f"{size:>8} {legacy * 1000:>9.1f} ms {table * 1000:>9.1f} ms")
+    await async_engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
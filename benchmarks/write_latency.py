@@ -0,0 +1,82 @@
+"""
+Journal write latency benchmark for a running API server.
+
+Compares inline sentiment scoring with the background batch pipeline. Use
+the offline Comprehend stand-in so both runs see the same API latency:
+
+    COMPREHEND_FAKE=true COMPREHEND_FAKE_LATENCY=0.1 SENTIMENT_ASYNC=false uvicorn app.main:app
+    python -m benchmarks.write_latency --concurrency 16 --requests 500
+
+    COMPREHEND_FAKE=true COMPREHEND_FAKE_LATENCY=0.1 SENTIMENT_ASYNC=true uvicorn app.main:app
+    python -m benchmarks.write_latency --concurrency 16 --requests 500
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+from benchmarks.throughput import get_token
+
+
+async def worker(client, headers, queue, latencies, errors):
+    while True:
+        try:
+            i = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        start = time.perf_counter()
+        try:
+            response = await client.post("/api/journals/", headers=headers, json={
+                "title": f"Benchmark entry {i}",
+                "content": f"Benchmark journal entry {i} about work, family and the weather.",
+                "date_of_entry": "2025-03-01T10:00:00",
+                "journal_category": "Work",
+            })
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError as exc:
+            errors.append(type(exc).__name__)
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=60) as client:
+        token = await get_token(client, args.email, args.password)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        queue = asyncio.Queue()
+        for i in range(args.requests):
+            queue.put_nowait(i)
+        latencies, errors = [], []
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            worker(client, headers, queue, latencies, errors)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0
+    print(f"concurrency: {args.concurrency}")
+    print(f"writes:      {len(latencies)} ({len(errors)} errors)")
+    print(f"throughput:  {len(latencies) / elapsed:.1f} writes/s")
+    print(f"latency p50: {statistics.median(latencies) * 1000:.1f} ms" if latencies else "latency p50: n/a")
+    print(f"latency p99: {p99 * 1000:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", default=f"bench{uuid.uuid4().hex[:6]}@example.com")
+    parser.add_argument("--password", default="benchpassword")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
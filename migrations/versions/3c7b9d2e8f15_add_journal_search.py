@@ -0,0 +1,71 @@
+"""Add journal full-text search
+
+Revision ID: 3c7b9d2e8f15
+Revises: a91d3e6b5c24
+Create Date: 2026-10-18 19:12:40.551874
+
+PostgreSQL gets a generated tsvector column (title weighted above content)
+with a GIN index. Adding a stored generated column rewrites journals under an
+exclusive lock, so run it in a quiet window on large tables. SQLite gets an
+FTS5 table over journals kept in sync by triggers, filled from the existing
+rows. Same statements as JOURNAL_SEARCH_DDL in app/models/model.py.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7b9d2e8f15'
+down_revision: Union[str, None] = 'a91d3e6b5c24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute(
+            "ALTER TABLE journals ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'B')) STORED"
+        )
+        op.create_index(
+            'ix_journals_search_vector', 'journals', ['search_vector'], unique=False, postgresql_using='gin'
+        )
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE journals_fts USING fts5("
+            "title, content, content='journals', content_rowid='rowid', tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER journals_fts_insert AFTER INSERT ON journals BEGIN "
+            "INSERT INTO journals_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content); END"
+        )
+        op.execute(
+            "CREATE TRIGGER journals_fts_delete AFTER DELETE ON journals BEGIN "
+            "INSERT INTO journals_fts(journals_fts, rowid, title, content) "
+            "VALUES ('delete', old.rowid, old.title, old.content); END"
+        )
+        op.execute(
+            "CREATE TRIGGER journals_fts_update AFTER UPDATE OF title, content ON journals BEGIN "
+            "INSERT INTO journals_fts(journals_fts, rowid, title, content) "
+            "VALUES ('delete', old.rowid, old.title, old.content); "
+            "INSERT INTO journals_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content); END"
+        )
+        op.execute("INSERT INTO journals_fts(journals_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_journals_search_vector', table_name='journals')
+        op.drop_column('journals', 'search_vector')
+    elif dialect == 'sqlite':
+        for trigger in ('journals_fts_insert', 'journals_fts_delete', 'journals_fts_update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        op.execute("DROP TABLE IF EXISTS journals_fts")
@@ -0,0 +1,40 @@
+"""Add per-user journal indexes
+
+Revision ID: 5b2f0c7d9e41
+Revises: 349f4ef704fa
+Create Date: 2026-10-18 10:12:04.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2f0c7d9e41'
+down_revision: Union[str, None] = '349f4ef704fa'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_journals_user_id_date_of_entry',
+        'journals',
+        ['user_id', sa.text('date_of_entry DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_journals_user_id_category_date_of_entry',
+        'journals',
+        ['user_id', 'journal_category', sa.text('date_of_entry DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_journals_user_id_category_date_of_entry', table_name='journals')
+    op.drop_index('ix_journals_user_id_date_of_entry', table_name='journals')
@@ -0,0 +1,42 @@
+"""Key sentiment_cache by backend
+
+Revision ID: 7d3f5a1c9e62
+Revises: f4c19a7e2b30
+Create Date: 2026-10-18 22:41:09.524310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3f5a1c9e62'
+down_revision: Union[str, None] = 'f4c19a7e2b30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows do not say which backend scored them, so the cache starts over
+    op.drop_table('sentiment_cache')
+    op.create_table('sentiment_cache',
+    sa.Column('backend', sa.String(length=32), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('sentiment', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('backend', 'content_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sentiment_cache')
+    op.create_table('sentiment_cache',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('sentiment', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('content_hash')
+    )
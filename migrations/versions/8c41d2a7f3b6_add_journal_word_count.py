@@ -0,0 +1,50 @@
+"""Add journals.word_count
+
+Revision ID: 8c41d2a7f3b6
+Revises: 5b2f0c7d9e41
+Create Date: 2026-10-18 11:03:27.540116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d2a7f3b6'
+down_revision: Union[str, None] = '5b2f0c7d9e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('journals', sa.Column('word_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill with the same rule as str.split(): runs of whitespace separate words
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute(
+            r"""
+            UPDATE journals
+            SET word_count = array_length(
+                regexp_split_to_array(regexp_replace(content, '^\s+|\s+$', '', 'g'), '\s+'), 1
+            )
+            WHERE content ~ '\S'
+            """
+        )
+    else:
+        journals = sa.table('journals', sa.column('id', sa.UUID()), sa.column('content'), sa.column('word_count'))
+        rows = bind.execute(sa.select(journals.c.id, journals.c.content)).all()
+        for journal_id, content in rows:
+            bind.execute(
+                journals.update()
+                .where(journals.c.id == journal_id)
+                .values(word_count=len((content or '').split()))
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('journals', 'word_count')
@@ -0,0 +1,28 @@
+"""Add users (created_at, id) index
+
+Revision ID: a91d3e6b5c24
+Revises: 7d3f5a1c9e62
+Create Date: 2026-10-18 18:21:05.402317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a91d3e6b5c24'
+down_revision: Union[str, None] = '7d3f5a1c9e62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_users_created_at_id', 'users', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_created_at_id', table_name='users')
@@ -0,0 +1,59 @@
+"""Add journal_daily_stats rollup
+
+Revision ID: b7e3f19a24c8
+Revises: 8c41d2a7f3b6
+Create Date: 2026-10-18 12:26:51.902334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3f19a24c8'
+down_revision: Union[str, None] = '8c41d2a7f3b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('journal_daily_stats',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('category', sa.String(), nullable=False),
+    sa.Column('entry_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('word_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('positive_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('negative_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('neutral_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('mixed_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'day', 'category')
+    )
+
+    # Backfill from existing journals (same query as `python -m app.cli rebuild-daily-stats`)
+    op.execute(
+        """
+        INSERT INTO journal_daily_stats (
+            user_id, day, category, entry_count, word_count,
+            positive_count, negative_count, neutral_count, mixed_count
+        )
+        SELECT
+            user_id, date(date_of_entry), journal_category, count(*), coalesce(sum(word_count), 0),
+            sum(CASE WHEN sentiment = 'POSITIVE' THEN 1 ELSE 0 END),
+            sum(CASE WHEN sentiment = 'NEGATIVE' THEN 1 ELSE 0 END),
+            sum(CASE WHEN sentiment = 'NEUTRAL' THEN 1 ELSE 0 END),
+            sum(CASE WHEN sentiment = 'MIXED' THEN 1 ELSE 0 END)
+        FROM journals
+        WHERE date_of_entry IS NOT NULL
+        GROUP BY user_id, date(date_of_entry), journal_category
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('journal_daily_stats')
@@ -0,0 +1,44 @@
+"""Add user_term_counts
+
+Revision ID: d2a86e5c0f17
+Revises: b7e3f19a24c8
+Create Date: 2026-10-18 13:40:12.663190
+
+Term counts are computed in Python, so existing journals are backfilled
+separately with `python -m app.cli rebuild-term-counts`.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a86e5c0f17'
+down_revision: Union[str, None] = 'b7e3f19a24c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_term_counts',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('term', sa.String(), nullable=False),
+    sa.Column('frequency', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'term')
+    )
+    op.create_index(
+        'ix_user_term_counts_user_id_frequency',
+        'user_term_counts',
+        ['user_id', sa.text('frequency DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_term_counts_user_id_frequency', table_name='user_term_counts')
+    op.drop_table('user_term_counts')
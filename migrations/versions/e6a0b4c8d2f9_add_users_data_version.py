@@ -0,0 +1,28 @@
+"""Add users.data_version
+
+Revision ID: e6a0b4c8d2f9
+Revises: 3c7b9d2e8f15
+Create Date: 2026-10-18 20:05:31.311529
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a0b4c8d2f9'
+down_revision: Union[str, None] = '3c7b9d2e8f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('data_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'data_version')
@@ -0,0 +1,33 @@
+"""Add sentiment_cache
+
+Revision ID: f4c19a7e2b30
+Revises: d2a86e5c0f17
+Create Date: 2026-10-18 15:02:47.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c19a7e2b30'
+down_revision: Union[str, None] = 'd2a86e5c0f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sentiment_cache',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('sentiment', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('content_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sentiment_cache')
@@ -0,0 +1,64 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import update
+from app.database import SessionLocal
+from app.models.model import User
+from app.repository.user_repository import prefix_upper_bound
+
+
+def register(client, first_name, email):
+    client.post("/auth/user/register", json={
+        "first_name": first_name, "last_name": "Listed", "email": email, "password": "password123",
+    })
+
+
+def test_cursor_pages_and_prefix_search(client, auth_headers):
+    run = uuid.uuid4().hex[:8]
+    for i in range(5):
+        register(client, f"Zed{run}{i}", f"zed{run}{i}@example.com")
+    # Fixed timestamps, two of them equal so the id tie-break is exercised
+    with SessionLocal() as db:
+        for i in range(5):
+            db.execute(
+                update(User)
+                .filter(User.email == f"zed{run}{i}@example.com")
+                .values(created_at=datetime(2025, 1, 1, 0, 0, min(i, 3)))
+            )
+        db.commit()
+    headers = auth_headers("admin", role="admin")
+
+    # Lowercase search still matches the capitalized first names
+    seen, cursor = [], None
+    while True:
+        params = {"search": f"zed{run}", "limit": 2, "exact": True}
+        if cursor:
+            params["cursor"] = cursor
+        body = client.get("/auth/admin/all-users", headers=headers, params=params).json()
+        seen += [user["first_name"] for user in body["data"]]
+        assert body["metadata"]["total_users"] == 5
+        assert body["metadata"]["total_is_exact"] is True
+        cursor = body["metadata"]["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == [f"Zed{run}{i}" for i in range(5)]
+    assert seen[:3] == [f"Zed{run}{i}" for i in range(3)]
+    assert "password" not in body["data"][0]
+
+    # Without exact=true the total is reused from the cache
+    body = client.get("/auth/admin/all-users", headers=headers, params={"search": f"zed{run}"}).json()
+    assert body["metadata"] == {**body["metadata"], "total_users": 5, "total_is_exact": False}
+
+
+def test_prefix_search_ending_in_the_last_code_point(client, auth_headers):
+    assert prefix_upper_bound("ab\U0010FFFF") == "ac"
+    assert prefix_upper_bound("\U0010FFFF\U0010FFFF") is None
+
+    run = uuid.uuid4().hex[:8]
+    register(client, f"Max{run}\U0010FFFF", f"max{run}@example.com")
+    headers = auth_headers("admin", role="admin")
+    for search in [f"Max{run}\U0010FFFF", "\U0010FFFF"]:
+        response = client.get("/auth/admin/all-users", headers=headers, params={"search": search, "exact": True})
+        assert response.status_code == 200
+    body = client.get("/auth/admin/all-users", headers=headers, params={"search": f"Max{run}\U0010FFFF"}).json()
+    assert [user["email"] for user in body["data"]] == [f"max{run}@example.com"]
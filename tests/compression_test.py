@@ -0,0 +1,84 @@
+import asyncio
+import gzip
+import zlib
+import pytest
+from starlette.responses import PlainTextResponse, Response, StreamingResponse
+from app.utils.compression import CompressionMiddleware, negotiate
+
+BODY = b'{"title": "Entry", "content": "A calm walk by the lake"}' * 100
+
+
+def call(response: Response, accept_encoding: str = "gzip", minimum_size: int = 1000):
+    """
+    Run one request through the middleware, returning the start message and the body messages.
+    """
+    async def app(scope, receive, send):
+        await response(scope, receive, send)
+
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()  # Never disconnects
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/", "query_string": b"",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    }
+    asyncio.run(CompressionMiddleware(app, minimum_size=minimum_size)(scope, receive, send))
+    start, *bodies = messages
+    return {key.decode(): value.decode() for key, value in start["headers"]}, bodies
+
+
+def test_negotiation():
+    assert negotiate("gzip, deflate, br", ["br", "gzip"]) == "br"
+    assert negotiate("gzip;q=1.0, br;q=0.5", ["br", "gzip"]) == "gzip"
+    assert negotiate("br;q=0, *", ["br", "gzip"]) == "gzip"
+    assert negotiate("identity", ["br", "gzip"]) is None
+    assert negotiate("", ["br", "gzip"]) is None
+
+
+def test_gzip_whole_response():
+    headers, [body] = call(Response(BODY, media_type="application/json"))
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert int(headers["content-length"]) == len(body["body"]) < len(BODY) // 5
+    assert gzip.decompress(body["body"]) == BODY
+
+
+def test_small_excluded_and_unaccepted_responses_are_sent_as_is():
+    for response, accept_encoding in [
+        (PlainTextResponse("short"), "gzip"),
+        (Response(BODY, media_type="application/vnd.apache.parquet"), "gzip"),
+        (Response(BODY, media_type="application/json"), "gzip;q=0"),
+    ]:
+        headers, bodies = call(response, accept_encoding)
+        assert "content-encoding" not in headers
+        assert b"".join(body["body"] for body in bodies) == response.body
+
+
+def test_streamed_response_is_compressed_chunk_by_chunk():
+    chunks = [BODY, BODY[::-1], BODY]
+    headers, bodies = call(StreamingResponse(iter(chunks), media_type="text/csv"))
+    assert headers["content-encoding"] == "gzip"
+    assert "content-length" not in headers
+
+    # Each message decodes to its own chunk as soon as it arrives
+    decompressor = zlib.decompressobj(31)
+    received = [decompressor.decompress(body["body"]) for body in bodies]
+    assert received[:3] == chunks
+    assert b"".join(received) == b"".join(chunks)
+    assert decompressor.eof
+
+
+def test_brotli_preferred_when_installed():
+    brotli = pytest.importorskip("brotli")
+    headers, [body] = call(Response(BODY, media_type="application/json"), "gzip, deflate, br")
+    assert headers["content-encoding"] == "br"
+    assert brotli.decompress(body["body"]) == BODY
@@ -1,5 +1,156 @@
 import sys
 import os
+import time
+import uuid
+from contextlib import contextmanager
+import pytest
 
 # Add the `app/` directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../app")))
+
+
+@pytest.fixture(scope="session")
+def db_schema():
+    """
+    Create any missing tables in the test database (REMOTE_DATABASE_URL).
+    """
+    from app.database import engine
+    from app.models.model import Base
+    Base.metadata.create_all(engine)
+
+
+@pytest.fixture
+def fake_sentiment(monkeypatch):
+    """
+    Score sentiment with an instant FakeComprehend instead of AWS. Returns
+    the fake, for its labels and call sizes.
+    """
+    from app.utils import sentiment
+    from app.utils.fake_comprehend import FakeComprehend
+    from app.utils.sentiment_backends import ComprehendBackend
+
+    fake = FakeComprehend(latency=0)
+    monkeypatch.setattr(sentiment, "get_backend", lambda: ComprehendBackend(fake))
+    return fake
+
+
+@pytest.fixture
+def inline_sentiment(fake_sentiment, monkeypatch):
+    """
+    fake_sentiment, scored inline on each write, so no background result
+    changes a journal mid-test. Request it before client.
+    """
+    from app import config
+    monkeypatch.setattr(config, "SENTIMENT_ASYNC", False)
+    return fake_sentiment
+
+
+@pytest.fixture
+def client(db_schema):
+    """
+    A TestClient with the app started and no dependency overrides. Settings
+    read at startup (such as inline_sentiment) must be requested before it.
+    """
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    app.dependency_overrides.clear()
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def auth_headers(client):
+    """
+    Register and log in a new user, returning its Authorization header:
+
+        headers = auth_headers("etag")
+        admin = auth_headers("etag", role="admin")
+    """
+    def login(prefix: str = "test", role: str = "user") -> dict:
+        email = f"{prefix}-{uuid.uuid4().hex[:8]}@example.com"
+        client.post(f"/auth/{role}/register", json={
+            "first_name": prefix.capitalize(), "last_name": "Test", "email": email, "password": "password123",
+        })
+        token = client.post(f"/auth/{role}/login", json={"email": email, "password": "password123"}).json()["token"]
+        return {"Authorization": f"Bearer {token}"}
+
+    return login
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Fail the test if any request made inside the block runs more than
+    `limit` database statements, listing what it ran:
+
+        with max_queries(3):
+            client.get("/api/journals/", headers=headers)
+    """
+    from app.utils.request_metrics import request_observers
+
+    @contextmanager
+    def budget(limit: int):
+        over = []
+
+        def observe(scope, stats):
+            if stats.queries > limit:
+                over.append((f"{scope['method']} {scope['path']}", stats.statements))
+
+        request_observers.append(observe)
+        try:
+            yield
+        finally:
+            request_observers.remove(observe)
+        assert not over, "\n\n".join(
+            f"{request} ran {len(statements)} statements (limit {limit}):\n" + "\n".join(statements)
+            for request, statements in over
+        )
+
+    return budget
+
+
+@pytest.fixture
+def recorded_statements():
+    """
+    Record the SQL of every statement run inside the block, in order:
+
+        with recorded_statements() as statements:
+            client.get("/api/journals/", headers=headers)
+    """
+    from sqlalchemy import event
+    from app.database import async_engine
+
+    @contextmanager
+    def record():
+        statements = []
+
+        def record_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_engine.sync_engine, "before_cursor_execute", record_statement)
+        try:
+            yield statements
+        finally:
+            event.remove(async_engine.sync_engine, "before_cursor_execute", record_statement)
+
+    return record
+
+
+@pytest.fixture
+def scored_journals(client):
+    """
+    Wait (up to five seconds) for the background workers to score a user's
+    journals, returning the last list read:
+
+        journals = scored_journals(headers)
+    """
+    def wait(headers: dict) -> list:
+        for _ in range(100):
+            journals = client.get("/api/journals/", headers=headers).json()["data"]
+            if all(journal["sentiment"] != "PENDING" for journal in journals):
+                break
+            time.sleep(0.05)
+        return journals
+
+    return wait
@@ -0,0 +1,15 @@
+from app import config
+
+INTERNAL_PATHS = ["/internal/pool", "/internal/sentiment-cache", "/internal/principal-cache", "/internal/password-pool"]
+
+
+def test_internal_stats_need_an_admin_or_the_internal_token(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(config, "INTERNAL_TOKEN", "scrape-secret")
+    user = auth_headers("internal")
+    admin = auth_headers("internal", role="admin")
+    for path in INTERNAL_PATHS:
+        assert client.get(path).status_code == 403
+        assert client.get(path, headers={"Authorization": "Bearer wrong"}).status_code == 401
+        assert client.get(path, headers=user).status_code == 403
+        assert client.get(path, headers=admin).status_code == 200
+        assert client.get(path, headers={"Authorization": "Bearer scrape-secret"}).status_code == 200
@@ -0,0 +1,31 @@
+from app.utils import sentiment
+from app.utils.lexicon_sentiment import LexiconBackend
+
+
+def test_calendar_counts_and_dominant_sentiment(inline_sentiment, client, auth_headers, recorded_statements, monkeypatch):
+    monkeypatch.setattr(sentiment, "get_backend", lambda: LexiconBackend())
+    headers = auth_headers("calendar")
+
+    for date_of_entry, category, content in [
+        ("2024-01-01T08:00:00", "Work", "A happy wonderful day"),
+        ("2024-01-01T20:00:00", "Personal", "Great fun with friends"),
+        ("2024-01-01T21:00:00", "Health", "Tired and sad"),
+        ("2024-12-31T10:00:00", "Travel", "An awful terrible flight"),
+        ("2023-12-31T10:00:00", "Travel", "Last year, not counted"),
+    ]:
+        client.post("/api/journals/", headers=headers, json={
+            "title": "Entry", "content": content, "date_of_entry": date_of_entry, "journal_category": category,
+        })
+
+    with recorded_statements() as statements:
+        response = client.get("/api/journals/calendar", headers=headers, params={"year": 2024})
+    body = response.json()
+    assert response.status_code == 200
+    assert len(body["counts"]) == len(body["sentiments"]) == 366
+    assert {slot: count for slot, count in enumerate(body["counts"]) if count} == {0: 3, 365: 1}
+    assert {slot: label for slot, label in enumerate(body["sentiments"]) if label} == {0: "POSITIVE", 365: "NEGATIVE"}
+    # One grouped read of the rollup, journals untouched
+    reads = [statement for statement in statements if "FROM journal" in statement]
+    assert len(reads) == 1 and "FROM journal_daily_stats" in reads[0]
+
+    assert client.get("/api/journals/calendar", headers=headers, params={"year": 1800}).status_code == 400
@@ -0,0 +1,43 @@
+READ_PATHS = ["/api/journals/", "/api/journals/summaries", "/api/journals/word-frequency"]
+
+
+def test_unchanged_reads_revalidate_with_304(inline_sentiment, client, auth_headers, recorded_statements):
+    headers = auth_headers("etag")
+    entry = {"title": "First", "content": "A calm day", "date_of_entry": "2025-03-01T10:00:00",
+             "journal_category": "Work"}
+    journal_id = client.post("/api/journals/", headers=headers, json=entry).json()["data"]["id"]
+
+    etags = {}
+    for path in READ_PATHS:
+        response = client.get(path, headers=headers)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, no-cache"
+        etags[path] = response.headers["etag"]
+        assert etags[path].startswith('W/"')
+    assert len(set(etags.values())) == 1
+
+    # An unchanged dashboard costs one query per endpoint and sends no body
+    for path in READ_PATHS:
+        with recorded_statements() as statements:
+            response = client.get(path, headers={**headers, "If-None-Match": etags[path]})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etags[path]
+        assert len(statements) == 1
+
+    # Another user's tag never matches
+    other = auth_headers("etag-other")
+    assert client.get(READ_PATHS[0], headers={**other, "If-None-Match": etags[READ_PATHS[0]]}).status_code == 200
+
+    # Every write moves the version on
+    seen = {etags[READ_PATHS[0]]}
+    for write in (
+        lambda: client.post("/api/journals/", headers=headers, json={**entry, "title": "Second"}),
+        lambda: client.put(f"/api/journals/{journal_id}", headers=headers, json={**entry, "title": "Renamed"}),
+        lambda: client.delete(f"/api/journals/{journal_id}", headers=headers),
+    ):
+        assert write().status_code == 200
+        response = client.get(READ_PATHS[0], headers={**headers, "If-None-Match": ", ".join(seen)})
+        assert response.status_code == 200
+        seen.add(response.headers["etag"])
+    assert len(seen) == 4
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import insert
+from app.database import SessionLocal
+from app.models.model import Journal, User
+
+EXPORT_ROWS = 500_000
+# Peak RSS an export may add on top of the loaded app, whatever the row count
+RSS_CEILING_MB = 100
+
+
+def test_export_formats_and_date_range(fake_sentiment, client, auth_headers):
+    headers = auth_headers("export")
+    body = "\n".join(json.dumps({
+        "title": f"Day {day}", "content": f'Entry, "quoted" {day}\nsecond line',
+        "date_of_entry": f"2024-06-{day:02d}T12:00:00", "journal_category": "Personal",
+    }) for day in range(1, 11))
+    client.post("/api/journals/import", content=body, headers={**headers, "Content-Type": "application/x-ndjson"})
+
+    params = {"start": "2024-06-03", "end": "2024-06-05"}
+    response = client.get("/api/journals/export", headers=headers, params=params)
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == ["Day 3", "Day 4", "Day 5"]
+    assert rows[0]["content"] == 'Entry, "quoted" 3\nsecond line'
+
+    assert client.get("/api/journals/export", headers=headers, params={"format": "xml"}).status_code == 400
+
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+    response = client.get("/api/journals/export", headers=headers, params={**params, "format": "parquet"})
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.column("title").to_pylist() == ["Day 3", "Day 4", "Day 5"]
+    response = client.get("/api/journals/export", headers=headers, params={"format": "arrow"})
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.num_rows == 10 and table.column("date_of_entry").type == pa.timestamp("us")
+
+
+def journal_id():
+    # SQLite gives the UUID columns NUMERIC affinity, so a hex id that reads as
+    # a number (digits and at most one "e") would be stored as a REAL
+    while True:
+        value = uuid.uuid4()
+        try:
+            float(value.hex)
+        except ValueError:
+            return value
+
+
+@pytest.fixture(scope="module")
+def large_user(db_schema):
+    user_id = uuid.uuid4()
+    start = datetime(2015, 1, 1)
+    with SessionLocal() as db:
+        db.execute(insert(User), [{
+            "id": user_id, "first_name": "Large", "last_name": "Export",
+            "email": f"large-{user_id.hex[:8]}@example.com", "password": "not-a-real-hash",
+        }])
+        for offset in range(0, EXPORT_ROWS, 10_000):
+            db.execute(insert(Journal), [{
+                "id": journal_id(), "user_id": user_id, "title": f"Entry {i}",
+                "content": f"Entry {i} written for the export memory test, long enough to matter.",
+                "journal_category": "Work", "date_of_entry": start + timedelta(minutes=i),
+                "sentiment": "NEUTRAL", "word_count": 12,
+            } for i in range(offset, offset + 10_000)])
+        db.commit()
+    return user_id
+
+
+# Runs one export in a fresh interpreter and reports its peak RSS above the
+# loaded app. VmHWM is used because ru_maxrss carries over the parent's RSS.
+EXPORT_SCRIPT = """
+import asyncio, sys, uuid
+from app.database import async_engine
+from app.services.export_service import ARROW_FORMATS, export_journals
+format, user_id = sys.argv[1], uuid.UUID(sys.argv[2])
+if format in ARROW_FORMATS:
+    import pyarrow.parquet
+
+def memory_kb(field):
+    with open("/proc/self/status") as status:
+        return next(int(line.split()[1]) for line in status if line.startswith(field + ":"))
+
+baseline_kb = memory_kb("VmRSS")
+
+async def main():
+    size = 0
+    try:
+        async for chunk in export_journals(user_id, format):
+            size += len(chunk)
+    finally:
+        await async_engine.dispose()
+    return size
+
+size = asyncio.run(main())
+print(size, (memory_kb("VmHWM") - baseline_kb) // 1024)
+"""
+
+
+@pytest.mark.parametrize("format", ["csv", "parquet"])
+def test_large_export_memory_stays_flat(large_user, format):
+    if format == "parquet":
+        pytest.importorskip("pyarrow")
+    output = subprocess.run(
+        [sys.executable, "-c", EXPORT_SCRIPT, format, str(large_user)],
+        capture_output=True, text=True, check=True,
+    ).stdout.split()
+    size, growth_mb = int(output[-2]), int(output[-1])
+    assert size > EXPORT_ROWS * 20
+    assert growth_mb < RSS_CEILING_MB
@@ -0,0 +1,34 @@
+from app.views.journal_schema import JournalResponse
+
+
+def test_sparse_fields_and_preview(inline_sentiment, client, auth_headers, recorded_statements):
+    headers = auth_headers("fields")
+
+    for day in range(1, 4):
+        client.post("/api/journals/", headers=headers, json={
+            "title": f"Day {day}", "content": f"Café day {day} " + "long text " * 50,
+            "date_of_entry": f"2025-03-0{day}T10:00:00", "journal_category": "Travel",
+        })
+
+    with recorded_statements() as statements:
+        response = client.get("/api/journals/", headers=headers, params={
+            "fields": "sentiment, title,date_of_entry", "limit": 2, "include_total": False,
+        })
+    body = response.json()
+    assert [list(journal) for journal in body["data"]] == [["title", "date_of_entry", "sentiment"]] * 2
+    assert [journal["title"] for journal in body["data"]] == ["Day 3", "Day 2"]
+    page_query = next(statement for statement in statements if "FROM journals" in statement)
+    assert "content" not in page_query
+
+    # The cursor works without id in the fields
+    response = client.get("/api/journals/", headers=headers, params={
+        "fields": "title", "limit": 2, "cursor": body["next_cursor"],
+    })
+    assert response.json()["data"] == [{"title": "Day 1"}]
+
+    response = client.get("/api/journals/by-category/Travel", headers=headers, params={"preview": 8})
+    data = response.json()["data"]
+    assert [journal["content"] for journal in data] == ["Café day"] * 3
+    assert list(data[0]) == list(JournalResponse.model_fields)
+
+    assert client.get("/api/journals/", headers=headers, params={"fields": "title,password"}).status_code == 400
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import uuid
+from collections import Counter, defaultdict
+from app import config
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.model import Journal, JournalDailyStats
+from app.repository.journal_repository import JournalRepository
+from app.repository.stats_repository import COUNT_COLUMNS, SENTIMENT_COLUMNS
+from app.services.import_service import import_journals
+from app.services.sentiment_service import sentiment_queue
+
+
+def test_ndjson_and_csv_import(fake_sentiment, client, auth_headers, scored_journals, monkeypatch):
+    monkeypatch.setattr(config, "IMPORT_BATCH_SIZE", 3)
+    run = uuid.uuid4().hex[:8]
+    headers = auth_headers("import")
+
+    rows = [
+        {"title": f"Entry {i}", "content": f"imported {run} entry {i}",
+         "date_of_entry": f"2024-05-0{i % 3 + 1}T08:00:00", "journal_category": "Work"}
+        for i in range(7)
+    ]
+    lines = [json.dumps(row) for row in rows]
+    lines.insert(2, "{not json")
+    lines.insert(5, json.dumps({"title": "No content", "date_of_entry": "2024-05-01T08:00:00"}))
+    lines.insert(6, json.dumps({**rows[0], "date_of_entry": "2999-01-01T00:00:00"}))
+    # Chunks split mid-line, as a real upload would be
+    body = ("\n".join(lines) + "\n").encode()
+    chunks = (body[i:i + 50] for i in range(0, len(body), 50))
+    report = client.post(
+        "/api/journals/import", content=chunks, headers={**headers, "Content-Type": "application/x-ndjson"},
+    ).json()
+    assert report["imported"] == 7 and report["failed"] == 3
+    assert [error["row"] for error in report["errors"]] == [3, 6, 7]
+    assert "content" in report["errors"][1]["error"]
+
+    csv_body = (
+        "title,content,date_of_entry,journal_category\r\n"
+        f'Quoted,"spans\r\ntwo lines, {run}",2024-05-01T09:00:00,Personal\r\n'
+        "Short row,only two\r\n"
+    )
+    report = client.post(
+        "/api/journals/import", content=csv_body, headers={**headers, "Content-Type": "text/csv"},
+    ).json()
+    assert report["imported"] == 1 and report["errors"][0]["row"] == 2
+
+    response = client.post("/api/journals/import", content="x", headers={**headers, "Content-Type": "text/plain"})
+    assert response.status_code == 415
+
+    # Rollup, term counts and search include the imported rows
+    summaries = client.get("/api/journals/summaries", headers=headers).json()
+    assert summaries["category_distribution"]["Work"] == 7
+    assert summaries["category_distribution"]["Personal"] == 1
+    terms = client.get("/api/journals/word-frequency", headers=headers).json()["word_frequency"]
+    assert {"text": "imported", "value": 7} in terms
+    hits = client.get("/api/journals/search", headers=headers, params={"q": "spans"}).json()["data"]
+    assert len(hits) == 1
+
+    # Sentiment is scored in the background
+    journals = scored_journals(headers)
+    assert all(journal["sentiment"] == fake_sentiment.label(journal["content"]) for journal in journals)
+    assert len(journals) == 8
+
+
+def test_stray_quote_and_long_lines_fail_without_buffering(fake_sentiment, client, auth_headers, monkeypatch):
+    monkeypatch.setattr(config, "IMPORT_MAX_RECORD_LENGTH", 500)
+    headers = auth_headers("import")
+    rows = [f"Row {i},fine {i},2024-05-01T08:00:00,Work" for i in range(30)]
+    csv_body = "\n".join(
+        ["title,content,date_of_entry,journal_category", 'Stray,"never closed,2024-05-01T08:00:00,Work'] + rows
+    )
+    # Sent in small chunks, the way a large upload arrives
+    chunks = (csv_body.encode()[i:i + 64] for i in range(0, len(csv_body), 64))
+    report = client.post("/api/journals/import", content=chunks, headers={**headers, "Content-Type": "text/csv"}).json()
+    # The stray quote swallows rows up to the limit, then parsing picks up again
+    assert report["errors"][0] == {"row": 1, "error": "Record longer than 500 characters, check for an unbalanced quote"}
+    assert report["failed"] == 1 and 0 < report["imported"] < 30
+
+    ndjson_body = "\n".join([
+        json.dumps({"title": "Long", "content": "x" * 2000, "date_of_entry": "2024-05-01T08:00:00"}),
+        json.dumps({"title": "Short", "content": "fits", "date_of_entry": "2024-05-01T08:00:00",
+                    "journal_category": "Work"}),
+    ])
+    chunks = (ndjson_body.encode()[i:i + 64] for i in range(0, len(ndjson_body), 64))
+    report = client.post(
+        "/api/journals/import", content=chunks, headers={**headers, "Content-Type": "application/x-ndjson"},
+    ).json()
+    assert report["errors"] == [{"row": 1, "error": "Line longer than 500 characters"}]
+    assert report["imported"] == 1
+
+
+def test_import_alongside_background_scoring_keeps_the_rollup(fake_sentiment, client, auth_headers, monkeypatch):
+    # Results are applied by hand below, alongside the second import
+    monkeypatch.setattr(sentiment_queue, "feed_pending", lambda user_id: None)
+    monkeypatch.setattr(config, "IMPORT_BATCH_SIZE", 4)
+    headers = auth_headers("import")
+    user_id = uuid.UUID(client.get("/auth/user/profile", headers=headers).json()["data"]["id"])
+    run = uuid.uuid4().hex[:8]
+
+    def ndjson(part: str) -> bytes:
+        # Spread over days and categories, so each batch touches several rollup rows
+        return "".join(
+            json.dumps({"title": f"{part} {i}", "content": f"{part} {run} entry {i}",
+                        "date_of_entry": f"2024-06-{(i * 7) % 12 + 1:02d}T08:00:00",
+                        "journal_category": ("Work", "Personal", "Health")[i % 3]}) + "\n"
+            for i in range(24)
+        ).encode()
+
+    async def chunks(body: bytes):
+        for i in range(0, len(body), 200):
+            yield body[i:i + 200]
+
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            await import_journals(db, user_id, chunks(ndjson("first")), "ndjson")
+            pending = await JournalRepository.pending_sentiment(db, 100, user_id=user_id)
+        results = {journal_id: (content, fake_sentiment.label(content)) for journal_id, content in pending}
+        batches = [dict(list(results.items())[i:i + 5]) for i in range(0, len(results), 5)]
+
+        async def apply(batch):
+            async with AsyncSessionLocal() as db:
+                await JournalRepository.apply_sentiments(db, batch)
+
+        async def second_import():
+            async with AsyncSessionLocal() as db:
+                return await import_journals(db, user_id, chunks(ndjson("second")), "ndjson")
+
+        return await asyncio.gather(second_import(), *(apply(batch) for batch in batches))
+
+    report, *_ = client.portal.call(scenario)
+    assert report["imported"] == 24
+
+    # Every rollup row matches the journals it counts
+    expected = defaultdict(Counter)
+    with SessionLocal() as db:
+        for date_of_entry, category, word_count, sentiment in db.query(
+            Journal.date_of_entry, Journal.journal_category, Journal.word_count, Journal.sentiment,
+        ).filter(Journal.user_id == user_id):
+            counts = expected[date_of_entry.date(), category]
+            counts.update({"entry_count": 1, "word_count": word_count})
+            if sentiment in SENTIMENT_COLUMNS:
+                counts[SENTIMENT_COLUMNS[sentiment]] += 1
+        stats = {
+            (row.day, row.category): Counter({column: getattr(row, column) for column in COUNT_COLUMNS})
+            for row in db.query(JournalDailyStats).filter(JournalDailyStats.user_id == user_id)
+        }
+    assert sum(counts["entry_count"] for counts in expected.values()) == 48
+    assert sum(counts[column] for counts in expected.values() for column in SENTIMENT_COLUMNS.values()) == 24
+    assert stats == expected
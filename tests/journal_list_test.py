@@ -0,0 +1,108 @@
+import base64
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+import jwt
+from fastapi.responses import JSONResponse
+from sqlalchemy import select, update
+from app.database import SessionLocal
+from app.models.model import Journal
+from app.views.journal_schema import JournalListResponse, JournalResponse
+
+
+def test_list_bytes_match_model_encoding(inline_sentiment, client, auth_headers):
+    headers = auth_headers("list")
+    for i, (title, content, date_of_entry) in enumerate([
+        ("Café ☕", 'Quotes " and \\ backslashes\nnew line\ttab', "2025-03-01T10:00:00"),
+        ("Emoji 🎉", "Control \x01 char and </script>", "2025-03-02T10:00:00.123456"),
+        ("Plain", "Nothing special", "2025-03-03T10:00:00.5"),
+    ]):
+        client.post("/api/journals/", headers=headers, json={
+            "title": title, "content": content, "date_of_entry": date_of_entry, "journal_category": "Work",
+        })
+    with SessionLocal() as db:
+        db.execute(update(Journal).filter(Journal.title == "Plain").values(sentiment=None))
+        db.commit()
+
+    response = client.get("/api/journals/", headers=headers, params={"limit": 2})
+    body = response.json()
+
+    # What the endpoint used to send: validated models encoded by FastAPI
+    with SessionLocal() as db:
+        journals = db.execute(
+            select(Journal).filter(Journal.id.in_([uuid.UUID(journal["id"]) for journal in body["data"]]))
+            .order_by(Journal.date_of_entry.desc(), Journal.id.desc())
+        ).scalars().all()
+        expected = JournalListResponse(
+            status="success",
+            message="Journals retrieved successfully",
+            data=[JournalResponse.model_validate(journal) for journal in journals],
+            total=3,
+            next_cursor=body["next_cursor"],
+        )
+    assert response.content == JSONResponse(expected.model_dump(mode="json")).body
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_malformed_cursors_are_rejected(client, auth_headers):
+    headers = auth_headers("badcursor")
+    user_id = jwt.decode(headers["Authorization"].split()[1], options={"verify_signature": False})["sub"]
+    with SessionLocal() as db:
+        db.add(Journal(
+            user_id=uuid.UUID(user_id), title="Only", content="One entry",
+            date_of_entry=datetime(2025, 3, 1, 10), journal_category="Work", sentiment="NEUTRAL",
+        ))
+        db.commit()
+
+    def cursor(value):
+        return base64.urlsafe_b64encode(json.dumps(value).encode()).decode().rstrip("=")
+
+    row_id = str(uuid.uuid4())
+    for bad in ["not base64!", cursor(["2025-03-01T10:00:00", 7]), cursor([20250301, row_id]),
+                cursor({"a": 1, "b": 2}), cursor(["2025-03-01T10:00:00"]), cursor("2025-03-01T10:00:00")]:
+        response = client.get("/api/journals/", headers=headers, params={"cursor": bad})
+        assert response.status_code == 400, bad
+
+    # An aware timestamp is compared as a naive one instead of failing the query
+    aware = datetime(2025, 3, 2, 10, tzinfo=timezone.utc)
+    response = client.get("/api/journals/", headers=headers, params={"cursor": cursor([aware.isoformat(), row_id])})
+    assert response.status_code == 200
+    assert [journal["title"] for journal in response.json()["data"]] == ["Only"]
+
+
+def test_following_next_cursor_visits_every_entry_once(client, auth_headers):
+    headers = auth_headers("paging")
+    user_id = uuid.UUID(jwt.decode(headers["Authorization"].split()[1], options={"verify_signature": False})["sub"])
+    # Pairs share a timestamp, so pages have to break ties on the id
+    start = datetime(2025, 3, 1, 10)
+    journals = [
+        Journal(
+            user_id=user_id, title=f"Entry {i}", content="Paged entry", date_of_entry=start + timedelta(days=i // 2),
+            journal_category="Work" if i % 3 else "Personal", sentiment="NEUTRAL",
+        )
+        for i in range(13)
+    ]
+    with SessionLocal() as db:
+        db.add_all(journals)
+        db.commit()
+        expected = [
+            (str(journal.id), journal.journal_category)
+            for journal in sorted(journals, key=lambda journal: (journal.date_of_entry, journal.id), reverse=True)
+        ]
+
+    def walk(path, limit):
+        seen, cursor = [], None
+        while True:
+            params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+            body = client.get(path, headers=headers, params=params).json()
+            assert len(body["data"]) <= limit
+            seen += [journal["id"] for journal in body["data"]]
+            assert len(seen) <= len(journals), "a page repeated entries"
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return seen
+
+    assert walk("/api/journals/", 3) == [journal_id for journal_id, _ in expected]
+    assert walk("/api/journals/by-category/Work", 2) == [
+        journal_id for journal_id, category in expected if category == "Work"
+    ]
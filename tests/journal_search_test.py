@@ -0,0 +1,40 @@
+import uuid
+
+
+def test_search_ranks_highlights_and_pages(fake_sentiment, client, auth_headers):
+    run = uuid.uuid4().hex[:8]
+    word = f"kayak{run}"
+    headers = {owner: auth_headers(owner) for owner in ("searcher", "other")}
+
+    def create(owner, title, content):
+        return client.post("/api/journals/", headers=headers[owner], json={
+            "title": title, "content": content,
+            "date_of_entry": "2025-03-01T10:00:00", "journal_category": "Travel",
+        }).json()["data"]["id"]
+
+    in_title = create("searcher", f"The {word} trip", f"Paddled out to the island, the {word} held up <fine>.")
+    in_content = create("searcher", "Lake day", f"Borrowed a {word} from a friend.")
+    create("searcher", "Lake day", "Nothing to find here.")
+    create("other", f"Not mine {word}", f"Someone else's {word}.")
+
+    body = client.get("/api/journals/search", headers=headers["searcher"], params={"q": word}).json()
+    assert [hit["id"] for hit in body["data"]] == [in_title, in_content]
+    assert body["data"][0]["rank"] > body["data"][1]["rank"]
+    assert f"<mark>{word}</mark>" in body["data"][1]["snippet"]
+    assert "<fine>" not in body["data"][0]["snippet"]
+    assert body["has_more"] is False
+
+    page = client.get("/api/journals/search", headers=headers["searcher"], params={"q": word, "limit": 1}).json()
+    assert [hit["id"] for hit in page["data"]] == [in_title] and page["has_more"] is True
+
+    # Edits and deletes reach the index
+    client.put(f"/api/journals/{in_content}", headers=headers["searcher"], json={
+        "title": "Lake day", "content": "Swam instead.", "journal_category": "Travel",
+    })
+    client.delete(f"/api/journals/{in_title}", headers=headers["searcher"])
+    body = client.get("/api/journals/search", headers=headers["searcher"], params={"q": word}).json()
+    assert body["data"] == []
+
+    # Query syntax is not passed through
+    response = client.get("/api/journals/search", headers=headers["searcher"], params={"q": 'lake" OR *'})
+    assert response.status_code == 200
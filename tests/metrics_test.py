@@ -0,0 +1,43 @@
+import re
+import uuid
+from app import config
+
+SAMPLE = re.compile(r'^([a-z_]+)(\{.*\})? (\S+)$')
+
+
+def samples(text: str) -> dict:
+    parsed = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, f"Not a Prometheus sample: {line!r}"
+        parsed[match.group(1) + (match.group(2) or "")] = float(match.group(3))
+    return parsed
+
+
+def test_metrics_cover_routes_queries_sentiment_and_passwords(inline_sentiment, client, auth_headers, monkeypatch):
+    monkeypatch.setattr(config, "INTERNAL_TOKEN", "scrape-secret")
+    headers = auth_headers("scraped")
+    journal_id = client.post("/api/journals/", headers=headers, json={
+        "title": "Metrics", "content": f"Counted {uuid.uuid4()}", "date_of_entry": "2025-03-01T10:00:00",
+        "journal_category": "Work",
+    }).json()["data"]["id"]
+    client.get(f"/api/journals/{journal_id}", headers=headers)
+    client.get(f"/no-such-page/{journal_id}")
+
+    assert client.get("/metrics", headers=headers).status_code == 403
+    response = client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    metrics = samples(response.text)
+
+    route = '{method="GET",route="/api/journals/{journal_id}",status="200"}'
+    assert metrics[f"http_request_duration_seconds_count{route}"] >= 1
+    assert metrics['http_request_duration_seconds_count{method="GET",route="unmatched",status="404"}'] >= 1
+    assert metrics['http_request_db_queries_count{route="/api/journals/{journal_id}"}'] >= 1
+    assert metrics['http_request_db_queries_sum{route="/api/journals/{journal_id}"}'] >= 1
+    assert metrics['sentiment_backend_call_seconds_count{backend="comprehend",call="detect"}'] >= 1
+    assert metrics['password_bcrypt_seconds_count{operation="hash"}'] >= 1
+    assert metrics['password_bcrypt_seconds_count{operation="verify"}'] >= 1
+    # Labels never carry ids or raw paths
+    assert journal_id not in response.text and "@example.com" not in response.text
@@ -0,0 +1,39 @@
+import uuid
+from passlib.hash import bcrypt
+from app import config
+from app.cli import set_env_value
+from app.database import SessionLocal
+from app.models.model import User
+from app.utils.passwords import password_needs_update
+
+
+def test_weaker_hashes_need_update():
+    assert password_needs_update(bcrypt.using(rounds=4).hash("password"))
+    assert not password_needs_update(bcrypt.using(rounds=config.PASSWORD_BCRYPT_ROUNDS).hash("password"))
+
+
+def test_login_rehashes_old_hash(client):
+    email = f"rehash-{uuid.uuid4().hex[:8]}@example.com"
+    client.post("/auth/user/register", json={
+        "first_name": "Old", "last_name": "Hash", "email": email, "password": "password123",
+    })
+    with SessionLocal() as db:
+        user = db.query(User).filter(User.email == email).one()
+        user.password = bcrypt.using(rounds=4).hash("password123")
+        db.commit()
+
+    # Background tasks finish before TestClient returns the response
+    assert client.post("/auth/user/login", json={"email": email, "password": "password123"}).status_code == 200
+
+    with SessionLocal() as db:
+        stored = db.query(User.password).filter(User.email == email).scalar()
+    assert bcrypt.from_string(stored).rounds == config.PASSWORD_BCRYPT_ROUNDS
+    assert bcrypt.verify("password123", stored)
+
+
+def test_set_env_value(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("SECRET_KEY=abc\nPASSWORD_BCRYPT_ROUNDS=10\n")
+    set_env_value(str(env_file), "PASSWORD_BCRYPT_ROUNDS", "12")
+    set_env_value(str(env_file), "PASSWORD_WORKERS", "4")
+    assert env_file.read_text() == "SECRET_KEY=abc\nPASSWORD_BCRYPT_ROUNDS=12\nPASSWORD_WORKERS=4\n"
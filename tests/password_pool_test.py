@@ -0,0 +1,31 @@
+import asyncio
+import pytest
+from fastapi import HTTPException
+from app.utils.passwords import PasswordPool
+
+
+@pytest.fixture
+def pool():
+    pool = PasswordPool(workers=1, max_queue=1, retry_after=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_hash_and_verify_in_worker_process(pool):
+    async def run():
+        hashed = await pool.hash("correct horse")
+        return await pool.verify("correct horse", hashed), await pool.verify("wrong", hashed)
+
+    assert asyncio.run(run()) == (True, False)
+
+
+def test_full_queue_fails_fast(pool):
+    async def run():
+        results = await asyncio.gather(*(pool.hash("password") for _ in range(3)), return_exceptions=True)
+        return [result for result in results if isinstance(result, HTTPException)]
+
+    rejected = asyncio.run(run())
+    assert len(rejected) == 1
+    assert rejected[0].status_code == 503
+    assert rejected[0].headers["Retry-After"] == "2"
+    assert pool.stats()["rejected"] == 1 and pool.stats()["in_flight"] == 0
@@ -0,0 +1,89 @@
+from uuid import UUID, uuid4
+import pytest
+from app import config
+from app.database import AsyncSessionLocal
+from app.repository.user_repository import UserRepository
+from app.utils.auth import principal_cache
+from app.utils.cache import TTLCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = Clock()
+    cache = TTLCache(maxsize=10, ttl=60, clock=clock)
+    cache.set("a", 1)
+    clock.now = 59
+    assert cache.get("a") == 1
+    clock.now = 61
+    assert cache.get("a") is None
+    assert cache.stats()["hit_ratio"] == 0.5
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    principal_cache.clear()
+
+
+def test_repeat_requests_are_served_from_the_cache(client, auth_headers):
+    headers = auth_headers("cache")
+    hits = principal_cache.hits
+    assert client.get("/auth/user/profile", headers=headers).json()["data"]["first_name"] == "Cache"
+    assert client.get("/api/journals/", headers=headers).status_code == 200
+    assert principal_cache.hits == hits + 1
+
+
+def test_password_change_drops_the_cached_principal(client, auth_headers):
+    headers = auth_headers("password")
+    user_id = UUID(client.get("/auth/user/profile", headers=headers).json()["data"]["id"])
+    assert principal_cache.get(user_id) is not None
+
+    async def change_password():
+        async with AsyncSessionLocal() as db:
+            await UserRepository.update_password(db, user_id, "new-hash")
+
+    client.portal.call(change_password)
+    assert principal_cache.get(user_id) is None
+
+
+def test_trusted_role_claim_skips_the_lookup(client, auth_headers, monkeypatch):
+    monkeypatch.setattr(config, "AUTH_TRUST_ROLE_CLAIM", True)
+    headers = auth_headers("trusted")
+    assert client.get("/api/journals/", headers=headers).status_code == 200
+    # Built from the token, so nothing was cached
+    assert principal_cache.stats()["size"] == 0
+    assert client.get("/auth/user/profile", headers=headers).json()["data"]["last_name"] == "Test"
+    assert principal_cache.stats()["size"] == 1
+
+
+def test_profile_and_listing_accept_a_stored_invalid_email(client, auth_headers):
+    # Registration takes any string as the email, so the responses must too
+    email = f"not-an-email-{uuid4().hex[:8]}"
+    client.post("/auth/user/register", json={
+        "first_name": "Invalid", "last_name": "Email", "email": email, "password": "password123",
+    })
+    token = client.post("/auth/user/login", json={"email": email, "password": "password123"}).json()["token"]
+    profile = client.get("/auth/user/profile", headers={"Authorization": f"Bearer {token}"})
+    assert profile.status_code == 200
+    assert profile.json()["data"]["email"] == email
+
+    listing = client.get(
+        "/auth/admin/all-users", headers=auth_headers("admin", role="admin"), params={"search": "Invalid"},
+    )
+    assert listing.status_code == 200
@@ -0,0 +1,45 @@
+import logging
+from app import config
+from app.utils.request_metrics import RequestStats, check_queries
+
+# Statements each read may run once the user is cached: the data version check plus its queries
+BUDGETS = {
+    "/api/journals/": 3,  # Page and total
+    "/api/journals/?include_total=false&fields=title,sentiment": 2,
+    "/api/journals/summaries": 2,
+    "/api/journals/word-frequency": 2,
+    "/api/journals/calendar?year=2025": 2,
+    "/api/journals/search?q=budget": 1,
+}
+
+
+def test_read_endpoints_stay_within_query_budget(inline_sentiment, client, auth_headers, max_queries):
+    headers = auth_headers("budget")
+    for day in range(1, 6):
+        client.post("/api/journals/", headers=headers, json={
+            "title": f"Budget {day}", "content": f"A budget entry for day {day}",
+            "date_of_entry": f"2025-03-0{day}T10:00:00", "journal_category": "Work",
+        })
+    client.get("/api/journals/", headers=headers)  # Caches the user
+
+    for path, limit in BUDGETS.items():
+        with max_queries(limit):
+            assert client.get(path, headers=headers).status_code == 200
+
+
+def test_repeated_statements_and_budget_are_logged(monkeypatch, caplog):
+    monkeypatch.setattr(config, "QUERY_BUDGET", 3)
+    stats = RequestStats(record=True)
+    statements = ["SELECT users.id FROM users"] + ["SELECT journals.id FROM journals WHERE journals.user_id = ?"] * 5
+    for statement in statements:
+        stats.queries += 1
+        stats.statements.append(statement)
+
+    with caplog.at_level(logging.WARNING, logger="app.utils.request_metrics"):
+        check_queries({"method": "GET", "path": "/api/admin/all-users"}, stats)
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages[0].startswith("GET /api/admin/all-users ran 6 statements (budget 3")
+    assert messages[1] == (
+        "GET /api/admin/all-users ran the same statement 5 times, likely an N+1: " + statements[-1]
+    )
+    assert len(messages) == 2
@@ -0,0 +1,56 @@
+import uuid
+from datetime import date, datetime
+import pytest
+from sqlalchemy import select
+from app.database import engine
+from app.repository.journal_repository import JournalRepository
+from app.repository.user_repository import UserRepository
+
+USER_ID = uuid.uuid4()
+
+
+@pytest.fixture(scope="module")
+def connection(db_schema):
+    with engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            # Test tables are tiny, so the planner would pick a seq scan whenever it can
+            conn.exec_driver_sql("SET enable_seqscan = off")
+        yield conn
+        conn.rollback()
+
+
+def query_plan(connection, query) -> str:
+    sql = str(query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    if connection.dialect.name == "postgresql":
+        rows = connection.exec_driver_sql("EXPLAIN " + sql).scalars().all()
+    elif connection.dialect.name == "sqlite":
+        rows = [row[-1] for row in connection.exec_driver_sql("EXPLAIN QUERY PLAN " + sql)]
+    else:
+        pytest.skip(f"No query plan check for {connection.dialect.name}")
+    return "\n".join(rows)
+
+
+@pytest.mark.parametrize("criteria, index", [
+    (JournalRepository.for_user(USER_ID), "ix_journals_user_id_date_of_entry"),
+    (JournalRepository.on_date(USER_ID, date(2025, 3, 1)), "ix_journals_user_id_date_of_entry"),
+    (JournalRepository.in_year(USER_ID, 2025), "ix_journals_user_id_date_of_entry"),
+    (JournalRepository.in_category(USER_ID, "Work"), "ix_journals_user_id_category_date_of_entry"),
+])
+def test_journal_lists_use_index(connection, criteria, index):
+    plan = query_plan(connection, JournalRepository.page_query(criteria, 50))
+    assert index in plan, plan
+    assert "Seq Scan" not in plan and "SCAN journals" not in plan, plan
+
+
+def test_keyset_page_uses_index(connection):
+    after = (datetime(2025, 3, 1, 10, 0), uuid.uuid4())
+    query = JournalRepository.page_query(JournalRepository.for_user(USER_ID), 50, after)
+    plan = query_plan(connection, query)
+    assert "ix_journals_user_id_date_of_entry" in plan, plan
+
+
+def test_user_search_uses_name_and_email_indexes(connection):
+    query = select(*UserRepository.LIST_COLUMNS).filter(*UserRepository.search("ann"))
+    plan = query_plan(connection, query)
+    for index in ("ix_users_first_name", "ix_users_last_name", "ix_users_email"):
+        assert index in plan, plan
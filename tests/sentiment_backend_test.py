@@ -0,0 +1,45 @@
+import pytest
+from app.utils.fake_comprehend import FakeComprehend
+from app.utils.sentiment_backends import SENTIMENTS, ComprehendBackend, create_backend
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    return create_backend("lexicon")
+
+
+@pytest.mark.parametrize("text, label", [
+    ("Today was a wonderful day, I feel happy and grateful.", "POSITIVE"),
+    ("I am sad and exhausted, everything went wrong.", "NEGATIVE"),
+    ("I walked to the office and had lunch at noon.", "NEUTRAL"),
+    ("The trip was amazing but the flight home was terrible.", "MIXED"),
+    ("I am not happy with how the meeting went.", "NEGATIVE"),
+    ("It wasn't bad at all.", "POSITIVE"),
+    ("", "NEUTRAL"),
+])
+def test_lexicon_labels(lexicon, text, label):
+    assert lexicon.detect(text) == label
+
+
+def test_lexicon_batch_matches_single_documents(lexicon):
+    texts = [
+        "Not good.",
+        "Good.",
+        "no",
+        "Great food, awful service, lovely view, horrible noise.",
+        "",
+        "Never again.",
+    ]
+    assert lexicon.detect_batch(texts) == [lexicon.detect(text) for text in texts]
+    assert set(lexicon.detect_batch(texts)) <= set(SENTIMENTS)
+
+
+def test_comprehend_backend_keeps_input_order():
+    fake = FakeComprehend(latency=0)
+    texts = ["first", "second", "third"]
+    assert ComprehendBackend(fake).detect_batch(texts) == [fake.label(text) for text in texts]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        create_backend("nope")
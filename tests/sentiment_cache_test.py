@@ -0,0 +1,67 @@
+import uuid
+import pytest
+from app.utils import sentiment
+from app.utils.lexicon_sentiment import LexiconBackend
+from app.utils.sentiment_backends import ComprehendBackend
+from app.utils.sentiment import SentimentCache, content_hash
+
+
+@pytest.fixture
+def comprehend(db_schema, fake_sentiment, monkeypatch):
+    monkeypatch.setattr(sentiment, "sentiment_cache", SentimentCache(maxsize=2))
+    return fake_sentiment
+
+
+def test_content_hash_ignores_whitespace_layout():
+    assert content_hash("A good  day\n") == content_hash(" A good day")
+    assert content_hash("A good day") != content_hash("a good day")
+
+
+def test_repeated_content_is_not_scored_again(comprehend):
+    text = f"Same words every time {uuid.uuid4().hex}"
+    first = sentiment.get_sentiment(text)
+    assert sentiment.get_sentiment(text) == first
+    assert sentiment.get_sentiments([text, text]) == [first, first]
+    assert comprehend.calls == [1]
+    assert sentiment.sentiment_cache.stats()["memory_hits"] == 2
+
+
+def test_batch_sends_each_new_text_once(comprehend):
+    texts = [f"Batch text {i} {uuid.uuid4().hex}" for i in range(3)]
+    results = sentiment.get_sentiments(texts + texts[:1])
+    assert results == [comprehend.label(text) for text in texts + texts[:1]]
+    assert comprehend.calls == [3]
+
+
+def test_table_tier_survives_the_lru(comprehend):
+    texts = [f"Evicted text {i} {uuid.uuid4().hex}" for i in range(3)]
+    for text in texts:
+        sentiment.get_sentiment(text)
+    # texts[0] has been evicted from the two-entry LRU but is still in the table
+    assert sentiment.get_sentiment(texts[0]) == comprehend.label(texts[0])
+    assert comprehend.calls == [1, 1, 1]
+    assert sentiment.sentiment_cache.stats()["table_hits"] == 1
+
+
+def test_switching_backends_does_not_reuse_labels(comprehend, monkeypatch):
+    # The fake labels this NEGATIVE or MIXED, the lexicon reads it as POSITIVE
+    text = next(
+        text for text in (f"What a wonderful happy day {uuid.uuid4().hex}" for _ in range(100))
+        if comprehend.label(text) not in ("POSITIVE", "NEUTRAL")
+    )
+    assert sentiment.get_sentiment(text) == comprehend.label(text)
+
+    lexicon = LexiconBackend()
+    monkeypatch.setattr(sentiment, "get_backend", lambda: lexicon)
+    assert sentiment.get_sentiment(text) == "POSITIVE"
+    assert sentiment.get_sentiments([text]) == ["POSITIVE"]
+    # A new lexicon version does not reuse the old one's results either
+    monkeypatch.setattr(lexicon, "version", lexicon.version + 1)
+    assert sentiment.get_cached_sentiment(text) is None
+
+    # Back on Comprehend, its own result is still cached (memory and table)
+    monkeypatch.setattr(sentiment, "get_backend", lambda: ComprehendBackend(comprehend))
+    assert sentiment.get_sentiment(text) == comprehend.label(text)
+    sentiment.sentiment_cache.entries.clear()
+    assert sentiment.get_sentiment(text) == comprehend.label(text)
+    assert comprehend.calls == [1]
@@ -0,0 +1,164 @@
+import asyncio
+import uuid
+import pytest
+from app import config
+from app.database import AsyncSessionLocal, SessionLocal
+from app.models.model import Journal, JournalDailyStats
+from app.repository.journal_repository import JournalRepository
+from app.services.sentiment_service import sentiment_queue
+from app.utils import sentiment
+from app.utils.fake_comprehend import FakeComprehend
+from app.utils.sentiment_backends import ComprehendBackend
+
+
+@pytest.fixture
+def comprehend(monkeypatch):
+    fake = FakeComprehend(latency=0.01)
+    monkeypatch.setattr(sentiment, "get_backend", lambda: ComprehendBackend(fake))
+    return fake
+
+
+def test_writes_are_scored_in_batches(comprehend, client, auth_headers, scored_journals):
+    headers = auth_headers("queue")
+    contents = {}
+    run = uuid.uuid4().hex  # Fresh texts, so nothing is answered from the sentiment cache
+    for i in range(30):
+        response = client.post("/api/journals/", headers=headers, json={
+            "title": f"Entry {i}",
+            "content": f"Journal entry number {i} of {run}",
+            "date_of_entry": "2025-03-01T10:00:00",
+            "journal_category": "Work",
+        })
+        assert response.json()["data"]["sentiment"] == "PENDING"
+        contents[response.json()["data"]["id"]] = f"Journal entry number {i} of {run}"
+
+    journals = scored_journals(headers)
+
+    for journal in journals:
+        assert journal["sentiment"] == comprehend.label(contents[journal["id"]])
+    assert sum(comprehend.calls) == 30
+    assert max(comprehend.calls) <= 25
+    assert len(comprehend.calls) < 30
+
+
+def test_stale_results_are_not_written_back(comprehend, client, auth_headers, monkeypatch):
+    # Leave every write PENDING, results are applied by hand below
+    monkeypatch.setattr(sentiment_queue, "submit", lambda journal: None)
+    headers = auth_headers("stale")
+    run = uuid.uuid4().hex
+    journals = {}
+    for name in ("edited", "deleted", "kept"):
+        entry = {
+            "title": name, "content": f"The {name} entry of {run}",
+            "date_of_entry": "2025-04-01T10:00:00", "journal_category": "Work",
+        }
+        journals[name] = {**entry, "id": client.post("/api/journals/", headers=headers, json=entry).json()["data"]["id"]}
+        assert client.get(f"/api/journals/{journals[name]['id']}", headers=headers).json()["data"]["sentiment"] == "PENDING"
+
+    # Scored, then edited and deleted before the results come back
+    results = {uuid.UUID(journal["id"]): (journal["content"], "POSITIVE") for journal in journals.values()}
+    edited = journals["edited"]
+    client.put(f"/api/journals/{edited['id']}", headers=headers, json={
+        **{key: value for key, value in edited.items() if key != "id"}, "content": f"Rewritten {run}",
+    })
+    client.delete(f"/api/journals/{journals['deleted']['id']}", headers=headers)
+
+    async def apply():
+        async with AsyncSessionLocal() as db:
+            await JournalRepository.apply_sentiments(db, results)
+
+    client.portal.call(apply)
+
+    with SessionLocal() as db:
+        sentiments = dict(db.query(Journal.title, Journal.sentiment).filter(Journal.content.contains(run)))
+        positive = db.query(JournalDailyStats.positive_count).join(
+            Journal, Journal.user_id == JournalDailyStats.user_id
+        ).filter(Journal.title == "kept", Journal.content.contains(run)).scalar()
+    assert sentiments == {"edited": "PENDING", "kept": "POSITIVE"}
+    assert positive == 1
+
+
+def test_edit_resets_a_result_committed_after_the_load(comprehend, client, auth_headers, monkeypatch):
+    monkeypatch.setattr(sentiment_queue, "submit", lambda journal: None)
+    headers = auth_headers("race")
+    run = uuid.uuid4().hex
+    entry = {
+        "title": "raced", "content": f"The original entry of {run}",
+        "date_of_entry": "2025-05-01T10:00:00", "journal_category": "Work",
+    }
+    journal_id = client.post("/api/journals/", headers=headers, json=entry).json()["data"]["id"]
+
+    # The worker commits the old content's label while the edit is being made
+    async def score_or_defer(text):
+        async with AsyncSessionLocal() as db:
+            await JournalRepository.apply_sentiments(db, {uuid.UUID(journal_id): (entry["content"], "POSITIVE")})
+        return "PENDING"
+
+    monkeypatch.setattr(sentiment_queue, "score_or_defer", score_or_defer)
+    response = client.put(f"/api/journals/{journal_id}", headers=headers, json={**entry, "content": f"Rewritten {run}"})
+    assert response.json()["sentiment"] == "PENDING"
+
+    with SessionLocal() as db:
+        assert db.query(Journal.sentiment).filter(Journal.id == uuid.UUID(journal_id)).scalar() == "PENDING"
+
+
+def test_texts_the_backend_could_not_score_stay_pending(comprehend, client, auth_headers, monkeypatch):
+    monkeypatch.setattr(sentiment_queue, "submit", lambda journal: None)
+    batch_detect_sentiment = comprehend.batch_detect_sentiment
+
+    def batch_with_errors(TextList, LanguageCode):
+        # Comprehend reports a document it could not score in ErrorList, not ResultList
+        response = batch_detect_sentiment(TextList, LanguageCode)
+        failed = {index for index, text in enumerate(TextList) if "unscorable" in text}
+        return {
+            "ResultList": [result for result in response["ResultList"] if result["Index"] not in failed],
+            "ErrorList": [{"Index": index, "ErrorCode": "INTERNAL_SERVER_ERROR"} for index in sorted(failed)],
+        }
+
+    monkeypatch.setattr(comprehend, "batch_detect_sentiment", batch_with_errors)
+    headers = auth_headers("errors")
+    run = uuid.uuid4().hex
+    batch = []
+    for name in ("scored", "unscorable"):
+        content = f"The {name} entry of {run}"
+        journal_id = client.post("/api/journals/", headers=headers, json={
+            "title": name, "content": content, "date_of_entry": "2025-06-01T10:00:00", "journal_category": "Work",
+        }).json()["data"]["id"]
+        batch.append((uuid.UUID(journal_id), content))
+
+    client.portal.call(sentiment_queue.process, batch)
+
+    with SessionLocal() as db:
+        sentiments = dict(db.query(Journal.title, Journal.sentiment).filter(Journal.content.contains(run)))
+    assert sentiments == {"scored": comprehend.label(batch[0][1]), "unscorable": "PENDING"}
+
+
+def test_edit_with_the_pipeline_stopped_leaves_a_pending_journal_alone(comprehend, client, auth_headers):
+    headers = auth_headers("stopped")
+    client.portal.call(sentiment_queue.stop)
+    entry = {
+        "title": "waiting", "content": f"The waiting entry of {uuid.uuid4().hex}",
+        "date_of_entry": "2025-07-01T10:00:00", "journal_category": "Work",
+    }
+    journal_id = client.post("/api/journals/", headers=headers, json=entry).json()["data"]["id"]
+    # Left PENDING by an earlier run, or by an import
+    with SessionLocal() as db:
+        db.query(Journal).filter(Journal.id == uuid.UUID(journal_id)).update({"sentiment": "PENDING"})
+        db.commit()
+
+    response = client.put(f"/api/journals/{journal_id}", headers=headers, json={**entry, "title": "renamed"})
+    assert response.status_code == 200
+    assert response.json()["title"] == "renamed"
+
+
+def test_failed_start_leaves_nothing_running(monkeypatch):
+    monkeypatch.setattr(config, "SENTIMENT_ASYNC", True)
+
+    async def requeue_pending():
+        raise RuntimeError("database is locked")
+
+    monkeypatch.setattr(sentiment_queue, "requeue_pending", requeue_pending)
+    with pytest.raises(RuntimeError):
+        asyncio.run(sentiment_queue.start())
+    # So the next lifespan starts afresh instead of reusing tasks from a closed loop
+    assert not sentiment_queue.running
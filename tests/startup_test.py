@@ -0,0 +1,37 @@
+import json
+import os
+import subprocess
+import sys
+
+# Generous enough for a loaded CI machine, small enough to catch an eager heavy import
+IMPORT_BUDGET_SECONDS = float(os.getenv("STARTUP_IMPORT_BUDGET", 3.0))
+
+# Loaded on first use only, importing the app must not pull them in
+LAZY_MODULES = ["boto3", "botocore", "passlib", "bcrypt", "numpy"]
+
+SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+print(json.dumps({"seconds": time.perf_counter() - started, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_app():
+    result = subprocess.run(
+        [sys.executable, "-c", SNIPPET],
+        capture_output=True, text=True, check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_modules():
+    loaded = set(import_app()["modules"])
+    assert [name for name in LAZY_MODULES if name in loaded] == []
+
+
+def test_import_time_within_budget():
+    # Best of three, so one slow run on a busy machine does not fail the build
+    best = min(import_app()["seconds"] for _ in range(3))
+    assert best < IMPORT_BUDGET_SECONDS, f"import app.main took {best:.2f}s"